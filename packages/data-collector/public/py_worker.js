@@ -96,6 +96,16 @@ function createAsyncFileReader(file) {
       const blob = file.slice(start, end);
       return fileReaderSync.readAsArrayBuffer(blob);
     },
+    readSlices: (...bounds) => {
+      // Vectored read: bounds is a flat list start0, end0, start1, end1, ...
+      // The slices are concatenated into one Blob so several ranges
+      // cost a single FileReaderSync round-trip.
+      const parts = [];
+      for (let i = 0; i < bounds.length; i += 2) {
+        parts.push(file.slice(bounds[i], bounds[i + 1]));
+      }
+      return fileReaderSync.readAsArrayBuffer(new Blob(parts));
+    },
     size: file.size,
     name: file.name,
   };
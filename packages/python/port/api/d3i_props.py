@@ -6,6 +6,7 @@ import pandas as pd
 
 import port.api.props as props
 
+
 @dataclass
 class PropsUIPromptConsentFormTableViz:
     """
@@ -56,8 +57,15 @@ class PropsUIPromptConsentFormTableViz:
     delete_option: Optional[bool] = True
 
     def translate_data_frame(self):
+        """
+        Serialize the table to JSON.
+
+        datetime64 columns are formatted as ISO 8601 strings by
+        props.data_frame_to_json, so extractors can keep timestamps native
+        until the table is shown. Every row of this table is serialized.
+        """
         if isinstance(self.data_frame, pd.DataFrame):
-            return self.data_frame.to_json()
+            return props.data_frame_to_json(self.data_frame)
         else:
             return self.data_frame
 
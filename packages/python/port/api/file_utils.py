@@ -4,30 +4,279 @@ File utilities for handling browser File API with synchronous Python I/O.
 This module provides adapters to bridge async browser File APIs with
 synchronous Python file operations, avoiding the need to copy entire
 files into Pyodide's virtual filesystem.
+
+It also ships LocalFileReader, LocalRawInflater and LocalJsonHost,
+desktop stand-ins for the worker's JS file reader, raw-deflate inflater
+and JSON object, so the adapter and the JS decompression and JSON
+backends can be exercised and benchmarked outside the browser.
 """
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+import io
+import json
+import logging
+import mmap
+import struct
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# Block cache defaults. zipfile issues many tiny reads (30-byte local
+# headers, 4 KiB compressed chunks); each uncached read is a separate
+# FileReaderSync round-trip through the FFI, so reads are served from
+# aligned blocks held in Python memory instead.
+DEFAULT_BLOCK_SIZE = 64 * 1024  # 64 KiB
+DEFAULT_CACHE_BYTES = 8 * 1024 * 1024  # 8 MiB
+DEFAULT_MAX_READAHEAD = 1024 * 1024  # 1 MiB
+
+# Tail prefetch: the last TAIL_PREFETCH_BYTES of an upload (ZIP EOCD,
+# ZIP64 locator and usually the central directory) are fetched in one
+# slice and pinned outside the LRU cache. When the central directory
+# starts earlier, the pin is extended to cover it up to MAX_PINNED_BYTES.
+TAIL_PREFETCH_BYTES = 64 * 1024  # 64 KiB
+MAX_PINNED_BYTES = 8 * 1024 * 1024  # 8 MiB
+
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_SIZE = 22
+_EOCD64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_EOCD64_LOCATOR_SIZE = 20
+_EOCD64_SIGNATURE = b"PK\x06\x06"
+_EOCD64_SIZE = 56
+
+
+def _copy_into(js_buffer, dest: memoryview) -> None:
+    """Copy a JS ArrayBuffer proxy into a preallocated Python buffer.
+
+    Pyodide buffer proxies expose assign_to(), which writes straight
+    into `dest` without an intermediate Python object. Readers that
+    only offer to_py() (test fakes) fall back to a slice assignment.
+    """
+    if hasattr(js_buffer, "assign_to"):
+        js_buffer.assign_to(dest)
+    else:
+        dest[:] = js_buffer.to_py()
+
+
+def _coalesce(runs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or adjacent inclusive (first, last) block runs."""
+    merged: list[tuple[int, int]] = []
+    for first, last in sorted(runs):
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    return merged
+
+
+def _zip_directory_start(tail: memoryview, tail_start: int) -> int | None:
+    """Locate the central directory from the end of a ZIP archive.
+
+    Args:
+        tail: The last bytes of the file.
+        tail_start: Absolute offset of tail[0] in the file.
+
+    Returns:
+        int | None: Absolute offset of the first central directory
+            entry, or None if no end-of-central-directory record is
+            found in the tail. Computed back from the EOCD (or ZIP64
+            EOCD) position, so archives with prepended data work too.
+    """
+    # The EOCD record is followed by a comment of at most 64 KiB.
+    window = bytes(tail[-(_EOCD_SIZE + 0xFFFF):])
+    base = len(tail) - len(window)
+    pos = window.rfind(_EOCD_SIGNATURE)
+    if pos < 0 or pos + _EOCD_SIZE > len(window):
+        return None
+    pos += base
+
+    (cd_size,) = struct.unpack_from("<I", tail, pos + 12)
+    record_pos = pos
+
+    # ZIP64 archives place their own end record (and a locator) between
+    # the central directory and the EOCD; its sizes take precedence.
+    locator = pos - _EOCD64_LOCATOR_SIZE
+    if locator >= 0 and tail[locator:locator + 4] == _EOCD64_LOCATOR_SIGNATURE:
+        record_pos = locator - _EOCD64_SIZE
+        if record_pos < 0 or tail[record_pos:record_pos + 4] != _EOCD64_SIGNATURE:
+            return None
+        (cd_size,) = struct.unpack_from("<Q", tail, record_pos + 40)
+    elif cd_size == 0xFFFFFFFF:
+        return None
+
+    return tail_start + record_pos - cd_size
 
-import js
 
+@dataclass
+class IOStats:
+    """
+    Counters for the traffic between an AsyncFileAdapter and its JS reader.
+
+    PII-free by construction: only counts, sizes and timings are kept,
+    never offsets tied to member names or file content.
 
-class AsyncFileAdapter:
+    Attributes:
+        calls (int): readSlice/readSlices round-trips.
+        bytes_read (int): Bytes transferred from JS.
+        bytes_reread (int): Bytes transferred that had been transferred
+            before (block granularity).
+        backward_seeks (int): seek() calls that moved the position back.
+        js_seconds (float): Wall time spent blocked in JS calls.
+    """
+    calls: int = 0
+    bytes_read: int = 0
+    bytes_reread: int = 0
+    backward_seeks: int = 0
+    js_seconds: float = 0.0
+
+    def __sub__(self, other: "IOStats") -> "IOStats":
+        return IOStats(**{f.name: getattr(self, f.name) - getattr(other, f.name) for f in fields(self)})
+
+    def copy(self) -> "IOStats":
+        return IOStats(**{f.name: getattr(self, f.name) for f in fields(self)})
+
+    def summary(self, file_size: int) -> str:
+        """
+        One-line summary for host milestones.
+
+        Amplification is bytes transferred divided by the file size: 1.0x
+        means the upload crossed the JS boundary exactly once.
+
+        Examples::
+
+            >>> stats.summary(133_000_000)
+            "18234 calls, 412.0 MB read, 3.1x amplification, 280.5 MB re-read, 9120 backward seeks, 41.2s in JS"
+        """
+        amplification = self.bytes_read / file_size if file_size else 0.0
+        return (
+            f"{self.calls} calls, {self.bytes_read / 1e6:.1f} MB read, "
+            f"{amplification:.1f}x amplification, {self.bytes_reread / 1e6:.1f} MB re-read, "
+            f"{self.backward_seeks} backward seeks, {self.js_seconds:.1f}s in JS"
+        )
+
+
+def _to_bytes(js_buffer) -> bytes:
+    """Convert a JS ArrayBuffer proxy to bytes with a single copy."""
+    if hasattr(js_buffer, "to_bytes"):
+        return js_buffer.to_bytes()
+    return bytes(js_buffer.to_py())
+
+
+class AsyncFileAdapter(io.RawIOBase):
     """
     A file-like object that reads from browser File API on-demand.
 
     This adapter wraps a JavaScript file reader object and provides
-    a synchronous file-like interface for Python code. Data is read
-    in chunks only when needed, avoiding memory copies.
+    a synchronous, unbuffered binary stream (io.RawIOBase) for Python
+    code. Data is read in chunks only when needed, avoiding memory
+    copies: readinto() writes straight into a caller-supplied buffer,
+    so io.BufferedReader or zipfile can reuse one allocation instead
+    of creating a new bytes object per slice.
+
+    Reads are served from an LRU cache of aligned blocks. A cache miss
+    fetches the missing blocks in a single readSlice call, extended by
+    a read-ahead window that doubles on every sequential read (up to
+    max_readahead) and resets on a random access. Reads larger than
+    half the cache budget bypass the cache entirely.
+
+    With tail_prefetch, the end of the file (ZIP end-of-central-directory
+    records and, where it fits, the whole central directory) is fetched
+    up front and pinned, so every zipfile.ZipFile construction on the
+    adapter parses the directory from memory. See pin_tail().
 
     Args:
         js_reader: JavaScript file reader object with readSlice, size, and name
+            (and optionally readSlices for vectored reads, see read_ranges)
+        block_size: Cache block size in bytes.
+        cache_bytes: Byte budget for cached blocks. 0 disables the cache.
+        max_readahead: Upper bound in bytes for the adaptive read-ahead.
+        tail_prefetch: Bytes to pin from the end of the file at
+            construction. 0 (the default) pins nothing.
+        max_pinned: Upper bound for the pinned region after extending
+            it to the start of the central directory.
+
+    Attributes:
+        io_stats (IOStats): Running counters of JS traffic for this upload.
     """
 
-    def __init__(self, js_reader):
+    def __init__(
+        self,
+        js_reader,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+        max_readahead: int = DEFAULT_MAX_READAHEAD,
+        tail_prefetch: int = 0,
+        max_pinned: int = MAX_PINNED_BYTES,
+    ):
+        super().__init__()
         # Store the JS reader object directly (via Pyodide FFI)
         self.reader = js_reader
         self.position = 0
         self.size = self.reader.size
         self.name = self.reader.name
-        self._closed = False
+
+        self.block_size = block_size
+        self.cache_bytes = cache_bytes
+        self._max_readahead_blocks = max(0, max_readahead // block_size)
+        self._blocks: OrderedDict[int, memoryview] = OrderedDict()
+        self._cached_bytes = 0
+        self._readahead_blocks = 0
+        self._last_read_end = -1
+
+        self.io_stats = IOStats()
+        # One flag per block that has crossed the JS boundary, for bytes_reread.
+        self._seen = bytearray(-(-self.size // block_size))
+
+        self._pinned = memoryview(b"")
+        self._pinned_start = self.size
+        if tail_prefetch > 0:
+            self.pin_tail(tail_prefetch, max_pinned)
+
+    def pin_tail(self, nbytes: int, max_pinned: int = MAX_PINNED_BYTES) -> None:
+        """
+        Fetch and pin the end of the file.
+
+        The last nbytes are read in one slice. If they contain a ZIP
+        end-of-central-directory record and the central directory starts
+        before them, the pin is extended back to the directory start with
+        one more slice, provided the whole region stays within max_pinned.
+        Reads that start inside the pinned region never reach JS.
+
+        A failed fetch is logged and leaves the adapter unpinned; reads
+        then go through the regular cache.
+        """
+        self._checkClosed()
+        tail_start = max(0, self.size - nbytes)
+        if tail_start >= self._pinned_start:
+            return
+        try:
+            tail = memoryview(bytearray(self.size - tail_start))
+            self._slice_into(tail_start, self.size, tail)
+
+            cd_start = _zip_directory_start(tail, tail_start)
+            if (
+                cd_start is not None
+                and 0 <= cd_start < tail_start
+                and self.size - cd_start <= max_pinned
+            ):
+                region = memoryview(bytearray(self.size - cd_start))
+                head = tail_start - cd_start
+                self._slice_into(cd_start, tail_start, region[:head])
+                region[head:] = tail
+                tail, tail_start = region, cd_start
+        except Exception as e:
+            logger.debug("Tail prefetch failed: %s", type(e).__name__)
+            return
+
+        self._pinned = tail.toreadonly()
+        self._pinned_start = tail_start
+
+    def _pinned_view(self, start: int, size: int) -> memoryview | None:
+        """View of [start, start + size) if it lies in the pinned tail."""
+        if start < self._pinned_start:
+            return None
+        offset = start - self._pinned_start
+        return self._pinned[offset:offset + size]
 
     def read(self, size=-1):
         """
@@ -49,27 +298,266 @@ class AsyncFileAdapter:
             reads at its own discretion) or call read(size=N) with a
             bounded N. See extraction/AD0007.
         """
-        if self._closed:
-            raise ValueError("I/O operation on closed file")
-
-        if size == -1:
-            size = self.size - self.position
-
+        self._checkClosed()
+        size = self._clamp(size)
         if size <= 0:
             return b""
 
+        start = self.position
+        pinned = self._pinned_view(start, size)
+        if pinned is not None:
+            result = bytes(pinned)
+        elif self._bypasses_cache(size):
+            result = self._slice_bytes(start, start + size)
+        else:
+            result = b"".join(self._cached_pieces(start, size))
+
+        self._advance(len(result))
+        return result
+
+    def readall(self):
+        """Read until EOF. Subject to the same caveat as read(-1)."""
+        return self.read(-1)
+
+    def readinto(self, b):
+        """
+        Read up to len(b) bytes into a writable buffer.
+
+        Args:
+            b: A writable bytes-like object (bytearray, memoryview, ...).
+
+        Returns:
+            int: The number of bytes written into b; 0 at EOF.
+        """
+        self._checkClosed()
+        with memoryview(b) as view, view.cast("B") as dest:
+            size = self._clamp(len(dest))
+            if size <= 0:
+                return 0
+
+            start = self.position
+            pinned = self._pinned_view(start, size)
+            if pinned is not None:
+                dest[:size] = pinned
+            elif self._bypasses_cache(size):
+                self._slice_into(start, start + size, dest[:size])
+            else:
+                offset = 0
+                for piece in self._cached_pieces(start, size):
+                    dest[offset:offset + len(piece)] = piece
+                    offset += len(piece)
+
+        self._advance(size)
+        return size
+
+    def _clamp(self, size: int) -> int:
+        """Translate a requested size into the number of bytes available."""
+        remaining = self.size - self.position
+        if size is None or size < 0:
+            return remaining
         # Ensure we don't read past the end
-        size = min(size, self.size - self.position)
+        return min(size, remaining)
 
-        # Call the synchronous JS function (uses FileReaderSync in worker)
-        chunk_data = self.reader.readSlice(self.position, self.position + size)
+    def _bypasses_cache(self, size: int) -> bool:
+        return self.cache_bytes <= 0 or size > self.cache_bytes // 2
+
+    def _advance(self, n: int) -> None:
+        self.position += n
+        self._last_read_end = self.position
+
+    def read_ranges(self, ranges):
+        """
+        Read several byte ranges with as few JS round-trips as possible.
+
+        Ranges that are not already cached are fetched together in one
+        readSlices call when the JS reader provides it, and with one
+        readSlice call per contiguous span otherwise. Small ranges are
+        fetched as whole blocks and admitted to the cache, so a later
+        read() of the same bytes (e.g. by zipfile) is served from memory.
+        The stream position is not changed.
+
+        Args:
+            ranges: Iterable of (offset, length) pairs.
+
+        Returns:
+            list[bytes]: The data for each range, in the order given.
+                Ranges are clamped to the end of the file.
+        """
+        self._checkClosed()
+        bounded = []
+        for offset, length in ranges:
+            start = max(0, min(offset, self.size))
+            bounded.append((start, max(0, min(length, self.size - start))))
+
+        bs = self.block_size
+        block_runs: list[tuple[int, int]] = []
+        direct_spans: list[tuple[int, int]] = []
+        for start, size in bounded:
+            if size == 0 or start >= self._pinned_start:
+                continue
+            if self._bypasses_cache(size):
+                direct_spans.append((start, start + size))
+            else:
+                block_runs.extend(self._missing_runs(start // bs, (start + size - 1) // bs))
+
+        runs = _coalesce(block_runs)
+        spans = [(first * bs, min((last + 1) * bs, self.size)) for first, last in runs]
+        buffers = self._fetch_spans(spans + direct_spans)
+        fetched = self._split_runs(runs, buffers[:len(runs)])
+        direct = dict(zip(direct_spans, buffers[len(runs):]))
+
+        results = []
+        for start, size in bounded:
+            if size == 0:
+                results.append(b"")
+            elif start >= self._pinned_start:
+                results.append(bytes(self._pinned_view(start, size)))
+            elif (start, start + size) in direct:
+                results.append(bytes(direct[(start, start + size)]))
+            else:
+                results.append(b"".join(self._pieces(start, size, fetched)))
+
+        self._admit(fetched)
+        return results
+
+    def _missing_runs(self, first: int, last: int) -> list[tuple[int, int]]:
+        """Group uncached blocks in [first, last] into contiguous runs."""
+        runs: list[list[int]] = []
+        for idx in range(first, last + 1):
+            if idx in self._blocks:
+                continue
+            if runs and runs[-1][1] == idx - 1:
+                runs[-1][1] = idx
+            else:
+                runs.append([idx, idx])
+        return [(a, b) for a, b in runs]
+
+    def _fetch_spans(self, spans: list[tuple[int, int]]) -> list[memoryview]:
+        """Fetch [start, end) spans from JS, vectored when supported."""
+        if not spans:
+            return []
+        total = sum(end - start for start, end in spans)
+        # One allocation for the whole fetch; callers get views into it.
+        buf = memoryview(bytearray(total))
+        if len(spans) > 1 and hasattr(self.reader, "readSlices"):
+            self._slices_into(spans, buf)
+        else:
+            offset = 0
+            for start, end in spans:
+                self._slice_into(start, end, buf[offset:offset + end - start])
+                offset += end - start
 
-        # Convert to Python bytes
-        result = bytes(chunk_data.to_py())
-        self.position += len(result)
+        buf = buf.toreadonly()
+        views = []
+        offset = 0
+        for start, end in spans:
+            views.append(buf[offset:offset + end - start])
+            offset += end - start
+        return views
 
+    def _slice_into(self, start: int, end: int, dest: memoryview) -> None:
+        """One readSlice call, copied into dest."""
+        t0 = time.perf_counter()
+        # Call the synchronous JS function (uses FileReaderSync in worker)
+        _copy_into(self.reader.readSlice(start, end), dest)
+        self._account([(start, end)], time.perf_counter() - t0)
+
+    def _slice_bytes(self, start: int, end: int) -> bytes:
+        """One readSlice call, returned as bytes."""
+        t0 = time.perf_counter()
+        result = _to_bytes(self.reader.readSlice(start, end))
+        self._account([(start, end)], time.perf_counter() - t0)
         return result
 
+    def _slices_into(self, spans: list[tuple[int, int]], dest: memoryview) -> None:
+        """One vectored readSlices call, copied into dest."""
+        t0 = time.perf_counter()
+        bounds = [bound for span in spans for bound in span]
+        _copy_into(self.reader.readSlices(*bounds), dest)
+        self._account(spans, time.perf_counter() - t0)
+
+    def _account(self, spans: list[tuple[int, int]], seconds: float) -> None:
+        """Record one JS round-trip covering spans in io_stats."""
+        stats = self.io_stats
+        stats.calls += 1
+        stats.js_seconds += seconds
+        bs = self.block_size
+        for start, end in spans:
+            if end <= start:
+                continue
+            stats.bytes_read += end - start
+            for idx in range(start // bs, (end - 1) // bs + 1):
+                if self._seen[idx]:
+                    stats.bytes_reread += min(end, (idx + 1) * bs) - max(start, idx * bs)
+                else:
+                    self._seen[idx] = 1
+
+    def _split_runs(self, runs, buffers) -> dict[int, memoryview]:
+        """Cut fetched run buffers into per-block views."""
+        bs = self.block_size
+        fetched: dict[int, memoryview] = {}
+        for (run_first, run_last), buf in zip(runs, buffers):
+            for idx in range(run_first, run_last + 1):
+                offset = (idx - run_first) * bs
+                fetched[idx] = buf[offset:offset + bs]
+        return fetched
+
+    def _pieces(self, start: int, size: int, fetched: dict[int, memoryview]) -> list[memoryview]:
+        """Views covering [start, start + size) from fetched or cached blocks."""
+        bs = self.block_size
+        pieces = []
+        for idx in range(start // bs, (start + size - 1) // bs + 1):
+            block = fetched.get(idx)
+            if block is None:
+                block = self._blocks[idx]
+                self._blocks.move_to_end(idx)
+            lo = max(start, idx * bs) - idx * bs
+            hi = min(start + size, (idx + 1) * bs) - idx * bs
+            pieces.append(block[lo:hi])
+        return pieces
+
+    def _admit(self, fetched: dict[int, memoryview]) -> None:
+        """Add fetched blocks to the cache and evict down to the budget."""
+        for idx, block in fetched.items():
+            self._blocks[idx] = block
+            self._cached_bytes += len(block)
+        while self._cached_bytes > self.cache_bytes and self._blocks:
+            _, evicted = self._blocks.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+    def _cached_pieces(self, start: int, size: int) -> list[memoryview]:
+        """Return views covering [start, start + size), fetching misses."""
+        bs = self.block_size
+        first = start // bs
+        last = (start + size - 1) // bs
+        last_block = (self.size - 1) // bs
+
+        # Grow the read-ahead window while the caller scans forward;
+        # any jump resets it so random access doesn't over-fetch.
+        if start == self._last_read_end:
+            self._readahead_blocks = min(
+                max(1, self._readahead_blocks * 2), self._max_readahead_blocks
+            )
+        else:
+            self._readahead_blocks = 0
+
+        runs = self._missing_runs(first, last)
+
+        # Extend the run that ends at the last requested block forward.
+        if runs and runs[-1][1] == last:
+            end = last
+            limit = min(last + self._readahead_blocks, last_block)
+            while end < limit and (end + 1) not in self._blocks:
+                end += 1
+            runs[-1] = (runs[-1][0], end)
+
+        # Separate runs are fetched in one vectored call where possible.
+        spans = [(a * bs, min((b + 1) * bs, self.size)) for a, b in runs]
+        fetched = self._split_runs(runs, self._fetch_spans(spans))
+        pieces = self._pieces(start, size, fetched)
+        self._admit(fetched)
+        return pieces
+
     def seek(self, offset, whence=0):
         """
         Change stream position.
@@ -84,8 +572,7 @@ class AsyncFileAdapter:
         Returns:
             int: The new absolute position
         """
-        if self._closed:
-            raise ValueError("I/O operation on closed file")
+        self._checkClosed()
 
         if whence == 0:  # absolute position
             new_pos = offset
@@ -97,38 +584,258 @@ class AsyncFileAdapter:
             raise ValueError(f"Invalid whence value: {whence}")
 
         # Clamp to valid range
-        self.position = max(0, min(new_pos, self.size))
+        new_pos = max(0, min(new_pos, self.size))
+        if new_pos < self.position:
+            self.io_stats.backward_seeks += 1
+        self.position = new_pos
         return self.position
 
     def tell(self):
         """Return current stream position."""
-        if self._closed:
-            raise ValueError("I/O operation on closed file")
+        self._checkClosed()
         return self.position
 
     def close(self):
         """Close the file and clean up resources."""
-        if not self._closed:
-            self._closed = True
+        if not self.closed:
+            self._blocks.clear()
+            self._cached_bytes = 0
+            self._pinned = memoryview(b"")
+            self._pinned_start = self.size
             # JS object cleanup is handled by Pyodide's garbage collection
-
-    def __enter__(self):
-        """Support for context manager protocol."""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Support for context manager protocol."""
-        self.close()
-        return False
+        super().close()
 
     def readable(self):
         """Return whether the file is readable."""
-        return not self._closed
+        return not self.closed
 
     def seekable(self):
         """Return whether the file supports seeking."""
-        return not self._closed
+        return not self.closed
 
     def writable(self):
         """Return whether the file is writable (always False)."""
         return False
+
+
+class _LocalSlice:
+    """A slice returned by LocalFileReader, mimicking Pyodide's ArrayBuffer proxy."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def to_py(self) -> memoryview:
+        return memoryview(self._data)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._data)
+
+    def assign_to(self, dest) -> None:
+        if len(dest) != len(self._data):
+            raise ValueError("Destination buffer size does not match slice")
+        dest[:] = self._data
+
+
+class LocalFileReader:
+    """
+    Desktop stand-in for the worker's JS file reader.
+
+    Implements the contract of createAsyncFileReader() in py_worker.js
+    (readSlice, readSlices, size, name) over an mmap of a local file, so
+    AsyncFileAdapter, validate_zip and extractors can run on Linux with
+    the same I/O pattern as in the browser. Each call can be charged a
+    simulated FFI latency and per-byte transfer cost, and counters record
+    the traffic. Like FileReaderSync, every call returns a fresh copy of
+    the requested bytes.
+
+    Args:
+        path: Path to a local file.
+        latency: Seconds slept per readSlice/readSlices call.
+        per_byte: Seconds slept per byte transferred.
+        vectored: Whether to offer readSlices. False reproduces readers
+            that only have readSlice.
+
+    Attributes:
+        calls (int): Number of readSlice/readSlices calls.
+        bytes_read (int): Total bytes returned.
+        seeks (int): Reads that did not start where the previous one ended.
+
+    Examples::
+
+        >>> with LocalFileReader("export.zip", latency=0.0005) as js_reader:
+        ...     validate_zip(DDP_CATEGORIES, AsyncFileAdapter(js_reader))
+        ...     print(js_reader.calls, js_reader.bytes_read, js_reader.seeks)
+    """
+
+    def __init__(self, path: str, latency: float = 0.0, per_byte: float = 0.0, vectored: bool = True):
+        self.name = str(path).rsplit("/", 1)[-1]
+        self.latency = latency
+        self.per_byte = per_byte
+        self.calls = 0
+        self.bytes_read = 0
+        self.seeks = 0
+        self._last_end = 0
+
+        with open(path, "rb") as f:
+            self.size = f.seek(0, io.SEEK_END)
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+
+        # Readers without readSlices make AsyncFileAdapter fall back to
+        # one readSlice per range, so the method is only exposed on request.
+        if vectored:
+            self.readSlices = self._read_slices
+
+    def readSlice(self, start: int, end: int) -> _LocalSlice:
+        """Return bytes [start, end) like Blob.slice + FileReaderSync."""
+        data = self._slice(start, end)
+        self._charge(len(data))
+        return _LocalSlice(data)
+
+    def _read_slices(self, *bounds: int) -> _LocalSlice:
+        """readSlices: the concatenation of [start, end) pairs in one call."""
+        data = b"".join(self._slice(start, end) for start, end in zip(bounds[::2], bounds[1::2]))
+        self._charge(len(data))
+        return _LocalSlice(data)
+
+    def reset_counters(self) -> None:
+        """Zero the call, byte and seek counters."""
+        self.calls = 0
+        self.bytes_read = 0
+        self.seeks = 0
+
+    def _slice(self, start: int, end: int) -> bytes:
+        start = max(0, min(start, self.size))
+        end = max(start, min(end, self.size))
+        if start != self._last_end:
+            self.seeks += 1
+        self._last_end = end
+        if self._mmap is None:
+            return b""
+        return self._mmap[start:end]
+
+    def _charge(self, nbytes: int) -> None:
+        self.calls += 1
+        self.bytes_read += nbytes
+        delay = self.latency + self.per_byte * nbytes
+        if delay > 0:
+            time.sleep(delay)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class LocalRawInflater:
+    """
+    Desktop implementation of the JS inflater contract.
+
+    Implements the contract JsInflater relies on (push(chunk) and
+    finish(), each returning the output produced so far as an
+    ArrayBuffer-like proxy) on top of zlib, so the JS decompression
+    backend can be conformance-tested against ZlibInflater and
+    benchmarked on Linux. Each call can be charged a simulated FFI
+    latency and per-byte transfer cost.
+
+    Args:
+        latency: Seconds slept per push/finish call.
+        per_byte: Seconds slept per byte crossing the bridge (in + out).
+
+    Attributes:
+        calls (int): Number of push/finish calls.
+        bytes_in (int): Compressed bytes pushed.
+        bytes_out (int): Inflated bytes returned.
+
+    Examples::
+
+        >>> reader = ZipArchiveReader(
+        ...     path, members, errors,
+        ...     decompressor=lambda: JsInflater(LocalRawInflater(latency=0.0002)),
+        ... )
+    """
+
+    def __init__(self, latency: float = 0.0, per_byte: float = 0.0):
+        self.latency = latency
+        self.per_byte = per_byte
+        self.calls = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+
+    def push(self, chunk) -> _LocalSlice:
+        """Inflate the next compressed chunk."""
+        data = bytes(chunk)
+        return self._charge(len(data), self._inflater.decompress(data))
+
+    def finish(self) -> _LocalSlice:
+        """Return the remaining output at the end of the input."""
+        return self._charge(0, self._inflater.flush())
+
+    def _charge(self, nbytes_in: int, out: bytes) -> _LocalSlice:
+        self.calls += 1
+        self.bytes_in += nbytes_in
+        self.bytes_out += len(out)
+        delay = self.latency + self.per_byte * (nbytes_in + len(out))
+        if delay > 0:
+            time.sleep(delay)
+        return _LocalSlice(out)
+
+
+class _LocalJsValue:
+    """A parsed value returned by LocalJsonHost, mimicking a JsProxy."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def to_py(self):
+        return self._value
+
+
+class LocalJsonHost:
+    """
+    Desktop stand-in for the worker's global JSON object.
+
+    Implements the parse(text) contract the "host" JSON backend of
+    ZipArchiveReader relies on, returning a proxy-like value whose
+    to_py() yields dicts and lists, on top of the json module. Each call
+    can be charged a simulated FFI latency and per-character transfer
+    cost, so backend thresholds can be explored on Linux.
+
+    Args:
+        latency: Seconds slept per parse call.
+        per_char: Seconds slept per character crossing the bridge.
+
+    Attributes:
+        calls (int): Number of parse calls.
+        chars_in (int): Characters passed to parse.
+
+    Examples::
+
+        >>> reader = ZipArchiveReader(
+        ...     path, members, errors,
+        ...     json_backend="host", json_host=LocalJsonHost(latency=0.0002),
+        ... )
+    """
+
+    def __init__(self, latency: float = 0.0, per_char: float = 0.0):
+        self.latency = latency
+        self.per_char = per_char
+        self.calls = 0
+        self.chars_in = 0
+
+    def parse(self, text: str) -> _LocalJsValue:
+        """Parse JSON text; raises ValueError, as JSON.parse raises SyntaxError."""
+        self.calls += 1
+        self.chars_in += len(text)
+        delay = self.latency + self.per_char * len(text)
+        if delay > 0:
+            time.sleep(delay)
+        return _LocalJsValue(json.loads(text))
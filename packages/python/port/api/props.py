@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import NotRequired, Optional, TypedDict, Union, Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -91,6 +92,45 @@ class PropsUIPromptConfirm:
         return dict
 
 
+def _iso_timestamps(column: pd.Series) -> pd.Series:
+    """
+    Format a datetime64 column as Timestamp.isoformat() strings, with "" for NaT.
+
+    UTC (or naive) columns of whole seconds, which is what extractors produce,
+    are formatted in one numpy call.
+    """
+    tz = column.dt.tz
+    if tz is None or str(tz) == "UTC":
+        naive = column.dt.tz_localize(None) if tz is not None else column
+        values = naive.to_numpy(dtype="datetime64[ns]")
+        present = ~np.isnat(values)
+        if np.all(values.view(np.int64)[present] % 1_000_000_000 == 0):
+            text = np.datetime_as_string(values.astype("datetime64[s]"), unit="s")
+            if tz is not None:
+                text = np.char.add(text, "+00:00")
+            return pd.Series(text, index=column.index, dtype=object).where(present, "")
+    return column.map(lambda t: "" if pd.isna(t) else t.isoformat()).astype(object)
+
+
+def data_frame_to_json(data_frame: pd.DataFrame) -> str:
+    """
+    Serialize a consent form table with DataFrame.to_json().
+
+    datetime64 columns are formatted as ISO 8601 strings first
+    ("2021-09-20T12:00:00+00:00"; "" for NaT), on a shallow copy, so only
+    the rows handed in are formatted and the table itself is unchanged.
+    """
+    timestamp_columns = [
+        column for column, dtype in data_frame.dtypes.items()
+        if pd.api.types.is_datetime64_any_dtype(dtype)
+    ]
+    if timestamp_columns:
+        data_frame = data_frame.copy(deep=False)
+        for column in timestamp_columns:
+            data_frame[column] = _iso_timestamps(data_frame[column])
+    return data_frame.to_json()
+
+
 @dataclass
 class PropsUIPromptConsentFormTable:
     """Table to be shown to the participant prior to data_submission
@@ -128,7 +168,8 @@ class PropsUIPromptConsentFormTable:
         dict["number"] = self.number
         dict["title"] = self.title.toDict()
         dict["description"] = self.description.toDict()
-        dict["data_frame"] = self.data_frame.to_json()
+        # Rows past data_frame_max_size were dropped in __post_init__
+        dict["data_frame"] = data_frame_to_json(self.data_frame)
         if self.headers:
             dict["headers"] = {key: value.toDict() for key, value in self.headers.items()}
         return dict
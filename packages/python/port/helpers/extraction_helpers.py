@@ -4,15 +4,23 @@ This module contains helper functions that can be used during the data extractio
 import math
 import re
 import logging
-from collections import Counter
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import IO, Any, Callable, Union
+from typing import IO, Any, Callable, Iterable, Iterator, Union
 from pathlib import Path
 import zipfile
+import copy
 import csv
+import fnmatch
+import functools
 import io
 import json
+import shutil
+import time
+import zlib
 
 import pandas as pd
 import numpy as np
@@ -68,6 +76,76 @@ def dict_denester(inp: dict[Any, Any] | list[Any], new: dict[Any, Any] | None =
     return new  # type: ignore
 
 
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+@functools.lru_cache(maxsize=256)
+def _key_matcher(key_to_match: str) -> Callable[[str], bool]:
+    """
+    Returns a predicate equivalent to re.match(f"^.*{key_to_match}.*$", key).
+
+    A plain key_to_match is tested with a substring search; the regex is
+    only used when key_to_match has metacharacters, or for keys with a
+    newline, where `.` and `$` make the two differ.
+    """
+    pattern = re.compile(f"^.*{key_to_match}.*$")
+    if _REGEX_METACHARACTERS.intersection(key_to_match):
+        return lambda k: pattern.match(k) is not None
+    return lambda k: pattern.match(k) is not None if "\n" in k else key_to_match in k
+
+
+class DenestedRecord(dict):
+    """
+    A record flattened once by dict_denester, answering find_item lookups from a cache.
+
+    The flattened keys are ordered by depth (number of "-") once, on the
+    first lookup, so find() returns the least nested match with a scan
+    that stops at the first hit, and each key_to_match is resolved once
+    per record. Results are identical to find_item and find_items on the
+    dict_denester output, which also accept a DenestedRecord directly.
+    Treat the record as read-only: lookups are not invalidated by changes.
+
+    Examples::
+
+        >>> d = DenestedRecord({"asd": {"asd": {"asd": 1}, "x": 2}, "qwe": 3})
+        >>> d.find("asd")
+        "2"
+    """
+
+    def __init__(self, inp: dict[Any, Any] | list[Any]):
+        super().__init__(dict_denester(inp))
+        self._by_depth: list[str] | None = None
+        self._found: dict[str, str] = {}
+
+    def find(self, key_to_match: str) -> str:
+        """The value of the least nested key containing key_to_match, as str; "" if none."""
+        out = self._found.get(key_to_match)
+        if out is None:
+            out = ""
+            try:
+                if self._by_depth is None:
+                    # sorted() is stable: equal depths keep insertion order, as in find_item.
+                    self._by_depth = sorted(self, key=lambda k: k.count("-"))
+                matches = _key_matcher(key_to_match)
+                for k in self._by_depth:
+                    if matches(k):
+                        out = str(self[k])
+                        break
+            except Exception as e:
+                logger.error(e)
+            self._found[key_to_match] = out
+        return out
+
+    def find_all(self, key_to_match: str) -> list:
+        """All values whose keys contain key_to_match, as str, in insertion order."""
+        try:
+            matches = _key_matcher(key_to_match)
+            return [str(v) for k, v in self.items() if matches(k)]
+        except Exception as e:
+            logger.error(e)
+            return []
+
+
 def find_item(d: dict[Any, Any], key_to_match: str) -> str:
     """
     Finds the least nested value in a denested dictionary whose key contains the given key_to_match.
@@ -89,6 +167,9 @@ def find_item(d: dict[Any, Any], key_to_match: str) -> str:
         >>> find_item(d, "asd")
         "2"
     """
+    if isinstance(d, DenestedRecord):
+        return d.find(key_to_match)
+
     out = ""
     pattern = r"{}".format(f"^.*{key_to_match}.*$")
     depth = math.inf
@@ -126,6 +207,9 @@ def find_items(d: dict[Any, Any], key_to_match: str) -> list:
         >>> find_items(d, "asd")
         ["a", "b"]
     """
+    if isinstance(d, DenestedRecord):
+        return d.find_all(key_to_match)
+
     out = []
     pattern = r"{}".format(f"^.*{key_to_match}.*$")
 
@@ -139,6 +223,257 @@ def find_items(d: dict[Any, Any], key_to_match: str) -> list:
     return out
 
 
+# Marks a path that does not resolve, as opposed to a None value.
+_MISSING = object()
+
+
+def _compile_path(steps: list[str]) -> Callable[[Any], Any]:
+    """
+    Compiles path steps into a function from a record to its value, or _MISSING.
+    This function should not be used directly.
+    """
+    if not steps:
+        return lambda v: _MISSING if isinstance(v, (dict, list)) else v
+
+    step, rest = steps[0], _compile_path(steps[1:])
+
+    if step == "**":
+        def walk(v: Any) -> Any:
+            # Breadth-first, so the least nested match wins.
+            queue = [v]
+            for node in queue:
+                found = rest(node)
+                if found is not _MISSING:
+                    return found
+                if isinstance(node, dict):
+                    queue.extend(node.values())
+                elif isinstance(node, list):
+                    queue.extend(node)
+            return _MISSING
+        return walk
+
+    if step == "*":
+        def each(v: Any) -> Any:
+            children = v.values() if isinstance(v, dict) else v if isinstance(v, list) else ()
+            for child in children:
+                found = rest(child)
+                if found is not _MISSING:
+                    return found
+            return _MISSING
+        return each
+
+    if "*" in step:
+        matches = re.compile(fnmatch.translate(step)).match
+
+        def pattern(v: Any) -> Any:
+            if isinstance(v, dict):
+                for k, child in v.items():
+                    if isinstance(k, str) and matches(k):
+                        found = rest(child)
+                        if found is not _MISSING:
+                            return found
+            return _MISSING
+        return pattern
+
+    index = int(step) if step.isdigit() else None
+
+    def key(v: Any) -> Any:
+        if isinstance(v, dict):
+            return rest(v[step]) if step in v else _MISSING
+        if index is not None and isinstance(v, list) and index < len(v):
+            return rest(v[index])
+        return _MISSING
+    return key
+
+
+class PathExtractor:
+    """
+    Extracts table columns from nested records by declared paths.
+
+    Columns map a column name to a path, or to a list of paths tried in
+    order until one yields a non-empty value. A path is a dot-separated
+    list of steps:
+
+    - ``name``: the key in a dict (a digit string also indexes a list)
+    - ``*``: every key or element one level down; the first match wins
+    - ``**``: any depth, breadth-first; the least nested match wins
+    - ``*name*``: a glob over the keys of a dict; the first matching key
+      in dict order wins
+
+    A path addresses a scalar: a missing key, a shape mismatch or a
+    container at the end yields `default`. Values are returned as str,
+    as find_item returns them.
+
+    "**.name" matches the key "name" exactly. find_item matched every
+    denested key containing the substring, ancestors included, so
+    find_item(dict_denester(record), "name") also returned the value of
+    "group_name", and "timestamp" that of "creation_timestamp". "**.*name*" is the counterpart for
+    a key name containing "name"; unlike find_item it does not match on
+    the names of enclosing keys. The spec is compiled once into
+    functions that walk each record directly, visiting only the declared
+    fields.
+
+    Args:
+        columns (dict[str, str | list[str]]): Column name to path(s).
+        default (str): Value for paths that do not resolve.
+
+    Examples::
+
+        >>> followers = PathExtractor({
+        ...     "Account": ["title", "string_list_data.*.value"],
+        ...     "Date": "string_list_data.*.timestamp",
+        ... })
+        >>> followers.row({"title": "", "string_list_data": [{"value": "abc", "timestamp": 1}]})
+        ("abc", "1")
+        >>> df = followers.frame(items)
+    """
+
+    def __init__(self, columns: dict[str, str | list[str]], default: str = ""):
+        self.columns = list(columns)
+        self.default = default
+        self._getters = [
+            self._compile([paths] if isinstance(paths, str) else list(paths))
+            for paths in columns.values()
+        ]
+
+    def _compile(self, paths: list[str]) -> Callable[[Any], str]:
+        compiled = [_compile_path(path.split(".")) for path in paths]
+        default = self.default
+
+        def get(record: Any) -> str:
+            for path in compiled:
+                value = path(record)
+                if value is not _MISSING:
+                    value = str(value)
+                    if value:
+                        return value
+            return default
+        return get
+
+    def row(self, record: Any) -> tuple[str, ...]:
+        """The declared columns of one record."""
+        return tuple(get(record) for get in self._getters)
+
+    def frame(self, records: Iterable[Any]) -> pd.DataFrame:
+        """A DataFrame with one row per record, filled column by column."""
+        buffers: list[list[str]] = [[] for _ in self._getters]
+        pairs = list(zip(buffers, self._getters))
+        for record in records:
+            for buffer, get in pairs:
+                buffer.append(get(record))
+        return pd.DataFrame(dict(zip(self.columns, buffers)), columns=self.columns)
+
+
+class TableBuilder:
+    """
+    Column-oriented builder for extractor tables.
+
+    Rows are appended straight into one buffer per column instead of a
+    list of tuples, and frame() builds the DataFrame from those columns
+    in one pass, without pandas' row-wise type inference. Column types:
+
+    - ``str`` (default): a list, stored as-is in an object column
+    - ``int``: an int64 array; None becomes <NA> (nullable Int64)
+    - ``float``: a float64 array; None becomes <NA> (nullable Float64)
+    - ``bool``: a byte array, stored as a bool column
+
+    With `max_rows`, rows past the cap are not stored; they are counted
+    in `dropped`.
+
+    Args:
+        columns (dict[str, type] | list[str]): Column names, with their types.
+        max_rows (int | None): Optional row cap.
+
+    Examples::
+
+        >>> table = TableBuilder({"Title": str, "Visits": int, "Ad": bool})
+        >>> table.append("Example", 3, False)
+        >>> df = table.frame()
+    """
+
+    def __init__(self, columns: dict[str, type] | list[str], max_rows: int | None = None):
+        if not isinstance(columns, dict):
+            columns = dict.fromkeys(columns, str)
+        self.columns = list(columns)
+        self.max_rows = max_rows
+        self.dropped = 0
+        self._rows = 0
+        self._buffers: list[Any] = []
+        self._adders: list[Callable[[Any], None]] = []
+        for kind in columns.values():
+            if kind is str:
+                buffer: Any = []
+                add = buffer.append
+            elif kind is int:
+                buffer = (array("q"), bytearray())
+                add = functools.partial(self._add_int, *buffer)
+            elif kind is float:
+                buffer = (array("d"), bytearray())
+                add = functools.partial(self._add_float, *buffer)
+            elif kind is bool:
+                buffer = bytearray()
+                add = functools.partial(self._add_bool, buffer)
+            else:
+                raise ValueError(f"Unsupported column type: {kind!r}")
+            self._buffers.append(buffer)
+            self._adders.append(add)
+
+    @staticmethod
+    def _add_int(values: array, missing: bytearray, value: Any) -> None:
+        if value is None:
+            values.append(0)
+            missing.append(1)
+        else:
+            values.append(int(value))
+            missing.append(0)
+
+    @staticmethod
+    def _add_float(values: array, missing: bytearray, value: Any) -> None:
+        if value is None:
+            values.append(0.0)
+            missing.append(1)
+        else:
+            values.append(float(value))
+            missing.append(0)
+
+    @staticmethod
+    def _add_bool(values: bytearray, value: Any) -> None:
+        values.append(1 if value else 0)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, *values: Any) -> None:
+        """Add one row, one value per column in declaration order."""
+        if len(values) != len(self._adders):
+            raise ValueError(f"Expected {len(self._adders)} values, got {len(values)}")
+        if self.max_rows is not None and self._rows >= self.max_rows:
+            self.dropped += 1
+            return
+        for add, value in zip(self._adders, values):
+            add(value)
+        self._rows += 1
+
+    def frame(self) -> pd.DataFrame:
+        """The appended rows as a DataFrame with the declared columns."""
+        data = {}
+        for name, buffer in zip(self.columns, self._buffers):
+            if isinstance(buffer, tuple):
+                is_float = buffer[0].typecode == "d"
+                values = np.array(buffer[0], dtype=np.float64 if is_float else np.int64)
+                missing = np.frombuffer(buffer[1], dtype=np.uint8).astype(np.bool_)
+                if missing.any():
+                    masked = pd.arrays.FloatingArray if is_float else pd.arrays.IntegerArray
+                    data[name] = masked(values, missing)
+                else:
+                    data[name] = values
+            elif isinstance(buffer, bytearray):
+                data[name] = np.frombuffer(buffer, dtype=np.uint8).astype(np.bool_)
+            else:
+                data[name] = pd.Series(buffer, dtype=object)
+        return pd.DataFrame(data, columns=self.columns)
+
+
 def json_dumper(zfile: str) -> pd.DataFrame:
     """
     Reads all JSON files in a zip file, flattens them, and combines them into a single DataFrame.
@@ -269,33 +604,214 @@ def epoch_to_iso(epoch_timestamp: str | int | float, errors: Counter | None = No
     return out
 
 
-def sort_isotimestamp_empty_timestamp_last(timestamp_series: pd.Series) -> pd.Series:
+_EPOCH_UNIT_DIVISORS = {"s": 1, "ms": 1_000, "us": 1_000_000}
+# Seconds representable as datetime64[ns]; anything further out is converted per value
+_EPOCH_NS_LIMIT = 9.2e9
+
+
+def _detect_epoch_unit(numbers: pd.Series) -> str:
+    magnitude = numbers.abs().median()
+    if pd.isna(magnitude) or magnitude < 1e11:
+        return "s"
+    if magnitude < 1e14:
+        return "ms"
+    return "us"
+
+
+def _epoch_timestamps(values: Iterable[Any], unit: str | None) -> tuple[pd.Series, pd.Series, int]:
+    """The raw values as a Series, their UTC timestamps (NaT where not numeric or out of range) and the unit divisor."""
+    if isinstance(values, pd.Series):
+        series = values
+    else:
+        series = pd.Series(list(values), dtype=object)
+    numbers = pd.to_numeric(series, errors="coerce").astype("float64")
+    if unit is None:
+        unit = _detect_epoch_unit(numbers)
+    if unit not in _EPOCH_UNIT_DIVISORS:
+        raise ValueError(f"Unknown epoch unit: {unit!r}")
+    divisor = _EPOCH_UNIT_DIVISORS[unit]
+
+    seconds = np.trunc(numbers / divisor)
+    valid = seconds.abs() < _EPOCH_NS_LIMIT
+    # Whole seconds as int64: pandas' float unit cast can overflow on NaN rows
+    seconds = seconds.where(valid, 0).astype("int64")
+    timestamps = pd.to_datetime(seconds, unit="s", utc=True, errors="coerce").where(valid)
+    return series, timestamps, divisor
+
+
+def _is_empty_epoch(value: Any) -> bool:
+    return value is pd.NA or (not value and value != 0)
+
+
+def epoch_to_datetime_column(
+    values: Iterable[Any], errors: Counter | None = None, unit: str | None = "s"
+) -> pd.Series:
     """
-    Creates a key for sorting a pandas Series of ISO timestamps, placing empty timestamps last.
+    Convert a column of epoch timestamps to a datetime64[ns, UTC] column.
+
+    Extractors keep timestamps in this form; they are formatted as ISO 8601
+    strings (the same strings epoch_to_iso returns) only when the table is
+    serialized, by props.data_frame_to_json.
+    Sub-second precision is truncated and empty values become NaT.
+
+    A datetime64 column cannot show a value it could not convert, so when
+    any non-empty value is not a number, or lies outside the datetime64[ns]
+    range, the column is returned as the strings epoch_to_iso gives per
+    value instead: the raw value is kept where conversion fails, and dates
+    outside pandas' range are converted one by one. Such values are added
+    to errors["TimestampParseError"] and logged once.
 
     Args:
-        timestamp_series (pd.Series): A pandas Series containing ISO formatted timestamps.
+        values (Iterable): Raw epoch values (int, float, str, empty or <NA>).
+        errors (Counter | None): Error counter to update.
+        unit (str | None): "s", "ms" or "us"; None detects the unit from
+            the median magnitude of the column.
 
     Returns:
-        pd.Series: A Series of sorting keys, with -timestamp for valid dates and infinity for invalid/empty dates.
+        pd.Series: UTC timestamps, or ISO 8601 strings as described above,
+            with the index of `values` if it is a Series.
 
     Examples::
 
-        >>> df = df.sort_values(by="Date", key=sort_isotimestamp_empty_timestamp_last)
+        >>> out["Date"] = epoch_to_datetime_column(out["Date"], errors=errors)
+        >>> epoch_to_datetime_column([1632139200000, ""], unit=None).tolist()
+        [Timestamp('2021-09-20 12:00:00+0000', tz='UTC'), NaT]
     """
-    def convert_timestamp(timestamp):
-
-        out = np.inf
+    series, timestamps, divisor = _epoch_timestamps(values, unit)
+    unconverted = [
+        position for position in np.flatnonzero(timestamps.isna().to_numpy())
+        if not _is_empty_epoch(series.iat[position])
+    ]
+    if unconverted:
+        return _epoch_iso_strings(series, timestamps, divisor, unconverted, errors)
+    return timestamps
+
+
+def _epoch_iso_strings(
+    series: pd.Series, timestamps: pd.Series, divisor: int, unconverted: list[int], errors: Counter | None
+) -> pd.Series:
+    """epoch_to_iso per value, for a column whose unconverted rows are retried one by one."""
+    as_seconds = timestamps.dt.tz_localize(None).to_numpy(dtype="datetime64[s]")
+    out = pd.Series(
+        np.char.add(np.datetime_as_string(as_seconds, unit="s"), "+00:00"),
+        index=series.index,
+        dtype=object,
+    )
+    out[timestamps.isna().to_numpy()] = ""
+
+    failed = 0
+    for position in unconverted:
+        value = series.iat[position]
         try:
-            if isinstance(timestamp, str) and len(timestamp) > 0:
-                dt = datetime.fromisoformat(timestamp)
-                out = -dt.timestamp()
-        except Exception as e:
-            logger.debug("Cannot convert timestamp: %s", e)
+            out.iat[position] = datetime.fromtimestamp(
+                int(float(value) / divisor), tz=timezone.utc
+            ).isoformat()
+        except (OverflowError, OSError, ValueError, TypeError):
+            out.iat[position] = str(value)
+            failed += 1
+
+    if failed:
+        logger.error("Could not convert %d epoch timestamps", failed)
+        if errors is not None:
+            errors["TimestampParseError"] += failed
+    return out
+
 
+def _iso_sort_key(timestamp: Any) -> float:
+    out = np.inf
+    try:
+        if isinstance(timestamp, str) and len(timestamp) > 0:
+            dt = datetime.fromisoformat(timestamp)
+            out = -dt.timestamp()
+    except Exception as e:
+        logger.debug("Cannot convert timestamp: %s", e)
+
+    return out
+
+
+def _iso_seconds_shape(chars: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rows of `chars` (code points, one row per string) shaped like
+    YYYY-MM-DDTHH:MM:SS with an optional Z or +HH:MM suffix, and the
+    suffix offset in seconds.
+    """
+    values = chars - ord("0")  # unsigned: anything below "0" wraps around
+    is_digit = values < 10
+
+    def digits(*columns):
+        return np.all(is_digit[:, columns], axis=1)
+
+    def number(*columns):
+        out = np.zeros(len(chars), dtype=np.int64)
+        for column in columns:
+            out = out * 10 + values[:, column]
         return out
 
-    return timestamp_series.apply(convert_timestamp)
+    base = (
+        digits(0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18)
+        & (chars[:, 4] == ord("-")) & (chars[:, 7] == ord("-")) & (chars[:, 10] == ord("T"))
+        & (chars[:, 13] == ord(":")) & (chars[:, 16] == ord(":"))
+    )
+    naive = chars[:, 19] == 0
+    zulu = (chars[:, 19] == ord("Z")) & (chars[:, 20] == 0)
+    hours, minutes = number(20, 21), number(23, 24)
+    signed = (
+        ((chars[:, 19] == ord("+")) | (chars[:, 19] == ord("-")))
+        & digits(20, 21, 23, 24) & (chars[:, 22] == ord(":")) & (chars[:, 25] == 0)
+        & (hours < 24) & (minutes < 60)
+    )
+    sign = np.where(chars[:, 19] == ord("-"), -1, 1)
+    offset = np.where(signed, sign * (hours * 3600 + minutes * 60), 0)
+    return base & (naive | zulu | signed), offset
+
+
+def sort_isotimestamp_empty_timestamp_last(timestamp_series: pd.Series) -> pd.Series:
+    """
+    Creates a key for sorting a pandas Series of ISO timestamps, placing empty timestamps last.
+
+    Timestamps shaped like epoch_to_iso output (YYYY-MM-DDTHH:MM:SS, with
+    an optional Z or +HH:MM offset) are parsed in one pd.to_datetime call.
+    Other values, and dates pandas cannot represent, fall back to
+    datetime.fromisoformat one by one. Timestamps without an offset are
+    read as UTC. A datetime64 Series is used as is, with NaT last.
+
+    Args:
+        timestamp_series (pd.Series): A pandas Series containing ISO formatted timestamps or datetime64 values.
+
+    Returns:
+        pd.Series: A Series of sorting keys, with -timestamp for valid dates and infinity for invalid/empty dates.
+
+    Examples::
+
+        >>> df = df.sort_values(by="Date", key=sort_isotimestamp_empty_timestamp_last)
+    """
+    if pd.api.types.is_datetime64_any_dtype(timestamp_series):
+        if timestamp_series.dt.tz is not None:
+            timestamp_series = timestamp_series.dt.tz_convert("UTC").dt.tz_localize(None)
+        micros = timestamp_series.to_numpy(dtype="datetime64[us]").view(np.int64)
+        return pd.Series(
+            np.where(timestamp_series.isna(), np.inf, -(micros / 1e6)), index=timestamp_series.index
+        )
+
+    # One extra code point: longer strings are cut to 26 and never match a shape
+    text = timestamp_series.to_numpy(dtype="U26")
+    chars = text.view(np.uint32).reshape(len(text), 26)
+    shaped, offset = _iso_seconds_shape(chars)
+
+    local = np.where(shaped, text.astype("U19"), "")
+    parsed = pd.to_datetime(local, format="ISO8601", utc=True, errors="coerce")
+    parsed_mask = parsed.notna()
+    seconds = parsed.tz_localize(None).to_numpy(dtype="datetime64[s]").view(np.int64) - offset
+    key = pd.Series(
+        np.where(parsed_mask, -seconds.astype(np.float64), np.inf), index=timestamp_series.index
+    )
+
+    for position in np.flatnonzero(~parsed_mask & (chars[:, 0] != 0)):
+        value = timestamp_series.iat[position]
+        if isinstance(value, str) and value:
+            key.iat[position] = _iso_sort_key(value)
+
+    return key
 
 
 def fix_latin1_string(input: str) -> str:
@@ -389,9 +905,10 @@ def _json_reader_bytes(json_bytes: bytes, encoding: str) -> Any:
         >>> print(data)
         {'key': 'value'}
     """
-    json_str = json_bytes.decode(encoding)
-    result = json.loads(json_str)
-    return result
+    if encoding == json.detect_encoding(json_bytes):
+        # json.loads decodes bytes itself; no intermediate str copy here.
+        return json.loads(json_bytes)
+    return json.loads(json_bytes.decode(encoding))
 
 
 def _json_reader_file(json_file: str, encoding: str) -> Any:
@@ -417,13 +934,91 @@ def _json_reader_file(json_file: str, encoding: str) -> Any:
     return result
 
 
+def _json_reader_host(json_bytes: bytes, encoding: str, host: Any = None) -> Any:
+    """
+    Reads JSON data from bytes with the host runtime's JSON.parse.
+    This function should not be used directly.
+
+    The text crosses the js bridge once, as a string; the parsed value is
+    converted to dicts and lists by the proxy's to_py(), which walks it
+    natively instead of in the interpreted json module. Both copies are
+    alive until to_py() returns; see HOST_JSON_MAX_BYTES. Only available
+    under Pyodide unless a stand-in is passed as `host`.
+
+    Args:
+        json_bytes (bytes): The JSON data in bytes.
+        encoding (str): The encoding to use for decoding the bytes.
+        host (Any): Object with a JSON.parse-compatible parse(text);
+            defaults to the global js.JSON.
+
+    Returns:
+        Any: The parsed JSON data.
+    """
+    if host is None:
+        import js
+        host = js.JSON
+    json_str = json_bytes.decode(encoding)
+    try:
+        result = host.parse(json_str)
+    except Exception as e:
+        # A JS SyntaxError surfaces as JsException; report it like json.loads does.
+        raise json.JSONDecodeError(f"Host JSON.parse failed ({type(e).__name__})", "", 0) from e
+    return result.to_py() if hasattr(result, "to_py") else result
+
+
+def _json_reader_stream(json_stream: IO[bytes], encoding: str) -> Any:
+    """
+    Reads JSON data incrementally from a binary stream.
+    This function should not be used directly.
+
+    The stream is decoded and parsed chunk by chunk, so neither the member
+    bytes nor the decoded text are ever held whole. The stream is rewound
+    first, so _read_json can retry it with the fallback encoding.
+
+    Args:
+        json_stream (IO[bytes]): Seekable stream of JSON data.
+        encoding (str): The encoding to use for decoding the stream.
+
+    Returns:
+        Any: The parsed JSON data.
+    """
+    json_stream.seek(0)
+    return _JsonArrayReader(json_stream, encoding=encoding).document()
+
+
+# Encoding tried when the sniffed UTF-8 does not decode.
+_FALLBACK_JSON_ENCODING = "latin-1"
+
+
+def _json_head(json_input: Any) -> bytes:
+    """
+    Returns the first four bytes of JSON input (bytes, file path or seekable stream).
+    This function should not be used directly.
+    """
+    if isinstance(json_input, (bytes, bytearray, memoryview)):
+        return bytes(json_input[:4])
+    if isinstance(json_input, (str, Path)):
+        with open(json_input, "rb") as f:
+            return f.read(4)
+    json_input.seek(0)
+    head = json_input.read(4)
+    json_input.seek(0)
+    return head
+
+
 def _read_json(json_input: Any, json_reader: Callable[[Any, str], Any], errors: Counter | None = None) -> dict[Any, Any] | list[Any]:
     """
-    Reads JSON input using the provided json_reader function, trying different encodings.
+    Reads JSON input using the provided json_reader function, with the encoding sniffed from its first bytes.
     This function should not be used directly.
 
+    The encoding is detected once, from a byte order mark or the null-byte
+    pattern of UTF-16/32 (RFC 4627 section 3, as json.detect_encoding
+    does); only input sniffed as UTF-8 that fails to decode is retried,
+    as latin-1. Encodings other than plain UTF-8 are counted in errors
+    as "JsonEncoding:<codec>", a metric rather than a failure.
+
     Args:
-        json_input (Any): The JSON input (can be bytes or file path).
+        json_input (Any): The JSON input (can be bytes, file path or seekable stream).
         json_reader (Callable[[Any, str], Any]): A function to read the JSON input.
         errors (Counter | None): Optional counter for aggregating error types.
 
@@ -434,7 +1029,8 @@ def _read_json(json_input: Any, json_reader: Callable[[Any, str], Any], errors:
 
     out: dict[Any, Any] | list[Any] = {}
 
-    encodings = ["utf8", "utf-8-sig"]
+    encoding = json.detect_encoding(_json_head(json_input))
+    encodings = [encoding, _FALLBACK_JSON_ENCODING] if encoding == "utf-8" else [encoding]
     for encoding in encodings:
         try:
             result = json_reader(json_input, encoding)
@@ -444,12 +1040,19 @@ def _read_json(json_input: Any, json_reader: Callable[[Any, str], Any], errors:
 
             out = result
             logger.debug("Succesfully converted json bytes with encoding: %s", encoding)
+            if encoding != "utf-8" and errors is not None:
+                errors[f"JsonEncoding:{encoding}"] += 1
             break
 
+        except UnicodeDecodeError:
+            logger.warning("Cannot decode json with encoding: %s", encoding)
+            if encoding == encodings[-1] and errors is not None:
+                errors["UnicodeDecodeError"] += 1
         except json.JSONDecodeError:
             logger.error("Cannot decode json with encoding: %s", encoding)
             if errors is not None:
                 errors["JSONDecodeError"] += 1
+            break
         except TypeError as e:
             logger.error("%s, could not convert json bytes", e)
             if errors is not None:
@@ -568,6 +1171,634 @@ def read_csv_from_bytes_to_df(json_bytes: io.BytesIO) -> pd.DataFrame:
     return pd.DataFrame(read_csv_from_bytes(json_bytes))
 
 
+# Chunk size for consumers that stream a member (ZipArchiveReader.open)
+# instead of materializing it.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Budget of ZipArchiveReader's parsed-result cache, counted in uncompressed
+# member bytes (parsed objects are larger; this bounds them proportionally).
+PARSED_CACHE_BYTES = 16 * 1024 * 1024
+
+# Members up to this compressed size are batched into one vectored read
+# by ZipArchiveReader._prefetch_members; larger ones are read on demand.
+PREFETCH_MEMBER_MAX_BYTES = 256 * 1024
+
+# Fixed part of a zip local file header (APPNOTE 4.3.7).
+_LOCAL_HEADER_SIZE = 30
+
+
+def _member_span(info: zipfile.ZipInfo) -> tuple[int, int]:
+    """Approximate (offset, length) of a member's local header plus data.
+
+    The local extra field may differ in length from the central one;
+    any shortfall is simply read on demand later.
+    """
+    name_len = len(info.orig_filename.encode("utf-8"))
+    length = _LOCAL_HEADER_SIZE + name_len + len(info.extra) + info.compress_size
+    return info.header_offset, length
+
+
+# A pattern ending in a literal extension, e.g. r"_\d+\.json$". An odd
+# number of backslashes before the dot means the dot itself is escaped.
+_LITERAL_EXTENSION = re.compile(r"(\\+)\.(\w+)\$\Z")
+
+
+def _extension(basename: str) -> str:
+    """Text after the last dot of a basename, or "" if it has none."""
+    head, dot, ext = basename.rpartition(".")
+    return ext if dot else ""
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """True if `pattern` contains a `|` outside any group or set."""
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            # Skip the set; a ']' right after '[' or '[^' is literal.
+            i += 1
+            if i < len(pattern) and pattern[i] == "^":
+                i += 1
+            if i < len(pattern) and pattern[i] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _required_extension(regex: re.Pattern) -> str | None:
+    """Extension every match of `regex` must end in, if provably fixed.
+
+    Only patterns ending in an escaped-dot literal extension and `$`,
+    case-sensitive and without top-level alternation, qualify; anything
+    else returns None and is searched against every member.
+    """
+    if not isinstance(regex.pattern, str) or regex.flags & re.IGNORECASE:
+        return None
+    m = _LITERAL_EXTENSION.search(regex.pattern)
+    if m is None or len(m.group(1)) % 2 == 0:
+        return None
+    if _has_top_level_alternation(regex.pattern):
+        return None
+    return m.group(2)
+
+
+class _MemberIndex:
+    """Lookup tables over an archive's member list, built once per reader.
+
+    Replaces the linear scans in member resolution: an exact-path set,
+    a basename -> paths map for path-boundary suffix matches, and an
+    extension -> paths map that narrows regex queries ending in a literal
+    extension. Buckets keep archive order, so results are identical to
+    scanning the full list. Regex query results are memoized per pattern.
+    """
+
+    def __init__(self, members: list[str]):
+        self.members = members
+        self.exact = set(members)
+        self.by_basename: dict[str, list[str]] = {}
+        self.by_extension: dict[str, list[str]] = {}
+        for member in members:
+            basename = member.rsplit("/", 1)[-1]
+            self.by_basename.setdefault(basename, []).append(member)
+            self.by_extension.setdefault(_extension(basename), []).append(member)
+        self._searches: dict[str, list[str]] = {}
+
+    def suffix_matches(self, filename: str) -> list[str]:
+        """Members ending in "/" + filename, in archive order."""
+        suffix = "/" + filename
+        candidates = self.by_basename.get(filename.rsplit("/", 1)[-1], [])
+        return [m for m in candidates if m.endswith(suffix)]
+
+    def search(self, pattern: str) -> list[str]:
+        """Sorted members matching `pattern` (re.search semantics)."""
+        matches = self._searches.get(pattern)
+        if matches is None:
+            regex = re.compile(pattern)
+            extension = _required_extension(regex)
+            if extension is None:
+                candidates = self.members
+            else:
+                candidates = self.by_extension.get(extension, [])
+            matches = sorted(m for m in candidates if regex.search(m))
+            self._searches[pattern] = matches
+        return list(matches)
+
+
+class _JsonArrayReader:
+    """Incremental reader yielding the elements of one JSON array.
+
+    Only the containers on the way to the array are tokenized by hand;
+    each element (and each skipped sibling value) is decoded with
+    `json.JSONDecoder.raw_decode` on a text buffer that is refilled from
+    the stream as needed. Memory is bounded by the largest single
+    element, not by the document.
+    """
+
+    _WHITESPACE = " \t\n\r"
+    # Longest partial token that fails to decode away from the buffer end,
+    # e.g. "-Infinit" or a cut "\uXXXX" escape.
+    _TRUNCATION_MARGIN = 16
+
+    def __init__(self, stream: IO[bytes], chunk_size: int = STREAM_CHUNK_SIZE, encoding: str = "utf-8-sig"):
+        # utf-8-sig accepts input with and without a byte order mark.
+        self._text = io.TextIOWrapper(stream, encoding=encoding)
+        self._decoder = json.JSONDecoder()
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append at least one chunk to the buffer; False at end of input.
+
+        The read size grows with the pending, unparsed text so a single
+        large element is re-scanned O(log n) times, not once per chunk.
+        """
+        if self._eof:
+            return False
+        pending = len(self._buf) - self._pos
+        chunk = self._text.read(max(self._chunk_size, pending))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buf, self._pos)
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decode the complete JSON value starting at the next character."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if self._truncated(e) and self._fill():
+                    continue
+                raise
+            # A number cut at the buffer end decodes short ("12" of "123",
+            # "-4" of "-4.5e1"). Unless a delimiter follows, refill and
+            # decode again.
+            if self._undelimited(end) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _undelimited(self, end: int) -> bool:
+        """Whether the value ending at `end` may continue past the buffer."""
+        rest = self._buf[end:end + self._TRUNCATION_MARGIN]
+        return len(rest) < self._TRUNCATION_MARGIN and not any(
+            c in self._WHITESPACE or c in ",]}:" for c in rest
+        )
+
+    def _truncated(self, error: json.JSONDecodeError) -> bool:
+        """Whether a decode error may just mean the value continues.
+
+        Errors within a few characters of the buffer end (a cut literal,
+        number or escape) or an unterminated string qualify; anything else
+        is malformed input, raised without buffering the rest.
+        """
+        return (
+            error.pos >= len(self._buf) - self._TRUNCATION_MARGIN
+            or error.msg.startswith("Unterminated string")
+        )
+
+    def _key(self) -> str:
+        """Decode an object key and the colon after it."""
+        if self._peek() != '"':
+            raise json.JSONDecodeError(
+                "Expecting property name enclosed in double quotes", self._buf, self._pos,
+            )
+        name = self._value()
+        self._expect(":")
+        return name
+
+    def _enter_key(self, key: str) -> bool:
+        """Position on the value of `key` in the object at the cursor."""
+        self._expect("{")
+        if self._peek() == "}":
+            return False
+        while True:
+            name = self._key()
+            if name == key:
+                return True
+            self._value()
+            if self._peek() != ",":
+                self._expect("}")
+                return False
+            self._pos += 1
+
+    def items(self, path: tuple[str, ...]) -> Iterator[Any]:
+        """Yield the elements of the array found by following `path`."""
+        for key in path:
+            if self._peek() != "{":
+                break
+            if not self._enter_key(key):
+                return
+        if self._peek() != "[":
+            return
+        self._pos += 1
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._peek() != ",":
+                self._expect("]")
+                return
+            self._pos += 1
+
+    def document(self) -> Any:
+        """Decode the whole document, building the top-level container
+        one member at a time.
+
+        The stream is detached, not closed, when done, so the caller can
+        rewind it and try again.
+        """
+        try:
+            first = self._peek()
+            if first == "[":
+                value: Any = list(self.items(()))
+            elif first == "{":
+                value = {}
+                self._pos += 1
+                if self._peek() == "}":
+                    self._pos += 1
+                else:
+                    while True:
+                        name = self._key()
+                        value[name] = self._value()
+                        if self._peek() != ",":
+                            self._expect("}")
+                            break
+                        self._pos += 1
+            else:
+                value = self._value()
+            if self._peek() != "":
+                raise json.JSONDecodeError("Extra data", self._buf, self._pos)
+            return value
+        finally:
+            self._text.detach()
+
+
+# Longest `window.YTD.<name>.part<n> = ` prefix searched for in X exports.
+_JS_ASSIGNMENT_MAX_PREFIX = 1024
+
+
+def iter_js_assignment(stream: IO[bytes]) -> Iterator[Any]:
+    """
+    Yields the elements of the array assigned in an X/Twitter export .js file.
+
+    X exports wrap each JSON array in a JavaScript assignment, for example
+    ``window.YTD.tweets.part0 = [...]``. The prefix is skipped at byte level
+    and the array is tokenized incrementally, so the file is never held in
+    memory as a whole. Input without the prefix is read as plain JSON; an
+    empty stream yields nothing.
+
+    Args:
+        stream (IO[bytes]): Seekable binary stream of the .js file.
+
+    Returns:
+        Iterator[Any]: The array elements, typically dicts.
+
+    Raises:
+        json.JSONDecodeError: No assignment was found, or the JSON is malformed.
+
+    Examples::
+
+        >>> list(iter_js_assignment(io.BytesIO(b'window.YTD.block.part0 = [{"a": 1}]')))
+        [{'a': 1}]
+    """
+    start = stream.tell()
+    head = stream.read(_JS_ASSIGNMENT_MAX_PREFIX)
+    if not head.strip():
+        return
+    if head.lstrip(b"\xef\xbb\xbf \t\r\n")[:1] in (b"[", b"{"):
+        offset = 0
+    else:
+        offset = head.find(b"=") + 1
+        if offset == 0:
+            raise json.JSONDecodeError("Expecting a JavaScript assignment", "", 0)
+    stream.seek(start + offset)
+    yield from _JsonArrayReader(stream).items(())
+
+
+@dataclass(frozen=True)
+class MemberLimits:
+    """Admission limits ZipArchiveReader applies before reading a member.
+
+    Checked against the central directory (`ZipInfo.file_size` and
+    `compress_size`) before any member byte is read. zipfile stops
+    decompressing at the declared size, so a member cannot outgrow the
+    numbers it was admitted on.
+
+    Only bomb-level members are refused; anything else is read, larger
+    ones through the member stream.
+
+    Attributes:
+        max_materialize_bytes: Largest member json(), json_all() and
+            json_many() parse from its bytes in memory. Larger members
+            are parsed incrementally from the member stream (the
+            "stream" JSON backend), and raw() and read_many() copy them
+            from the stream without an intermediate bytes object.
+        max_stream_bytes: Largest member any accessor will read.
+        max_compression_ratio: Highest file_size / compress_size accepted
+            for members of at least `min_ratio_check_bytes`, as zip-bomb
+            protection. Deflate tops out near 1032:1, which only runs of
+            a single byte reach; real exports stay well below 1000.
+        min_ratio_check_bytes: Members smaller than this skip the ratio
+            check; small, highly repetitive files compress very well.
+    """
+    max_materialize_bytes: int = 256 * 1024 * 1024
+    max_stream_bytes: int = 2 * 1024 * 1024 * 1024
+    max_compression_ratio: float = 1000.0
+    min_ratio_check_bytes: int = 16 * 1024 * 1024
+
+
+class _ParsedCache:
+    """LRU of parsed members keyed by (member path, parser kind).
+
+    Entries are charged their uncompressed member size against
+    `max_bytes`; the least recently used are evicted past the budget and
+    members larger than the budget are never stored. `hits` and `misses`
+    count lookups.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: tuple[str, str]) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: tuple[str, str], value: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (value, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
+# --- JSON parse backends for ZipArchiveReader ---
+
+# "stdlib" decodes and json.loads the member bytes in Python, "host" hands
+# the text to the JS runtime's JSON.parse, "stream" parses incrementally
+# from the member stream (see _read_json and its readers).
+JSON_BACKENDS = ("stdlib", "host", "stream")
+
+# Largest member JsonBackendBySize hands to the host backend. JSON.parse
+# keeps the whole document in the JS heap while to_py() builds the Python
+# copy, so a host parse peaks at about twice the parsed size.
+HOST_JSON_MAX_BYTES = 64 * 1024 * 1024  # 64 MiB
+
+
+@dataclass(frozen=True)
+class JsonBackendBySize:
+    """Size-based JSON backend policy for ZipArchiveReader.
+
+    Members of at least `stream_min_bytes` go to the streaming backend,
+    members of at least `host_min_bytes` below that to the host backend,
+    everything else to stdlib. None disables a tier. Thresholds are meant
+    to be picked from `ZipArchiveReader.json_stats` on real exports.
+
+    The host backend converts the whole parsed document at once, so it is
+    only picked below `host_max_bytes` (HOST_JSON_MAX_BYTES, 64 MiB);
+    larger members that would go to it are streamed instead.
+    """
+    host_min_bytes: int | None = None
+    stream_min_bytes: int | None = None
+    host_max_bytes: int = HOST_JSON_MAX_BYTES
+
+    def __call__(self, size: int) -> str:
+        if self.stream_min_bytes is not None and size >= self.stream_min_bytes:
+            return "stream"
+        if self.host_min_bytes is not None and size >= self.host_min_bytes:
+            return "host" if size < self.host_max_bytes else "stream"
+        return "stdlib"
+
+
+@dataclass
+class ParseStats:
+    """Time spent parsing JSON members with one backend.
+
+    Attributes:
+        calls (int): Members parsed (cache hits are not counted).
+        bytes (int): Their total uncompressed size.
+        seconds (float): Wall time spent reading and parsing them.
+    """
+    calls: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+
+# --- Decompression backends for ZipArchiveReader ---
+
+class Inflater(ABC):
+    """Incremental raw-deflate decompressor for ZIP_DEFLATED members.
+
+    decompress() takes the next piece of compressed input and returns the
+    output it produced; flush() returns the remainder once the input is
+    exhausted. ZipArchiveReader creates one instance per member read.
+    """
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Inflate the next piece of compressed input."""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """Return the output still buffered once the input is exhausted."""
+
+
+class ZlibInflater(Inflater):
+    """Stdlib zlib backend; the reference every other backend must match."""
+
+    def __init__(self):
+        self._inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._inflater.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._inflater.flush()
+
+
+class JsInflater(Inflater):
+    """Experimental, unused: adapter for an inflater living on the JS side.
+
+    Nothing in the port wires this class up. Wraps an object with a push(chunk) / finish() contract, each returning
+    the output produced so far as a Uint8Array (or ArrayBuffer) proxy.
+    Compressed chunks are passed as Python bytes; the host converts the
+    proxy with toJs(). On desktop, port.api.file_utils.LocalRawInflater
+    implements the contract.
+
+    py_worker.js provides no such object: the browser's only native
+    inflater, DecompressionStream, is promise-based, and Python reads
+    members without yielding to the event loop under Pyodide 0.24. A host
+    that ships a synchronous inflater passes it in explicitly, e.g.
+    ``decompressor=lambda: JsInflater(js.createRawInflater())``; without
+    one, keep the default zlib backend.
+
+    Args:
+        js_inflater: Object implementing push(chunk) and finish().
+    """
+
+    def __init__(self, js_inflater: Any):
+        self._js = js_inflater
+
+    @staticmethod
+    def _bytes(chunk: Any) -> bytes:
+        if hasattr(chunk, "to_bytes"):
+            return chunk.to_bytes()
+        return bytes(chunk.to_py())
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._bytes(self._js.push(data))
+
+    def flush(self) -> bytes:
+        return self._bytes(self._js.finish())
+
+
+class _InflatingStream(io.RawIOBase):
+    """Readable, seekable stream of a ZIP_DEFLATED member via an Inflater.
+
+    The compressed bytes are read through zipfile as if the member were
+    stored (a ZipInfo copy with ZIP_STORED, the compressed size and no
+    CRC), so local-header parsing and shared-file positioning stay with
+    zipfile. Like ZipExtFile, output beyond the declared size and a CRC-32
+    or size mismatch at the end raise BadZipFile. Seeking backwards
+    restarts decompression.
+    """
+
+    def __init__(
+        self,
+        zf: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        make_inflater: Callable[[], Inflater],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ):
+        super().__init__()
+        self._zf = zf
+        self._info = info
+        self._make_inflater = make_inflater
+        self._chunk_size = chunk_size
+        self._raw: IO[bytes] | None = None
+        self._start()
+
+    def _start(self) -> None:
+        if self._raw is not None:
+            self._raw.close()
+        stored = copy.copy(self._info)
+        stored.compress_type = zipfile.ZIP_STORED
+        stored.file_size = self._info.compress_size
+        stored.CRC = None
+        self._raw = self._zf.open(stored)
+        self._inflater = self._make_inflater()
+        self._pending = memoryview(b"")
+        self._pos = 0
+        self._produced = 0
+        self._crc = 0
+        self._eof = False
+
+    def _fill(self) -> None:
+        data = self._raw.read(self._chunk_size)
+        out = self._inflater.decompress(data) if data else self._inflater.flush()
+        self._produced += len(out)
+        if self._produced > self._info.file_size:
+            raise zipfile.BadZipFile("Member inflates beyond its declared size")
+        self._crc = zlib.crc32(out, self._crc)
+        self._pending = memoryview(out)
+        if not data:
+            self._eof = True
+            if self._produced != self._info.file_size or self._crc != self._info.CRC:
+                raise zipfile.BadZipFile("Bad CRC-32 or size for zip member")
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._pending and not self._eof:
+            self._fill()
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        self._pos += n
+        return n
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._info.file_size
+        if offset < self._pos:
+            self._start()
+        while self._pos < offset:
+            if not self._pending:
+                if self._eof:
+                    break
+                self._fill()
+                continue
+            n = min(offset - self._pos, len(self._pending))
+            self._pending = self._pending[n:]
+            self._pos += n
+        return self._pos
+
+    def close(self) -> None:
+        if self._raw is not None:
+            self._raw.close()
+        super().close()
+
+
 # --- Result types for ZipArchiveReader ---
 
 @dataclass
@@ -594,6 +1825,33 @@ class RawExtractionResult:
     member_path: str | None = None
 
 
+@dataclass
+class JsonStreamExtractionResult:
+    """Result of iterating a JSON array member element by element."""
+    found: bool
+    data: Iterator[Any]  # empty iterator when not found
+    member_path: str | None = None
+
+
+@dataclass
+class StreamExtractionResult:
+    """Result of opening a zip member for streaming reads.
+
+    `data` decompresses on demand (a `ZipExtFile`). Use the result as a
+    context manager, or close `data`, once done reading.
+    """
+    found: bool
+    data: IO[bytes]  # empty BytesIO when not found
+    member_path: str | None = None
+
+    def __enter__(self) -> "StreamExtractionResult":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.data.close()
+        return False
+
+
 class ZipArchiveReader:
     """Reads files from a zip archive using cached member inventory.
 
@@ -609,11 +1867,50 @@ class ZipArchiveReader:
     attribute name are retained for backwards compatibility with
     researcher-fork callers and will be renamed in PR 2.
 
+    The archive is opened once, on first access, and the `ZipFile` (with
+    its parsed central directory) is kept for the reader's lifetime.
+    Use the reader as a context manager, or call close(), to release it
+    deterministically. A file-like archive is left open for its owner.
+    Pass `zip_file=validation.zip_file` to reuse the `ZipFile` opened by
+    `validate_zip`, so the central directory is parsed once per flow; the
+    reader takes ownership of it.
+
+    Parsed results of json(), json_all() and csv() are kept in an LRU
+    cache (`parsed_cache`, budget `cache_bytes` of uncompressed member
+    size, 0 disables it), so a member read by several extractors is
+    parsed once. csv() hands every caller its own copy of the cached
+    DataFrame. Parsed JSON is shared between calls: treat `result.data`
+    from json() and json_all() as read-only and copy it before modifying
+    it in place. Errors are counted on the parse that fills the cache,
+    not again on hits.
+
+    `decompressor` selects the deflate backend: None (default) leaves
+    ZIP_DEFLATED members to zipfile's built-in zlib; an Inflater factory
+    such as ZlibInflater routes them through that backend. JsInflater is
+    experimental: no host provides an inflater for it.
+
+    `json_backend` selects how JSON members are parsed: one of
+    JSON_BACKENDS ("stdlib", the default; "host", JSON.parse in the JS
+    runtime, using `json_host` in place of js.JSON if given; "stream",
+    incremental parsing from the member stream), or a callable mapping
+    the member's uncompressed size to one of them, such as
+    JsonBackendBySize. json(), json_all() and json_many() take a
+    per-call `backend` that overrides it. Time spent per backend is
+    accumulated in `json_stats` and logged on close().
+
+    Before a member is read, its central-directory sizes are checked
+    against `limits` (see MemberLimits). Refused members behave like
+    unreadable ones (found, but empty data) and are counted in
+    errors["MemberTooLarge"] or errors["CompressionRatioExceeded"].
+
     Usage:
-        reader = ZipArchiveReader(zip_path, validation.archive_members, errors)
-        result = reader.json("following.json")
-        if result.found:
-            data = result.data  # parsed dict/list
+        with ZipArchiveReader(
+            zip_path, validation.archive_members, errors,
+            zip_file=validation.zip_file,
+        ) as reader:
+            result = reader.json("following.json")
+            if result.found:
+                data = result.data  # parsed dict/list
     """
 
     def __init__(
@@ -621,10 +1918,58 @@ class ZipArchiveReader:
         zip_path: Union[str, IO[bytes]],
         archive_members: list[str],
         errors: Counter,
+        zip_file: zipfile.ZipFile | None = None,
+        cache_bytes: int = PARSED_CACHE_BYTES,
+        limits: MemberLimits | None = None,
+        decompressor: Callable[[], Inflater] | None = None,
+        json_backend: str | Callable[[int], str] = "stdlib",
+        json_host: Any = None,
     ):
         self.zip_path = zip_path
         self.archive_members = archive_members
         self.errors = errors
+        self.parsed_cache = _ParsedCache(cache_bytes)
+        self.limits = limits or MemberLimits()
+        self.decompressor = decompressor
+        self.json_backend = json_backend
+        self.json_host = json_host
+        self.json_stats: dict[str, ParseStats] = {}
+        self._zip_file = zip_file
+        self._index: _MemberIndex | None = None
+
+    def _members(self) -> _MemberIndex:
+        """Return the member index, building it on first lookup."""
+        if self._index is None:
+            self._index = _MemberIndex(self.archive_members)
+        return self._index
+
+    def _zip(self) -> zipfile.ZipFile:
+        """Return the shared ZipFile, opening the archive on first use."""
+        if self._zip_file is None or self._zip_file.fp is None:
+            self._zip_file = zipfile.ZipFile(self.zip_path, "r")
+        return self._zip_file
+
+    def close(self) -> None:
+        """Close the shared ZipFile and drop cached parsed results.
+
+        A later access reopens the archive.
+        """
+        self.parsed_cache.clear()
+        if self._zip_file is not None:
+            if self.json_stats:
+                logger.info("JSON parse time: %s", "; ".join(
+                    f"{name} {stats.calls} members, {stats.bytes} bytes, {stats.seconds:.3f}s"
+                    for name, stats in self.json_stats.items()
+                ))
+            self._zip_file.close()
+            self._zip_file = None
+
+    def __enter__(self) -> "ZipArchiveReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
 
     def resolve_member(self, filename: str) -> str | None:
         """Resolve a filename to an archive member path.
@@ -637,12 +1982,14 @@ class ZipArchiveReader:
         4. Multiple matches → return None, log warning,
            increment errors["AmbiguousMemberMatch"].
         """
+        index = self._members()
+
         # 1. Exact match
-        if filename in self.archive_members:
+        if filename in index.exact:
             return filename
 
         # 2. Path-boundary suffix match
-        matches = [m for m in self.archive_members if m.endswith("/" + filename)]
+        matches = index.suffix_matches(filename)
 
         if len(matches) == 1:
             return matches[0]
@@ -656,52 +2003,279 @@ class ZipArchiveReader:
             self.errors["AmbiguousMemberMatch"] += 1
             return None
 
+    def _stream(self, member_path: str) -> IO[bytes]:
+        """Open a member, inflating deflated ones with the chosen backend."""
+        zf = self._zip()
+        if self.decompressor is None:
+            return zf.open(member_path)
+        info = zf.getinfo(member_path)
+        if info.compress_type != zipfile.ZIP_DEFLATED:
+            return zf.open(info)
+        return io.BufferedReader(_InflatingStream(zf, info, self.decompressor), STREAM_CHUNK_SIZE)
+
+    def _admit(self, member_path: str) -> bool:
+        """Check a member's declared sizes against `limits` before reading.
+
+        Refusals are logged without the member path and counted in
+        errors; a member missing from the directory is admitted so the
+        read itself reports the failure.
+        """
+        try:
+            info = self._zip().getinfo(member_path)
+        except Exception:
+            return True
+        limits = self.limits
+        if info.file_size > limits.max_stream_bytes:
+            logger.warning(
+                "Refused zip member: %d bytes exceeds the limit of %d",
+                info.file_size, limits.max_stream_bytes,
+            )
+            self.errors["MemberTooLarge"] += 1
+            return False
+        if (
+            info.file_size >= limits.min_ratio_check_bytes
+            and info.file_size > limits.max_compression_ratio * max(info.compress_size, 1)
+        ):
+            logger.warning(
+                "Refused zip member: compression ratio %.0f exceeds %.0f",
+                info.file_size / max(info.compress_size, 1), limits.max_compression_ratio,
+            )
+            self.errors["CompressionRatioExceeded"] += 1
+            return False
+        return True
+
     def _read_member_bytes(self, member_path: str) -> io.BytesIO:
-        """Read a specific member from the zip by exact path."""
+        """Read a specific member from the zip by exact path.
+
+        Members over max_materialize_bytes are copied from the stream in
+        chunks, so the bytes are held once rather than twice.
+        """
+        if not self._admit(member_path):
+            return io.BytesIO()
         try:
-            with zipfile.ZipFile(self.zip_path, "r") as zf:
-                return io.BytesIO(zf.read(member_path))
+            if self._member_size(member_path) > self.limits.max_materialize_bytes:
+                out = io.BytesIO()
+                with self._stream(member_path) as f:
+                    shutil.copyfileobj(f, out, STREAM_CHUNK_SIZE)
+                out.seek(0)
+                return out
+            if self.decompressor is None:
+                return io.BytesIO(self._zip().read(member_path))
+            with self._stream(member_path) as f:
+                return io.BytesIO(f.read())
         except Exception as e:
             logger.error("Error reading zip member: %s", type(e).__name__)
             self.errors[type(e).__name__] += 1
             return io.BytesIO()
 
-    def json(self, filename: str) -> JsonExtractionResult:
+    def _member_size(self, member_path: str) -> int:
+        """Uncompressed size of a member, the cost charged to the cache."""
+        try:
+            return self._zip().getinfo(member_path).file_size
+        except Exception:
+            return 0
+
+    def _json_backend_for(self, size: int, backend: str | None) -> str:
+        """Name of the backend that parses a member of `size` bytes."""
+        if backend is None:
+            backend = self.json_backend
+        if callable(backend):
+            backend = backend(size)
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {backend!r}")
+        return backend
+
+    def _parse_member_json(self, member_path: str, backend: str | None = None) -> dict | list:
+        """Parse a JSON member, through the parsed-result cache."""
+        key = (member_path, "json")
+        data = self.parsed_cache.get(key)
+        if data is None:
+            size = self._member_size(member_path)
+            name = self._json_backend_for(size, backend)
+            if size > self.limits.max_materialize_bytes:
+                # Too large to hold as bytes next to the parsed result
+                name = "stream"
+            started = time.perf_counter()
+            if name == "stream":
+                with self._open_member(member_path) as stream:
+                    data = _read_json(stream, _json_reader_stream, errors=self.errors) if stream.read(1) else {}
+            else:
+                raw = self._read_member_bytes(member_path).read()
+                reader = (
+                    functools.partial(_json_reader_host, host=self.json_host)
+                    if name == "host" else _json_reader_bytes
+                )
+                # Call _read_json directly (intentional — avoids BytesIO re-wrapping)
+                data = _read_json(raw, reader, errors=self.errors) if raw else {}
+            stats = self.json_stats.setdefault(name, ParseStats())
+            stats.calls += 1
+            stats.bytes += size
+            stats.seconds += time.perf_counter() - started
+            self.parsed_cache.put(key, data, size)
+        return data
+
+    def _open_member(self, member_path: str) -> IO[bytes]:
+        """Open a specific member from the zip by exact path for streaming."""
+        if not self._admit(member_path):
+            return io.BytesIO()
+        try:
+            return self._stream(member_path)
+        except Exception as e:
+            logger.error("Error opening zip member: %s", type(e).__name__)
+            self.errors[type(e).__name__] += 1
+            return io.BytesIO()
+
+    def _in_archive_order(self, members: list[str]) -> list[str]:
+        """Unique members sorted by local-header offset, small ones prefetched.
+
+        Reading in this order turns a batch into one forward pass over the
+        archive: sequential slices that combine with the adapter's
+        read-ahead rather than seeks back and forth across the upload.
+        """
+        unique = list(dict.fromkeys(members))
+        try:
+            zf = self._zip()
+            unique.sort(key=lambda m: zf.getinfo(m).header_offset)
+        except Exception as e:
+            logger.debug("Archive order unavailable: %s", type(e).__name__)
+        self._prefetch_members(unique)
+        return unique
+
+    def _prefetch_members(self, members: list[str]) -> None:
+        """Fetch several small members' bytes in one round-trip.
+
+        Only applies when the archive exposes read_ranges (AsyncFileAdapter):
+        the local headers and compressed data land in its block cache, so
+        the per-member reads that follow never cross the JS boundary.
+        Purely an optimization — failures are logged and ignored.
+        """
+        read_ranges = getattr(self.zip_path, "read_ranges", None)
+        if read_ranges is None or len(members) < 2:
+            return
+        try:
+            zf = self._zip()
+            infos = [zf.getinfo(m) for m in members]
+            read_ranges([
+                _member_span(info) for info in infos
+                if info.compress_size <= PREFETCH_MEMBER_MAX_BYTES
+            ])
+        except Exception as e:
+            logger.debug("Member prefetch skipped: %s", type(e).__name__)
+
+    def json(self, filename: str, backend: str | None = None) -> JsonExtractionResult:
         """Extract and parse a JSON file.
 
         Returns JsonExtractionResult(found=False, data={}) if member
         not in archive. Skips JSON parsing entirely when not found.
+        `backend` overrides the reader's json_backend for this call.
         """
         member = self.resolve_member(filename)
         if member is None:
             return JsonExtractionResult(found=False, data={})
 
-        b = self._read_member_bytes(member)
-        raw = b.read()
-        if not raw:
-            return JsonExtractionResult(found=True, data={}, member_path=member)
-
-        # Call _read_json directly (intentional — avoids BytesIO re-wrapping)
-        data = _read_json(raw, _json_reader_bytes, errors=self.errors)
+        data = self._parse_member_json(member, backend)
         return JsonExtractionResult(found=True, data=data, member_path=member)
 
-    def json_all(self, pattern: str) -> list[JsonExtractionResult]:
+    def json_all(self, pattern: str, backend: str | None = None) -> list[JsonExtractionResult]:
         """Extract and parse all JSON files matching a regex pattern.
 
         Returns results sorted lexicographically by member path.
         Used for paginated exports (post_comments_1.json, _2.json, etc.).
         """
-        matches = sorted(m for m in self.archive_members if re.search(pattern, m))
-        results = []
-        for member in matches:
-            b = self._read_member_bytes(member)
-            raw = b.read()
-            if not raw:
-                results.append(JsonExtractionResult(found=True, data={}, member_path=member))
-                continue
-            data = _read_json(raw, _json_reader_bytes, errors=self.errors)
-            results.append(JsonExtractionResult(found=True, data=data, member_path=member))
-        return results
+        matches = self._members().search(pattern)
+        parsed = {
+            member: self._parse_member_json(member, backend)
+            for member in self._in_archive_order(matches)
+        }
+        return [
+            JsonExtractionResult(found=True, data=parsed[member], member_path=member)
+            for member in matches
+        ]
+
+    def json_many(self, filenames: Iterable[str], backend: str | None = None) -> dict[str, JsonExtractionResult]:
+        """Extract and parse several JSON files in one forward pass.
+
+        Each filename is resolved as in json(); the members are then read
+        in order of their local-header offset, so the archive is traversed
+        front to back instead of in the caller's order. Returns a
+        JsonExtractionResult per requested filename, in request order.
+        """
+        resolved = {name: self.resolve_member(name) for name in filenames}
+        members = [m for m in resolved.values() if m is not None]
+        parsed = {m: self._parse_member_json(m, backend) for m in self._in_archive_order(members)}
+        return {
+            name: JsonExtractionResult(found=True, data=parsed[member], member_path=member)
+            if member is not None else JsonExtractionResult(found=False, data={})
+            for name, member in resolved.items()
+        }
+
+    def read_many(self, filenames: Iterable[str]) -> dict[str, RawExtractionResult]:
+        """Extract raw bytes of several members in one forward pass.
+
+        The offset-ordered counterpart of raw(); see json_many().
+        """
+        resolved = {name: self.resolve_member(name) for name in filenames}
+        members = [m for m in resolved.values() if m is not None]
+        contents = {m: self._read_member_bytes(m).getvalue() for m in self._in_archive_order(members)}
+        return {
+            name: RawExtractionResult(found=True, data=io.BytesIO(contents[member]), member_path=member)
+            if member is not None else RawExtractionResult(found=False, data=io.BytesIO())
+            for name, member in resolved.items()
+        }
+
+    def iter_json(self, filename: str, path: str | tuple[str, ...] = ()) -> JsonStreamExtractionResult:
+        """Iterate a JSON array member one element at a time.
+
+        The member is streamed and tokenized incrementally, so peak memory
+        is bounded by one element rather than the whole document. `path`
+        is a key, or a tuple of keys, leading from the top-level object to
+        the array (e.g. "Browser History"). Keys are only followed through
+        objects: an array reached before the path is exhausted is iterated
+        as is, so exports with and without the wrapping object both work.
+        A missing key or non-array target yields nothing.
+
+        Returns JsonStreamExtractionResult(found=False, data=iter(())) if
+        member not in archive. Malformed JSON stops the iteration and
+        increments errors["JSONDecodeError"]; elements already yielded
+        stay valid.
+        """
+        member = self.resolve_member(filename)
+        if member is None:
+            return JsonStreamExtractionResult(found=False, data=iter(()))
+        keys = (path,) if isinstance(path, str) else tuple(path)
+        return JsonStreamExtractionResult(
+            found=True,
+            data=self._iter_member(member, lambda stream: _JsonArrayReader(stream).items(keys)),
+            member_path=member,
+        )
+
+    def js_assignment(self, filename: str) -> JsonStreamExtractionResult:
+        """Iterate the array of an X/Twitter export .js member.
+
+        The `window.YTD.<name>.part0 = ` prefix is skipped without
+        decoding it, and the array after it is streamed element by element
+        as in iter_json(); see iter_js_assignment().
+
+        Returns JsonStreamExtractionResult(found=False, data=iter(())) if
+        member not in archive. Malformed content stops the iteration and
+        increments errors["JSONDecodeError"].
+        """
+        member = self.resolve_member(filename)
+        if member is None:
+            return JsonStreamExtractionResult(found=False, data=iter(()))
+        return JsonStreamExtractionResult(
+            found=True, data=self._iter_member(member, iter_js_assignment), member_path=member,
+        )
+
+    def _iter_member(self, member_path: str, items: Callable[[IO[bytes]], Iterator[Any]]) -> Iterator[Any]:
+        stream = self._open_member(member_path)
+        try:
+            yield from items(stream)
+        except Exception as e:
+            logger.error("Could not iterate json member: %s", type(e).__name__)
+            self.errors[type(e).__name__] += 1
+        finally:
+            stream.close()
 
     def csv(self, filename: str) -> CsvExtractionResult:
         """Extract and parse a CSV file.
@@ -713,20 +2287,44 @@ class ZipArchiveReader:
         if member is None:
             return CsvExtractionResult(found=False, data=pd.DataFrame())
 
-        b = self._read_member_bytes(member)
-        if not b.getvalue():
-            return CsvExtractionResult(found=True, data=pd.DataFrame(), member_path=member)
-
-        df = read_csv_from_bytes_to_df(b)
-        return CsvExtractionResult(found=True, data=df, member_path=member)
+        key = (member, "csv")
+        df = self.parsed_cache.get(key)
+        if df is None:
+            # Rows are decoded straight from the decompressing stream; an
+            # empty member yields an empty DataFrame.
+            with self._open_member(member) as stream:
+                df = read_csv_from_bytes_to_df(stream)
+            self.parsed_cache.put(key, df, self._member_size(member))
+        # Callers own their table: extractors return it as a data_frame
+        # and may modify it in place, which must not reach the cache.
+        return CsvExtractionResult(found=True, data=df.copy(), member_path=member)
+
+    def open(self, filename: str) -> StreamExtractionResult:
+        """Open a zip member for streaming reads, without materializing it.
+
+        Returns StreamExtractionResult(found=False, data=io.BytesIO())
+        if member not in archive. Peak memory is bounded by what the
+        caller keeps, not by the member size; prefer this over raw()
+        for large text, CSV and HTML members.
+
+        Usage:
+            with reader.open("Bookmarks.html") as result:
+                if result.found:
+                    for chunk in iter(lambda: result.data.read(STREAM_CHUNK_SIZE), b""):
+                        ...
+        """
+        member = self.resolve_member(filename)
+        if member is None:
+            return StreamExtractionResult(found=False, data=io.BytesIO())
+        return StreamExtractionResult(found=True, data=self._open_member(member), member_path=member)
 
     def raw(self, filename: str) -> RawExtractionResult:
         """Extract raw bytes from a zip member.
 
         Returns RawExtractionResult(found=False, data=io.BytesIO())
-        if member not in archive. Used for HTML (Chrome bookmarks),
-        text files (WhatsApp), and .js files (X — caller applies
-        bytesio_to_listdict for JS prefix stripping).
+        if member not in archive. Used for text files (WhatsApp) and
+        other members that need pre-processing before parsing; X .js
+        files are read with js_assignment().
         """
         member = self.resolve_member(filename)
         if member is None:
@@ -11,6 +11,7 @@ import logging
 
 import port.api.props as props
 import port.api.d3i_props as d3i_props
+from port.api.file_utils import IOStats
 import port.helpers.port_helpers as ph
 import port.helpers.validate as validate
 import port.helpers.uploads as uploads
@@ -105,6 +106,8 @@ class FlowBuilder:
             else:
                 yield from ph.emit_log("info", f"[{self.platform_name}] Validation: invalid")
 
+            io_after_validation = yield from self._emit_io_stats(archive, "validation")
+
             # 4. If invalid → retry prompt
             if status != 0:
                 logger.info("Invalid %s file; prompting retry", self.platform_name)
@@ -116,13 +119,19 @@ class FlowBuilder:
 
             # 5. Extract
             logger.info("Extracting data for %s", self.platform_name)
-            raw_result = self.extract_data(archive, validation)
-            if isinstance(raw_result, Generator):
-                result = yield from raw_result
-            else:
-                result = raw_result
+            try:
+                raw_result = self.extract_data(archive, validation)
+                if isinstance(raw_result, Generator):
+                    result = yield from raw_result
+                else:
+                    result = raw_result
+            finally:
+                # Release the ZipFile kept open by validation if no
+                # ZipArchiveReader took it over (or the flow was abandoned)
+                validation.close_zip_file()
 
             # 6. Log extraction summary (PII-free: counts only)
+            yield from self._emit_io_stats(archive, "extraction", since=io_after_validation)
             total_rows = sum(len(t.data_frame) for t in result.tables)
             if result.errors:
                 error_summary = ", ".join(f"{k}×{v}" for k, v in result.errors.items())
@@ -173,6 +182,24 @@ class FlowBuilder:
 
         yield from ph.emit_log("info", f"[{self.platform_name}] Donation result: success")
 
+    def _emit_io_stats(self, archive, stage: str, since: IOStats | None = None):
+        """Emit the upload's JS I/O counters as a PII-free milestone.
+
+        Only AsyncFileAdapter uploads carry io_stats; anything else emits
+        nothing. With `since`, the counters are reported as a delta so the
+        extraction milestone excludes validation traffic.
+
+        Returns:
+            IOStats | None: A snapshot of the cumulative counters.
+        """
+        stats = getattr(archive, "io_stats", None)
+        if not isinstance(stats, IOStats):
+            return None
+        snapshot = stats.copy()
+        delta = snapshot - since if since is not None else snapshot
+        yield from ph.emit_log("info", f"[{self.platform_name}] IO after {stage}: {delta.summary(archive.size)}")
+        return snapshot
+
     # Methods to be overridden by platform-specific implementations
     def generate_file_prompt(self):
         """Generate platform-specific file prompt."""
@@ -126,6 +126,12 @@ class ValidateInput:
     # must not appear in logs, host milestones, or donation payloads.
     archive_members: list[str] = field(default_factory=list, repr=False)
 
+    # The ZipFile opened during validation, kept open on success when
+    # validate_zip(keep_open=True) so its parsed central directory can be
+    # handed to ZipArchiveReader instead of being read and parsed a
+    # second time. Internal only; release it with close_zip_file().
+    zip_file: zipfile.ZipFile | None = field(default=None, repr=False, compare=False)
+
     ddp_categories_lookup: dict[str, DDPCategory] = field(init=False)
     status_codes_lookup: dict[int, StatusCode] = field(init=False)
 
@@ -162,6 +168,20 @@ class ValidateInput:
             self.current_ddp_category = DDPCategory(id = "unknown", ddp_filetype=DDPFiletype.UNKOWN, language=Language.UNKNOWN, known_files=[])
             return False
 
+    def close_zip_file(self) -> None:
+        """
+        Close the ZipFile kept open during validation, if any.
+
+        Safe to call more than once, and after a ZipArchiveReader that
+        took the ZipFile over has closed it.
+
+        Examples:
+            >>> validator.close_zip_file()
+        """
+        if self.zip_file is not None:
+            self.zip_file.close()
+            self.zip_file = None
+
     def set_current_status_code_by_id(self, id: int) -> None:
         """
         Set the status code based on the provided ID.
@@ -206,6 +226,7 @@ class ValidateInput:
 def validate_zip(
     ddp_categories: list[DDPCategory],
     path_to_zip: Union[str, IO[bytes]],
+    keep_open: bool = False,
 ) -> ValidateInput:
     """
     Validates a DDP zip archive against a list of DDP categories.
@@ -226,10 +247,16 @@ def validate_zip(
             heap. The parameter name is retained for backwards compatibility
             with researcher-fork callers; PR 2 (type tightening) will rename
             this to `archive`.
+        keep_open (bool): Keep the `ZipFile` open on success instead of
+            closing it, for handing over to `ZipArchiveReader`.
 
     Returns:
         ValidateInput: An instance of ValidateInput containing the
-            validation results.
+            validation results. With `keep_open` and on success, its
+            `zip_file` holds the open `ZipFile`, to be passed on to
+            `ZipArchiveReader(zip_file=...)`, which takes ownership and
+            closes it. The caller closes it with `close_zip_file()` when
+            no reader takes it over; `FlowBuilder` does so after extraction.
 
     Raises:
         zipfile.BadZipFile: This exception is caught internally and results
@@ -244,7 +271,8 @@ def validate_zip(
 
     try:
         paths = []
-        with zipfile.ZipFile(path_to_zip, "r") as zf:
+        zf = zipfile.ZipFile(path_to_zip, "r")
+        try:
             all_members = zf.namelist()
             for f in all_members:
                 p = Path(f)
@@ -252,7 +280,11 @@ def validate_zip(
                 paths.append(p.name)
             validate.archive_members = all_members
 
-        validate.infer_ddp_category(paths)
+            if validate.infer_ddp_category(paths) and keep_open:
+                validate.zip_file = zf
+        finally:
+            if validate.zip_file is None:
+                zf.close()
     except zipfile.BadZipFile:
         validate.set_current_status_code_by_id(1)
 
@@ -4,7 +4,7 @@ import datetime
 from collections.abc import Generator
 
 from port.api.commands import CommandSystemExit, CommandUIRender, CommandSystemDonate
-from port.api.file_utils import AsyncFileAdapter
+from port.api.file_utils import AsyncFileAdapter, TAIL_PREFETCH_BYTES
 from port.script import process
 import port.api.props as props
 
@@ -65,9 +65,11 @@ class ScriptWrapper(Generator):
             except StopIteration:
                 return CommandSystemExit(0, "End of script").toDict()
 
-        # Automatically wrap JS file readers with AsyncFileAdapter
+        # Automatically wrap JS file readers with AsyncFileAdapter. The
+        # zip directory at the end of the upload is fetched once and
+        # pinned, so validation and extraction never re-read it.
         if data and getattr(data, "__type__", None) == "PayloadFile":
-            data.value = AsyncFileAdapter(data.value)
+            data.value = AsyncFileAdapter(data.value, tail_prefetch=TAIL_PREFETCH_BYTES)
 
         try:
             command = self.script.send(data)
@@ -43,39 +43,46 @@ DDP_CATEGORIES = [
 ]
 
 
+def _create_time(value: str, errors: Counter) -> float | None:
+    """Epoch seconds of a message; find_item renders a JSON null as "None"."""
+    if value in ("", "None"):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        logger.error("Could not convert create_time")
+        errors["TimestampParseError"] += 1
+        return None
+
+
 def conversations_to_df(reader: ZipArchiveReader, errors: Counter)  -> pd.DataFrame:
-    result = reader.json("conversations.json")
+    result = reader.iter_json("conversations.json")
     if not result.found:
         return pd.DataFrame()
-    conversations = result.data
 
-    datapoints = []
+    table = eh.TableBuilder({
+        "conversation title": str, "role": str, "message": str, "model": str, "time": float,
+    })
     out = pd.DataFrame()
 
     try:
-        for conversation in conversations:
+        for conversation in result.data:
             title = conversation["title"]
             for _, turn in conversation["mapping"].items():
 
-                denested_d = eh.dict_denester(turn)
+                denested_d = eh.DenestedRecord(turn)
                 is_hidden = eh.find_item(denested_d, "is_visually_hidden_from_conversation")
                 if is_hidden != "True":
                     role = eh.find_item(denested_d, "role")
                     message = "".join(eh.find_items(denested_d, "part"))
                     model = eh.find_item(denested_d, "-model_slug")
-                    time = eh.epoch_to_iso(eh.find_item(denested_d, "create_time"), errors=errors)
-
-                    datapoint = {
-                        "conversation title": title,
-                        "role": role,
-                        "message": message,
-                        "model": model,
-                        "time": time,
-                    }
+                    time = _create_time(eh.find_item(denested_d, "create_time"), errors)
+
                     if role != "":
-                        datapoints.append(datapoint)
+                        table.append(title, role, message, model, time)
 
-        out = pd.DataFrame(datapoints)
+        out = table.frame()
+        out["time"] = eh.epoch_to_datetime_column(out["time"], errors=errors)
 
     except Exception as e:
         logger.error("Data extraction error: %s", e)
@@ -90,32 +97,32 @@ def extraction(chatgpt_zip: str, validation) -> ExtractionResult:
     Add your table definitions below in the list
     """
     errors = Counter()
-    reader = ZipArchiveReader(chatgpt_zip, validation.archive_members, errors)
-    tables = [
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="chatgpt_conversations",
-            data_frame=conversations_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your conversations with ChatGPT",
-                "nl": "Uw gesprekken met ChatGPT"
-            }),
-            description=props.Translatable({
-                "en": "In this table you find your conversations with ChatGPT sorted by time. Below, you find a wordcloud, where the size of the words represents how frequent these words have been used in the conversations.", 
-                "nl": "In this table you find your conversations with ChatGPT sorted by time. Below, you find a wordcloud, where the size of the words represents how frequent these words have been used in the conversations.", 
-            }),
-            visualizations=[
-                {
-                    "title": {
-                        "en": "Your messages in a wordcloud", 
-                        "nl": "Your messages in a wordcloud"
-                    },
-                    "type": "wordcloud",
-                    "textColumn": "message",
-                    "tokenize": True,
-                }
-            ]
-        ),
-    ]
+    with ZipArchiveReader(chatgpt_zip, validation.archive_members, errors, zip_file=validation.zip_file) as reader:
+        tables = [
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="chatgpt_conversations",
+                data_frame=conversations_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your conversations with ChatGPT",
+                    "nl": "Uw gesprekken met ChatGPT"
+                }),
+                description=props.Translatable({
+                    "en": "In this table you find your conversations with ChatGPT sorted by time. Below, you find a wordcloud, where the size of the words represents how frequent these words have been used in the conversations.", 
+                    "nl": "In this table you find your conversations with ChatGPT sorted by time. Below, you find a wordcloud, where the size of the words represents how frequent these words have been used in the conversations.", 
+                }),
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "Your messages in a wordcloud", 
+                            "nl": "Your messages in a wordcloud"
+                        },
+                        "type": "wordcloud",
+                        "textColumn": "message",
+                        "tokenize": True,
+                    }
+                ]
+            ),
+        ]
 
     tables_to_render = [table for table in tables if not table.data_frame.empty]
 
@@ -131,7 +138,7 @@ class ChatGPTFlow(FlowBuilder):
         super().__init__(session_id, "ChatGPT")
         
     def validate_file(self, file):
-        return validate.validate_zip(DDP_CATEGORIES, file)
+        return validate.validate_zip(DDP_CATEGORIES, file, keep_open=True)
         
     def extract_data(self, file_value, validation):
         return extraction(file_value, validation)
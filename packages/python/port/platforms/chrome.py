@@ -8,7 +8,9 @@ It handles DDPs in English and Dutch with filetype JSON.
 """
 from collections import Counter
 from html.parser import HTMLParser
+import io
 import logging
+from typing import Iterable
 
 import pandas as pd
 
@@ -73,11 +75,15 @@ class _BookmarkParser(HTMLParser):
 
     def __init__(self):
         super().__init__()
-        self.links: list[tuple[str, str]] = []
+        self.links = eh.TableBuilder(["Bookmark", "URL"])
         self._current_href: str | None = None
         self._current_text = ""
+        # True while consecutive handle_data calls belong to one text run;
+        # chunked feed() may split a run across calls.
+        self._in_text = False
 
     def handle_starttag(self, tag, attrs):
+        self._in_text = False
         if tag == "a":
             attrs_dict = dict(attrs)
             self._current_href = attrs_dict.get("href", "")
@@ -85,39 +91,41 @@ class _BookmarkParser(HTMLParser):
 
     def handle_data(self, data):
         if self._current_href is not None:
-            self._current_text = data
+            self._current_text = self._current_text + data if self._in_text else data
+        self._in_text = True
 
     def handle_endtag(self, tag):
+        self._in_text = False
         if tag == "a" and self._current_href is not None:
-            self.links.append((self._current_text, self._current_href))
+            self.links.append(self._current_text, self._current_href)
             self._current_href = None
 
 
 def browser_history_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     """Extract browser history from History.json, BrowserHistory.json, or Geschiedenis.json (NL)."""
 
-    d: dict | list = {}
+    items: Iterable = ()
     for filename in ("Geschiedenis.json", "BrowserHistory.json", "History.json"):
-        result = reader.json(filename)
+        result = reader.iter_json(filename, path="Browser History")
         if result.found:
-            d = result.data
+            items = result.data
             break
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder({"Title": str, "URL": str, "Transition": str, "Date": int})
 
     try:
-        items = d["Browser History"]  # type: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 item.get("title", None),
                 item.get("url", None),
                 item.get("page_transition_qualifier") or item.get("page_transition"),
-                eh.epoch_to_iso(item.get("time_usec", 0) / 1_000_000, errors=errors),
-            ))
+                item.get("time_usec", 0),
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Title", "URL", "Transition", "Date"])
+        out = table.frame()
         out = out.sort_values("Date", ascending=False).head(10_000).reset_index(drop=True)
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors, unit="us")
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -128,19 +136,20 @@ def browser_history_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataF
 def bookmarks_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     """Extract bookmarks from Bookmarks.html."""
 
-    result = reader.raw("Bookmarks.html")
-    if not result.found:
-        return pd.DataFrame()
     out = pd.DataFrame()
-
-    try:
-        html_content = result.data.read().decode("utf-8", errors="replace")
-        parser = _BookmarkParser()
-        parser.feed(html_content)
-        out = pd.DataFrame(parser.links, columns=["Bookmark", "URL"])
-    except Exception as e:
-        logger.error("Exception caught: %s", e)
-        errors[type(e).__name__] += 1
+    with reader.open("Bookmarks.html") as result:
+        if not result.found:
+            return out
+
+        try:
+            html = io.TextIOWrapper(result.data, encoding="utf-8", errors="replace")
+            parser = _BookmarkParser()
+            while chunk := html.read(eh.STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+            out = parser.links.frame()
+        except Exception as e:
+            logger.error("Exception caught: %s", e)
+            errors[type(e).__name__] += 1
 
     return out
 
@@ -156,18 +165,18 @@ def omnibox_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
             break
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder({"Title": str, "Number of visits": int, "URL": str})
 
     try:
         items = d["Typed Url"]  # type: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 item.get("title", None),
                 len(item.get("visits", [])),
                 item.get("url", None),
-            ))
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Title", "Number of visits", "URL"])
+        out = table.frame()
         out = out.sort_values(by="Number of visits", ascending=False).reset_index(drop=True)
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -178,68 +187,68 @@ def omnibox_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
 def extraction(chrome_zip: str, validation) -> ExtractionResult:
     errors = Counter()
-    reader = ZipArchiveReader(chrome_zip, validation.archive_members, errors)
-    tables = [
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="chrome_browser_history",
-            data_frame=browser_history_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Chrome browser history",
-                "nl": "Chrome browsergeschiedenis",
-            }),
-            description=props.Translatable({
-                "en": "The websites you have visited using Chrome",
-                "nl": "De websites die u heeft bezocht met Chrome",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Transition": props.Translatable({"en": "Transition type", "nl": "Transitietype"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-            },
-            visualizations=[
-                {
-                    "title": {"en": "Most visited websites", "nl": "Meest bezochte websites"},
-                    "type": "wordcloud",
-                    "textColumn": "URL",
-                    "tokenize": False,
-                }
-            ],
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="chrome_bookmarks",
-            data_frame=bookmarks_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Chrome bookmarks",
-                "nl": "Chrome bladwijzers",
-            }),
-            description=props.Translatable({
-                "en": "Websites you have bookmarked in Chrome",
-                "nl": "Websites die u heeft opgeslagen als bladwijzer in Chrome",
-            }),
-            headers={
-                "Bookmark": props.Translatable({"en": "Bookmark", "nl": "Bladwijzer"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="chrome_omnibox",
-            data_frame=omnibox_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Chrome address bar history",
-                "nl": "Chrome adresbalk geschiedenis",
-            }),
-            description=props.Translatable({
-                "en": "URLs you have typed directly into the Chrome address bar",
-                "nl": "URLs die u direct in de Chrome adresbalk heeft ingevoerd",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Number of visits": props.Translatable({"en": "Number of visits", "nl": "Aantal bezoeken"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-            },
-        ),
-    ]
+    with ZipArchiveReader(chrome_zip, validation.archive_members, errors, zip_file=validation.zip_file) as reader:
+        tables = [
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="chrome_browser_history",
+                data_frame=browser_history_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Chrome browser history",
+                    "nl": "Chrome browsergeschiedenis",
+                }),
+                description=props.Translatable({
+                    "en": "The websites you have visited using Chrome",
+                    "nl": "De websites die u heeft bezocht met Chrome",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Transition": props.Translatable({"en": "Transition type", "nl": "Transitietype"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                },
+                visualizations=[
+                    {
+                        "title": {"en": "Most visited websites", "nl": "Meest bezochte websites"},
+                        "type": "wordcloud",
+                        "textColumn": "URL",
+                        "tokenize": False,
+                    }
+                ],
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="chrome_bookmarks",
+                data_frame=bookmarks_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Chrome bookmarks",
+                    "nl": "Chrome bladwijzers",
+                }),
+                description=props.Translatable({
+                    "en": "Websites you have bookmarked in Chrome",
+                    "nl": "Websites die u heeft opgeslagen als bladwijzer in Chrome",
+                }),
+                headers={
+                    "Bookmark": props.Translatable({"en": "Bookmark", "nl": "Bladwijzer"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="chrome_omnibox",
+                data_frame=omnibox_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Chrome address bar history",
+                    "nl": "Chrome adresbalk geschiedenis",
+                }),
+                description=props.Translatable({
+                    "en": "URLs you have typed directly into the Chrome address bar",
+                    "nl": "URLs die u direct in de Chrome adresbalk heeft ingevoerd",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Number of visits": props.Translatable({"en": "Number of visits", "nl": "Aantal bezoeken"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                },
+            ),
+        ]
 
     return ExtractionResult(
         tables=[table for table in tables if not table.data_frame.empty],
@@ -252,7 +261,7 @@ class ChromeFlow(FlowBuilder):
         super().__init__(session_id, "Chrome")
 
     def validate_file(self, file):
-        return validate.validate_zip(DDP_CATEGORIES, file)
+        return validate.validate_zip(DDP_CATEGORIES, file, keep_open=True)
 
     def extract_data(self, file_value, validation):
         return extraction(file_value, validation)
@@ -9,6 +9,7 @@ It handles DDPs in the english language with filetype JSON.
 
 import logging
 from collections import Counter
+from typing import Iterable
 
 import pandas as pd
 
@@ -48,17 +49,18 @@ def who_youve_followed_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.Da
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Name", "Timestamp"])
 
     try:
         items = d["following_v3"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("name", "")),
-                eh.epoch_to_iso(item.get("timestamp", {}), errors=errors)
-            ))
+                item.get("timestamp", {})
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Name", "Timestamp"]) #pyright: ignore
+        out = table.frame()
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -75,15 +77,15 @@ def news_your_locations_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.D
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Location"])
 
     try:
         items = d["news_your_locations_v2"]  # pyright: ignore
         for item in items:
-            datapoints.append(
+            table.append(
                 item
             )
-        out = pd.DataFrame(datapoints, columns=["Location"]) #pyright: ignore
+        out = table.frame()
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -92,6 +94,16 @@ def news_your_locations_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.D
     return out
 
 
+# Key globs ("**.*text*") keep find_item's matching on key names containing
+# the text, as export keys vary between versions.
+NOTIFICATION_COLUMNS = eh.PathExtractor({
+    "Text": "**.*text*",
+    "Link": "**.*href*",
+    "Read": "**.*unread*",
+    "Date": "**.*timestamp*",
+})
+
+
 def notifications_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     result = reader.json("notifications/notifications.json")
@@ -100,20 +112,11 @@ def notifications_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFra
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         items = d["notifications_v2"]  # pyright: ignore
-        for item in items:
-            denested_dict = eh.dict_denester(item)
-            datapoints.append((
-                eh.find_item(denested_dict, "text"),
-                eh.find_item(denested_dict, "href"),
-                eh.find_item(denested_dict, "unread"),
-                eh.epoch_to_iso(eh.find_item(denested_dict, "timestamp"), errors=errors),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Text", "Link", "Read", "Date"]) #pyright: ignore
+        out = NOTIFICATION_COLUMNS.frame(items)
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -122,6 +125,12 @@ def notifications_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFra
     return out
 
 
+CONTENT_SHARING_COLUMNS = eh.PathExtractor({
+    "Link": "**.*href*",
+    "Date": "**.*timestamp*",
+})
+
+
 def content_sharing_you_have_created_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     result = reader.json("content_sharing_links_you_have_created.json")
@@ -130,17 +139,10 @@ def content_sharing_you_have_created_to_df(reader: ZipArchiveReader, errors: Cou
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
-        for item in d:
-            denested_dict = eh.dict_denester(item)
-            datapoints.append((
-                eh.find_item(denested_dict, "href"),
-                eh.epoch_to_iso(eh.find_item(denested_dict, "timestamp"), errors=errors),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Link", "Date"]) #pyright: ignore
+        out = CONTENT_SHARING_COLUMNS.frame(d)
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -149,6 +151,12 @@ def content_sharing_you_have_created_to_df(reader: ZipArchiveReader, errors: Cou
     return out
 
 
+REELS_USAGE_COLUMNS = eh.PathExtractor({
+    "Reel interaction": "**.*label*",
+    "Value": "**.*value*",
+})
+
+
 def facebook_reels_usage_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     result = reader.json("facebook_reels_usage_information.json")
@@ -157,19 +165,11 @@ def facebook_reels_usage_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         items = d.get("label_values", []) #pyright: ignore
         d = items[0]
-        for item in d["dict"]:
-            denested_dict = eh.dict_denester(item)
-            datapoints.append((
-                eh.find_item(denested_dict, "label"),
-                eh.find_item(denested_dict, "value"),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Reel interaction", "Value"]) #pyright: ignore
+        out = REELS_USAGE_COLUMNS.frame(d["dict"])
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -178,6 +178,10 @@ def facebook_reels_usage_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.
     return out
 
 
+# Any key starting with "value" below the top level.
+LAST_28_DAYS_COLUMNS = eh.PathExtractor({"Count": "*.**.value*"})
+
+
 def last_28_days_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     result = reader.json("your_facebook_watch_activity_in_the_last_28_days.json")
@@ -186,15 +190,9 @@ def last_28_days_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFram
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
-        denested_dict = eh.dict_denester(d)
-        datapoints.append((
-            eh.find_item(denested_dict, "-value"),
-        ))
-
-        out = pd.DataFrame(datapoints, columns=["Count"]) #pyright: ignore
+        out = LAST_28_DAYS_COLUMNS.frame([d])
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -203,6 +201,12 @@ def last_28_days_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFram
     return out
 
 
+SEARCH_HISTORY_COLUMNS = eh.PathExtractor({
+    "Search term": "**.*text*",
+    "Date": "**.*timestamp*",
+})
+
+
 def your_search_history_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     result = reader.json("logged_information/search/your_search_history.json")
@@ -211,19 +215,12 @@ def your_search_history_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.D
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         items = d["searches_v2"]  # pyright: ignore
-        for item in items:
-            denested_dict = eh.dict_denester(item)
-
-            datapoints.append((
-                eh.fix_latin1_string(eh.find_item(denested_dict, "text")),
-                eh.epoch_to_iso(eh.find_item(denested_dict, "timestamp"), errors=errors),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Search term", "Date"]) #pyright: ignore
+        out = SEARCH_HISTORY_COLUMNS.frame(items)
+        out["Search term"] = out["Search term"].map(eh.fix_latin1_string)
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -240,13 +237,13 @@ def your_friends_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFram
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder({"Number of friends": int})
 
     try:
         items = d["friends_v2"]  # pyright: ignore
-        datapoints.append((len(items)))
+        table.append(len(items))
 
-        out = pd.DataFrame(datapoints, columns=["Number of friends"]) #pyright: ignore
+        out = table.frame()
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -263,15 +260,15 @@ def ads_interests_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFra
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Ad"])
 
     try:
         items = d["topics_v2"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item),
-            ))
-        out = pd.DataFrame(datapoints, columns=["Ad"]) #pyright: ignore
+            )
+        out = table.frame()
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -287,7 +284,7 @@ def recently_viewed_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataF
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Category", "Name", "Link", "Date"])
 
     try:
         items = d["recently_viewed"] # pyright: ignore
@@ -295,25 +292,26 @@ def recently_viewed_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataF
 
             if "entries" in item:
                 for entry in item["entries"]:
-                    datapoints.append((
+                    table.append(
                         eh.fix_latin1_string(item.get("name", "")),
                         eh.fix_latin1_string(entry.get("data", {}).get("name", "")),
                         entry.get("data", {}).get("uri", ""),
-                        eh.epoch_to_iso(entry.get("timestamp", ""), errors=errors)
-                    ))
+                        entry.get("timestamp", "")
+                    )
 
             # The nesting goes deeper
             if "children" in item:
                 for child in item["children"]:
                     for entry in child["entries"]:
-                        datapoints.append((
+                        table.append(
                             eh.fix_latin1_string(child.get("name", "")),
                             eh.fix_latin1_string(entry.get("data", {}).get("name", "")),
                             entry.get("data", {}).get("uri", ""),
-                            eh.epoch_to_iso(entry.get("timestamp", ""), errors=errors)
-                        ))
+                            entry.get("timestamp", "")
+                        )
 
-        out = pd.DataFrame(datapoints, columns=["Category", "Name", "Link", "Date"]) #pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -329,21 +327,22 @@ def recently_visited_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.Data
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Category", "Name", "Link", "Date"])
 
     try:
         items = d["visited_things_v2"]  # pyright: ignore
         for item in items:
             if "entries" in item:
                 for entry in item["entries"]:
-                    datapoints.append((
+                    table.append(
                         item.get("name", ""),
                         eh.fix_latin1_string(entry.get("data", {}).get("name", "")),
                         entry.get("data", {}).get("uri", ""),
-                        eh.epoch_to_iso(entry.get("timestamp", ""), errors=errors)
-                    ))
+                        entry.get("timestamp", "")
+                    )
 
-        out = pd.DataFrame(datapoints, columns=["Category", "Name", "Link", "Date"]) #pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -359,17 +358,18 @@ def profile_update_history_to_df(reader: ZipArchiveReader, errors: Counter) -> p
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Title", "Timestamp"])
 
     try:
         items = d["profile_updates_v2"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("title", "")),
-                eh.epoch_to_iso(item.get("timestamp", ""), errors=errors)
-            ))
+                item.get("timestamp", "")
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Title", "Timestamp"]) #pyright: ignore
+        out = table.frame()
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -385,17 +385,18 @@ def your_event_responses_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Name", "Timestamp"])
 
     try:
         items = d["event_responses_v2"]["events_joined"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("name", "")),
-                eh.epoch_to_iso(item.get("start_timestamp", ""), errors=errors)
-            ))
+                item.get("start_timestamp", "")
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Name", "Timestamp"]) #pyright: ignore
+        out = table.frame()
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -404,6 +405,14 @@ def your_event_responses_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.
     return out
 
 
+GROUP_POST_COLUMNS = eh.PathExtractor({
+    "Title": "**.*title*",
+    "Post": "**.*post*",
+    "Date": "**.*timestamp*",
+    "URL": "**.*url*",
+})
+
+
 def group_posts_and_comments_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     result = reader.json("group_posts_and_comments.json")
@@ -412,21 +421,13 @@ def group_posts_and_comments_to_df(reader: ZipArchiveReader, errors: Counter) ->
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         l = d["group_posts_v2"]  # pyright: ignore
-        for item in l:
-            denested_dict = eh.dict_denester(item)
-
-            datapoints.append((
-                eh.fix_latin1_string(eh.find_item(denested_dict, "title")),
-                eh.fix_latin1_string(eh.find_item(denested_dict, "post")),
-                eh.epoch_to_iso(eh.find_item(denested_dict, "timestamp"), errors=errors),
-                eh.find_item(denested_dict, "url"),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Title", "Post", "Date", "URL"]) #pyright: ignore
+        out = GROUP_POST_COLUMNS.frame(l)
+        out["Title"] = out["Title"].map(eh.fix_latin1_string)
+        out["Post"] = out["Post"].map(eh.fix_latin1_string)
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -444,16 +445,16 @@ def your_answers_to_membership_questions_to_df(reader: ZipArchiveReader, errors:
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Group name"])
 
     try:
 
         items = d["group_membership_questions_answers_v2"]["group_answers"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("group_name", "")),
-            ))
-        out = pd.DataFrame(datapoints, columns=["Group name"]) #pyright: ignore
+            )
+        out = table.frame()
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -462,6 +463,14 @@ def your_answers_to_membership_questions_to_df(reader: ZipArchiveReader, errors:
     return out
 
 
+GROUP_COMMENT_COLUMNS = eh.PathExtractor({
+    "Title": "**.*title*",
+    "Comment": "**.comment.comment",
+    "Group": "**.*group*",
+    "Timestamp": "**.*timestamp*",
+})
+
+
 def your_comments_in_groups_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     result = reader.json("your_comments_in_groups.json")
@@ -470,21 +479,13 @@ def your_comments_in_groups_to_df(reader: ZipArchiveReader, errors: Counter) ->
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         l = d["group_comments_v2"]  # pyright: ignore
-        for item in l:
-            denested_dict = eh.dict_denester(item)
-
-            datapoints.append((
-                eh.fix_latin1_string(eh.find_item(denested_dict, "title")),
-                eh.fix_latin1_string(eh.find_item(denested_dict, "comment-comment")),
-                eh.fix_latin1_string(eh.find_item(denested_dict, "group")),
-                eh.epoch_to_iso(eh.find_item(denested_dict, "timestamp"), errors=errors),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Title", "Comment", "Group", "Timestamp"]) #pyright: ignore
+        out = GROUP_COMMENT_COLUMNS.frame(l)
+        for column in ("Title", "Comment", "Group"):
+            out[column] = out[column].map(eh.fix_latin1_string)
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -493,6 +494,13 @@ def your_comments_in_groups_to_df(reader: ZipArchiveReader, errors: Counter) ->
     return out
 
 
+GROUP_MEMBERSHIP_COLUMNS = eh.PathExtractor({
+    "Title": "**.*title*",
+    "Group name": "**.*name*",
+    "Timestamp": "**.*timestamp*",
+})
+
+
 def your_group_membership_activity_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     result = reader.json("your_group_membership_activity.json")
     if not result.found:
@@ -500,20 +508,13 @@ def your_group_membership_activity_to_df(reader: ZipArchiveReader, errors: Count
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         items = d["groups_joined_v2"]  # pyright: ignore
-        for item in items:
-            denested_dict = eh.dict_denester(item)
-
-            datapoints.append((
-                eh.fix_latin1_string(eh.find_item(denested_dict, "title")),
-                eh.fix_latin1_string(eh.find_item(denested_dict, "name")),
-                eh.epoch_to_iso(eh.find_item(denested_dict, "timestamp"), errors=errors),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Title", "Group name", "Timestamp"]) #pyright: ignore
+        out = GROUP_MEMBERSHIP_COLUMNS.frame(items)
+        out["Title"] = out["Title"].map(eh.fix_latin1_string)
+        out["Group name"] = out["Group name"].map(eh.fix_latin1_string)
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -530,17 +531,18 @@ def pages_and_profiles_you_follow_to_df(reader: ZipArchiveReader, errors: Counte
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Title", "Timestamp"])
 
     try:
         items = d["pages_followed_v2"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("title", "")),
-                eh.epoch_to_iso(item.get("timestamp", ""), errors=errors)
-            ))
+                item.get("timestamp", "")
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Title", "Timestamp"]) #pyright: ignore
+        out = table.frame()
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -556,18 +558,19 @@ def pages_youve_liked_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.Dat
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Name", "URL", "Timestamp"])
 
     try:
         items = d["page_likes_v2"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("name", "")),
                 item.get("url", ""),
-                eh.epoch_to_iso(item.get("timestamp", ""), errors=errors)
-            ))
+                item.get("timestamp", "")
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Name", "URL", "Timestamp"]) # pyright: ignore
+        out = table.frame()
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -583,17 +586,18 @@ def your_saved_items_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.Data
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Title", "Timestamp"])
 
     try:
         items = d["saves_v2"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("title", "")),
-                eh.epoch_to_iso(item.get("timestamp", ""), errors=errors)
-            ))
+                item.get("timestamp", "")
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Title", "Timestamp"]) #pyright: ignore
+        out = table.frame()
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -603,6 +607,13 @@ def your_saved_items_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.Data
 
 
 
+COMMENT_COLUMNS = eh.PathExtractor({
+    "Title": "**.*title*",
+    "Comment": "**.comment.comment",
+    "Timestamp": "**.*timestamp*",
+})
+
+
 def comments_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     result = reader.json("comments_and_reactions/comments.json")
     if not result.found:
@@ -610,20 +621,13 @@ def comments_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         items = d["comments_v2"]  # pyright: ignore
-        for item in items:
-            denested_dict = eh.dict_denester(item)
-
-            datapoints.append((
-                eh.fix_latin1_string(eh.find_item(denested_dict, "title")),
-                eh.fix_latin1_string(eh.find_item(denested_dict, "comment-comment")),
-                eh.epoch_to_iso(eh.find_item(denested_dict, "timestamp"), errors=errors),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Title", "Comment", "Timestamp"]) #pyright: ignore
+        out = COMMENT_COLUMNS.frame(items)
+        out["Title"] = out["Title"].map(eh.fix_latin1_string)
+        out["Comment"] = out["Comment"].map(eh.fix_latin1_string)
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -632,36 +636,37 @@ def comments_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     return out
 
 
+LIKES_AND_REACTIONS_COLUMNS = eh.PathExtractor({
+    "Title": "**.*title*",
+    "Reaction": "**.reaction.reaction",
+    "Timestamp": "**.*timestamp*",
+})
+
+
 def likes_and_reactions_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     """
     likes_and_reactions_x
     """
 
     out = pd.DataFrame()
-    datapoints = []
 
     results = reader.json_all(r"(^|/)likes_and_reactions_\d+\.json$")
     if not results:
         return pd.DataFrame()
 
     try:
-        for result in results:
-            for item in result.data:
-                denested_dict = eh.dict_denester(item)
-
-                datapoints.append((
-                    eh.fix_latin1_string(eh.find_item(denested_dict, "title")),
-                    eh.fix_latin1_string(eh.find_item(denested_dict, "reaction-reaction")),
-                    eh.epoch_to_iso(eh.find_item(denested_dict, "timestamp"), errors=errors),
-                ))
+        out = LIKES_AND_REACTIONS_COLUMNS.frame(
+            item for result in results for item in result.data
+        )
+        out["Title"] = out["Title"].map(eh.fix_latin1_string)
+        out["Reaction"] = out["Reaction"].map(eh.fix_latin1_string)
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
         return pd.DataFrame()
 
-    out = pd.DataFrame(datapoints, columns=["Title", "Reaction", "Timestamp"]) #pyright: ignore
-
     return out
 
 
@@ -673,17 +678,17 @@ def your_comment_active_days_to_df(reader: ZipArchiveReader, errors: Counter) ->
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Label", "Value"])
 
     try:
         items = d["label_values"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 item.get("label", ""),
                 item.get("value", ""),
-            ))
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Label", "Value"]) #pyright: ignore
+        out = table.frame()
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -700,18 +705,19 @@ def your_pages_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Name", "URL", "Timestamp"])
 
     try:
         items = d["pages_v2"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("name", "")),
                 item.get("url", ""),
-                eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-            ))
+                item.get("timestamp", ""),
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Name", "URL", "Timestamp"]) #pyright: ignore
+        out = table.frame()
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -727,16 +733,16 @@ def story_reactions_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataF
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Title"])
 
     try:
         items = d["stories_feedback_v2"]  # pyright: ignore
         for item in items:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("title", "")),
-            ))
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Title"]) #pyright: ignore
+        out = table.frame()
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -752,16 +758,17 @@ def your_posts_check_ins_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Title", "Timestamp"])
 
     try:
         for item in d:
-            datapoints.append((
+            table.append(
                 eh.fix_latin1_string(item.get("title", "")),
-                eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-            ))
+                item.get("timestamp", ""),
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Title", "Timestamp"]) #pyright: ignore
+        out = table.frame()
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -776,22 +783,22 @@ def likes_and_reactions_base_to_df(reader: ZipArchiveReader, errors: Counter) ->
     variants likes_and_reactions_1.json, _2.json, ... . Each item is structured with
     label_values containing Reaction, Name, and URL.
     """
-    datapoints = []
+    table = eh.TableBuilder(["Reaction", "Name", "URL", "Timestamp"])
 
-    def _parse_items(d: list) -> None:
+    def _parse_items(d: Iterable) -> None:
         for item in d:
             lv = {x.get("label", ""): x.get("value", "") for x in item.get("label_values", [])}
-            datapoints.append((
+            table.append(
                 lv.get("Reaction", ""),
                 eh.fix_latin1_string(lv.get("Name", "")),
                 lv.get("URL", ""),
-                eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-            ))
+                item.get("timestamp", ""),
+            )
 
     try:
-        result = reader.json("likes_and_reactions.json")
+        result = reader.iter_json("likes_and_reactions.json")
         if result.found:
-            _parse_items(result.data)  # pyright: ignore
+            _parse_items(result.data)
         else:
             # Fall back to numbered files for DDPs that only export _1, _2, ...
             results = reader.json_all(r"(^|/)likes_and_reactions_\d+\.json$")
@@ -802,10 +809,19 @@ def likes_and_reactions_base_to_df(reader: ZipArchiveReader, errors: Counter) ->
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
 
-    out = pd.DataFrame(datapoints, columns=["Reaction", "Name", "URL", "Timestamp"]) if datapoints else pd.DataFrame()  # pyright: ignore
+    if not len(table):
+        return pd.DataFrame()
+    out = table.frame()
+    out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
     return out
 
 
+CONTROL_ENTRY_COLUMNS = eh.PathExtractor({
+    "Content": "**.*value*",
+    "Date": "**.*timestamp*",
+})
+
+
 def controls_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     """
     Reads preferences/feed/controls.json.
@@ -818,21 +834,22 @@ def controls_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Action", "Content", "Date"])
 
     try:
         groups = d["controls"]  # pyright: ignore
         for group in groups:
             action = group.get("name", "")
             for entry in group.get("entries", []):
-                denested = eh.dict_denester(entry)
-                datapoints.append((
+                value, timestamp = CONTROL_ENTRY_COLUMNS.row(entry)
+                table.append(
                     action,
-                    eh.fix_latin1_string(eh.find_item(denested, "value")),
-                    eh.epoch_to_iso(eh.find_item(denested, "timestamp"), errors=errors),
-                ))
+                    eh.fix_latin1_string(value),
+                    timestamp,
+                )
 
-        out = pd.DataFrame(datapoints, columns=["Action", "Content", "Date"])  # pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -843,480 +860,480 @@ def controls_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
 def extraction(facebook_zip: str, validation) -> ExtractionResult:
     errors = Counter()
-    reader = ZipArchiveReader(facebook_zip, validation.archive_members, errors)
-    tables = [
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_who_youve_followed",
-            data_frame=who_youve_followed_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Who you follow",
-                "nl": "Wie je volgt",
-            }),
-            description=props.Translatable({
-                "en": "This table shows the Facebook profiles and pages you currently follow.",
-                "nl": "Deze tabel toont de Facebook-profielen en -pagina's die je momenteel volgt.",
-            }),
-            headers={
-                "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_news_your_locations",
-            data_frame=news_your_locations_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "The locations Facebook news is set to",
-                "nl": "De locaties waar Facebook Nieuws op is ingesteld",
-            }),
-            description=props.Translatable({
-                "en": "This table displays the geographical locations for which your Facebook News feed is configured.",
-                "nl": "Deze tabel toont de geografische locaties waarvoor je Facebook Nieuwsfeed is geconfigureerd.",
-            }),
-            headers={
-                "Location": props.Translatable({"en": "Location", "nl": "Locatie"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_notifications",
-            data_frame=notifications_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Notifications Facebook sent you",
-                "nl": "Notificaties die Facebook je stuurde",
-            }),
-            description=props.Translatable({
-                "en": "This table contains a history of the notifications you've received from Facebook.",
-                "nl": "Deze tabel bevat een overzicht van de notificaties die je van Facebook hebt ontvangen.",
-            }),
-            headers={
-                "Text": props.Translatable({"en": "Text", "nl": "Tekst"}),
-                "Link": props.Translatable({"en": "Link", "nl": "Link"}),
-                "Read": props.Translatable({"en": "Read", "nl": "Gelezen"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_reels_usage",
-            data_frame=facebook_reels_usage_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Interactions with Facebook Reels",
-                "nl": "Interacties met Facebook Reels",
-            }),
-            description=props.Translatable({
-                "en": "This table shows your interactions with Facebook Reels, such as videos you've watched or engaged with.",
-                "nl": "Deze tabel toont je interacties met Facebook Reels, zoals video's die je hebt bekeken of waarmee je hebt gecommuniceerd.",
-            }),
-            headers={
-                "Reel interaction": props.Translatable({"en": "Reel interaction", "nl": "Interactie met reels"}),
-                "Value": props.Translatable({"en": "Value", "nl": "Waarde"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_last_28",
-            data_frame=last_28_days_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "How many videos you watched in the last 28 days",
-                "nl": "Hoeveel video's je de afgelopen 28 dagen hebt bekeken",
-            }),
-            description=props.Translatable({
-                "en": "This table indicates the number of videos you have watched on Facebook in the past 28 days.",
-                "nl": "Deze tabel geeft het aantal video's aan dat je de afgelopen 28 dagen op Facebook hebt bekeken.",
-            }),
-            headers={
-                "Count": props.Translatable({"en": "Count", "nl": "Aantal"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_search_history",
-            data_frame=your_search_history_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your search history",
-                "nl": "Je zoekgeschiedenis",
-            }),
-            description=props.Translatable({
-                "en": "This table contains a record of your search queries on Facebook.",
-                "nl": "Deze tabel bevat een overzicht van je zoekopdrachten op Facebook.",
-            }),
-            headers={
-                "Search term": props.Translatable({"en": "Search term", "nl": "Zoekterm"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "Terms you searched for",
-                        "nl": "Zoektermen waar je naar zocht",
-                    },
-                    "type": "wordcloud",
-                    "textColumn": "Search term",
-                    "tokenize": False,
-                }
-            ]
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_recently_visited",
-            data_frame=recently_visited_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Profiles you visited recently",
-                "nl": "Profielen die je recentelijk hebt bezocht",
-            }),
-            description=props.Translatable({
-                "en": "This table lists the Facebook profiles you have visited most recently.",
-                "nl": "Deze tabel toont de Facebook-profielen die je recentelijk hebt bezocht.",
-            }),
-            headers={
-                "Category": props.Translatable({"en": "Category", "nl": "Categorie"}),
-                "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
-                "Link": props.Translatable({"en": "Link", "nl": "Link"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_recently_viewed",
-            data_frame=recently_viewed_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Facebook items you recently viewed",
-                "nl": "Facebook items die je recentelijk hebt bekeken",
-            }),
-            description=props.Translatable({
-                "en": "This table shows the Facebook posts, videos, and other items you have recently viewed.",
-                "nl": "Deze tabel toont de Facebook-posts, video's en andere items die je recentelijk hebt bekeken.",
-            }),
-            headers={
-                "Category": props.Translatable({"en": "Category", "nl": "Categorie"}),
-                "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
-                "Link": props.Translatable({"en": "Link", "nl": "Link"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_profile_update_history",
-            data_frame=profile_update_history_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "History of your profile updates",
-                "nl": "Geschiedenis van je profielupdates",
-            }),
-            description=props.Translatable({
-                "en": "This table contains a log of changes you've made to your Facebook profile information.",
-                "nl": "Deze tabel bevat een logboek van de wijzigingen die je in je Facebook-profielinformatie hebt aangebracht.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_likes_and_reactions_base",
-            data_frame=likes_and_reactions_base_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Likes and reactions on Facebook",
-                "nl": "Likes en reacties op Facebook",
-            }),
-            description=props.Translatable({
-                "en": "This table shows your likes and reactions to posts and other content on Facebook.",
-                "nl": "Deze tabel toont je likes en reacties op berichten en andere content op Facebook.",
-            }),
-            headers={
-                "Reaction": props.Translatable({"en": "Reaction", "nl": "Reactie"}),
-                "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_likes_and_reactions",
-            data_frame=likes_and_reactions_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Posts you liked (with title)",
-                "nl": "Posts die je leuk vond (met titel)",
-            }),
-            description=props.Translatable({
-                "en": "This table shows the titles of posts you liked on Facebook.",
-                "nl": "Deze tabel toont de titels van posts die je leuk vond op Facebook.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Reaction": props.Translatable({"en": "Reaction", "nl": "Reactie"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_your_group_membership_activity",
-            data_frame=your_group_membership_activity_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Facebook groups you are a member of",
-                "nl": "Facebookgroepen waar je lid van bent",
-            }),
-            description=props.Translatable({
-                "en": "This table lists the Facebook groups you are currently a member of.",
-                "nl": "Deze tabel toont de Facebookgroepen waar je momenteel lid van bent.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Group name": props.Translatable({"en": "Group name", "nl": "Groepsnaam"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_pages_and_profiles_you_follow",
-            data_frame=pages_and_profiles_you_follow_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Pages and profiles that you follow",
-                "nl": "Pagina's en profielen die je volgt",
-            }),
-            description=props.Translatable({
-                "en": "This table displays the Facebook Pages and profiles that you actively follow.",
-                "nl": "Deze tabel toont de Facebookpagina's en -profielen die je actief volgt.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_pages_youve_liked",
-            data_frame=pages_youve_liked_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Pages that you have liked",
-                "nl": "Pagina's die je leuk vindt",
-            }),
-            description=props.Translatable({
-                "en": "This table contains a history of the Facebook Pages you have liked.",
-                "nl": "Deze tabel bevat een overzicht van de Facebookpagina's die je leuk vindt.",
-            }),
-            headers={
-                "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_your_posts_and_check_ins",
-            data_frame=your_posts_check_ins_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your posts and check-ins",
-                "nl": "Je posts en check-ins",
-            }),
-            description=props.Translatable({
-                "en": "This table shows the posts and places you have checked into on Facebook.",
-                "nl": "Deze tabel toont de berichten en plaatsen waar je op Facebook hebt ingecheckt.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_story_reactions",
-            data_frame=story_reactions_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your story reactions",
-                "nl": "Je story-reacties",
-            }),
-            description=props.Translatable({
-                "en": "This table contains your reactions to Facebook Stories.",
-                "nl": "Deze tabel bevat je reacties op Facebook Stories.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_feed_controls",
-            data_frame=controls_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Feed controls (show more / show less)",
-                "nl": "Feed-voorkeuren (meer zien / minder zien)",
-            }),
-            description=props.Translatable({
-                "en": "This table shows the actions you've taken to customise what content you see more or less of on Facebook.",
-                "nl": "Deze tabel toont de acties die je hebt ondernomen om aan te passen welke content je meer of minder ziet op Facebook.",
-            }),
-            headers={
-                "Action": props.Translatable({"en": "Action", "nl": "Actie"}),
-                "Content": props.Translatable({"en": "Content", "nl": "Inhoud"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_content_sharing_links_you_created",
-            data_frame=content_sharing_you_have_created_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Links you shared",
-                "nl": "Links die je hebt gedeeld",
-            }),
-            description=props.Translatable({
-                "en": "This table displays the external links you have shared on Facebook.",
-                "nl": "Deze tabel toont de externe links die je op Facebook hebt gedeeld.",
-            }),
-            headers={
-                "Link": props.Translatable({"en": "Link", "nl": "Link"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en Tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_your_friends",
-            data_frame=your_friends_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your friends on Facebook",
-                "nl": "Je vrienden op Facebook",
-            }),
-            description=props.Translatable({
-                "en": "This table lists your current friends on Facebook.",
-                "nl": "Deze tabel toont je huidige vrienden op Facebook.",
-            }),
-            headers={
-                "Number of friends": props.Translatable({"en": "Number of friends", "nl": "Aantal vrienden op facebook"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_ads_interests",
-            data_frame=ads_interests_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your ad interests",
-                "nl": "Je advertentie-interesses",
-            }),
-            description=props.Translatable({
-                "en": "This table shows the interests Facebook has identified for showing you personalized ads.",
-                "nl": "Deze tabel toont de interesses die Facebook heeft geïdentificeerd om je gepersonaliseerde advertenties te tonen.",
-            }),
-            headers={
-                "Ad": props.Translatable({"en": "Ad", "nl": "Advertentie"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_your_event_responses",
-            data_frame=your_event_responses_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your event responses",
-                "nl": "Je reacties op evenementen",
-            }),
-            description=props.Translatable({
-                "en": "This table contains your responses (going, interested, declined) to Facebook events.",
-                "nl": "Deze tabel bevat je reacties (gaat, geïnteresseerd, afgewezen) op Facebook-evenementen.",
-            }),
-            headers={
-                "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_group_posts_and_comments",
-            data_frame=group_posts_and_comments_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your posts and comments in groups",
-                "nl": "Je berichten en commentaren in groepen",
-            }),
-            description=props.Translatable({
-                "en": "This table shows your posts and comments within Facebook groups.",
-                "nl": "Deze tabel toont je berichten en commentaren in Facebook-groepen.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Post": props.Translatable({"en": "Post", "nl": "Bericht"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_your_answers_to_membership_questions",
-            data_frame=your_answers_to_membership_questions_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your answers to group membership questions",
-                "nl": "Je antwoorden op vragen voor groepslidmaatschap",
-            }),
-            description=props.Translatable({
-                "en": "This table contains the answers you provided when requesting to join Facebook groups.",
-                "nl": "Deze tabel bevat de antwoorden die je hebt gegeven bij het aanvragen van lidmaatschap van Facebook-groepen.",
-            }),
-            headers={
-                "Group name": props.Translatable({"en": "Group name", "nl": "Groepsnaam"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_your_comments_in_groups",
-            data_frame=your_comments_in_groups_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your comments in groups",
-                "nl": "Je commentaren in groepen",
-            }),
-            description=props.Translatable({
-                "en": "This table specifically lists the comments you have made in Facebook groups.",
-                "nl": "Deze tabel toont specifiek de commentaren die je in Facebook-groepen hebt geplaatst.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Comment": props.Translatable({"en": "Comment", "nl": "Reactie"}),
-                "Group": props.Translatable({"en": "Group", "nl": "Groep"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_your_saved_items",
-            data_frame=your_saved_items_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your saved items",
-                "nl": "Je opgeslagen items",
-            }),
-            description=props.Translatable({
-                "en": "This table contains the posts, videos, and other content you have saved on Facebook.",
-                "nl": "Deze tabel bevat de berichten, video's en andere content die je op Facebook hebt opgeslagen.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_comments",
-            data_frame=comments_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your comments",
-                "nl": "Je commentaren",
-            }),
-            description=props.Translatable({
-                "en": "This table shows all the comments you have made on Facebook posts and other content.",
-                "nl": "Deze tabel toont alle commentaren die je op Facebook-berichten en andere content hebt geplaatst.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "Comment": props.Translatable({"en": "Comment", "nl": "Reactie"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_your_comment_active_days",
-            data_frame=your_comment_active_days_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Days you actively commented",
-                "nl": "Dagen waarop je actief commentaren hebt geplaatst",
-            }),
-            description=props.Translatable({
-                "en": "This table indicates the days on which you made comments on Facebook.",
-                "nl": "Deze tabel toont de dagen waarop je commentaren op Facebook hebt geplaatst.",
-            }),
-            headers={
-                "Label": props.Translatable({"en": "Label", "nl": "Label"}),
-                "Value": props.Translatable({"en": "Value", "nl": "Waarde"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="facebook_your_pages",
-            data_frame=your_pages_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Pages you manage",
-                "nl": "Pagina's die je beheert",
-            }),
-            description=props.Translatable({
-                "en": "This table lists the Facebook Pages that you administer.",
-                "nl": "Deze tabel toont de Facebookpagina's die je beheert.",
-            }),
-            headers={
-                "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-    ]
+    with ZipArchiveReader(facebook_zip, validation.archive_members, errors, zip_file=validation.zip_file) as reader:
+        tables = [
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_who_youve_followed",
+                data_frame=who_youve_followed_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Who you follow",
+                    "nl": "Wie je volgt",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows the Facebook profiles and pages you currently follow.",
+                    "nl": "Deze tabel toont de Facebook-profielen en -pagina's die je momenteel volgt.",
+                }),
+                headers={
+                    "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_news_your_locations",
+                data_frame=news_your_locations_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "The locations Facebook news is set to",
+                    "nl": "De locaties waar Facebook Nieuws op is ingesteld",
+                }),
+                description=props.Translatable({
+                    "en": "This table displays the geographical locations for which your Facebook News feed is configured.",
+                    "nl": "Deze tabel toont de geografische locaties waarvoor je Facebook Nieuwsfeed is geconfigureerd.",
+                }),
+                headers={
+                    "Location": props.Translatable({"en": "Location", "nl": "Locatie"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_notifications",
+                data_frame=notifications_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Notifications Facebook sent you",
+                    "nl": "Notificaties die Facebook je stuurde",
+                }),
+                description=props.Translatable({
+                    "en": "This table contains a history of the notifications you've received from Facebook.",
+                    "nl": "Deze tabel bevat een overzicht van de notificaties die je van Facebook hebt ontvangen.",
+                }),
+                headers={
+                    "Text": props.Translatable({"en": "Text", "nl": "Tekst"}),
+                    "Link": props.Translatable({"en": "Link", "nl": "Link"}),
+                    "Read": props.Translatable({"en": "Read", "nl": "Gelezen"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_reels_usage",
+                data_frame=facebook_reels_usage_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Interactions with Facebook Reels",
+                    "nl": "Interacties met Facebook Reels",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows your interactions with Facebook Reels, such as videos you've watched or engaged with.",
+                    "nl": "Deze tabel toont je interacties met Facebook Reels, zoals video's die je hebt bekeken of waarmee je hebt gecommuniceerd.",
+                }),
+                headers={
+                    "Reel interaction": props.Translatable({"en": "Reel interaction", "nl": "Interactie met reels"}),
+                    "Value": props.Translatable({"en": "Value", "nl": "Waarde"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_last_28",
+                data_frame=last_28_days_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "How many videos you watched in the last 28 days",
+                    "nl": "Hoeveel video's je de afgelopen 28 dagen hebt bekeken",
+                }),
+                description=props.Translatable({
+                    "en": "This table indicates the number of videos you have watched on Facebook in the past 28 days.",
+                    "nl": "Deze tabel geeft het aantal video's aan dat je de afgelopen 28 dagen op Facebook hebt bekeken.",
+                }),
+                headers={
+                    "Count": props.Translatable({"en": "Count", "nl": "Aantal"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_search_history",
+                data_frame=your_search_history_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your search history",
+                    "nl": "Je zoekgeschiedenis",
+                }),
+                description=props.Translatable({
+                    "en": "This table contains a record of your search queries on Facebook.",
+                    "nl": "Deze tabel bevat een overzicht van je zoekopdrachten op Facebook.",
+                }),
+                headers={
+                    "Search term": props.Translatable({"en": "Search term", "nl": "Zoekterm"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                },
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "Terms you searched for",
+                            "nl": "Zoektermen waar je naar zocht",
+                        },
+                        "type": "wordcloud",
+                        "textColumn": "Search term",
+                        "tokenize": False,
+                    }
+                ]
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_recently_visited",
+                data_frame=recently_visited_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Profiles you visited recently",
+                    "nl": "Profielen die je recentelijk hebt bezocht",
+                }),
+                description=props.Translatable({
+                    "en": "This table lists the Facebook profiles you have visited most recently.",
+                    "nl": "Deze tabel toont de Facebook-profielen die je recentelijk hebt bezocht.",
+                }),
+                headers={
+                    "Category": props.Translatable({"en": "Category", "nl": "Categorie"}),
+                    "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
+                    "Link": props.Translatable({"en": "Link", "nl": "Link"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_recently_viewed",
+                data_frame=recently_viewed_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Facebook items you recently viewed",
+                    "nl": "Facebook items die je recentelijk hebt bekeken",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows the Facebook posts, videos, and other items you have recently viewed.",
+                    "nl": "Deze tabel toont de Facebook-posts, video's en andere items die je recentelijk hebt bekeken.",
+                }),
+                headers={
+                    "Category": props.Translatable({"en": "Category", "nl": "Categorie"}),
+                    "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
+                    "Link": props.Translatable({"en": "Link", "nl": "Link"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_profile_update_history",
+                data_frame=profile_update_history_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "History of your profile updates",
+                    "nl": "Geschiedenis van je profielupdates",
+                }),
+                description=props.Translatable({
+                    "en": "This table contains a log of changes you've made to your Facebook profile information.",
+                    "nl": "Deze tabel bevat een logboek van de wijzigingen die je in je Facebook-profielinformatie hebt aangebracht.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_likes_and_reactions_base",
+                data_frame=likes_and_reactions_base_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Likes and reactions on Facebook",
+                    "nl": "Likes en reacties op Facebook",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows your likes and reactions to posts and other content on Facebook.",
+                    "nl": "Deze tabel toont je likes en reacties op berichten en andere content op Facebook.",
+                }),
+                headers={
+                    "Reaction": props.Translatable({"en": "Reaction", "nl": "Reactie"}),
+                    "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_likes_and_reactions",
+                data_frame=likes_and_reactions_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Posts you liked (with title)",
+                    "nl": "Posts die je leuk vond (met titel)",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows the titles of posts you liked on Facebook.",
+                    "nl": "Deze tabel toont de titels van posts die je leuk vond op Facebook.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Reaction": props.Translatable({"en": "Reaction", "nl": "Reactie"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_your_group_membership_activity",
+                data_frame=your_group_membership_activity_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Facebook groups you are a member of",
+                    "nl": "Facebookgroepen waar je lid van bent",
+                }),
+                description=props.Translatable({
+                    "en": "This table lists the Facebook groups you are currently a member of.",
+                    "nl": "Deze tabel toont de Facebookgroepen waar je momenteel lid van bent.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Group name": props.Translatable({"en": "Group name", "nl": "Groepsnaam"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_pages_and_profiles_you_follow",
+                data_frame=pages_and_profiles_you_follow_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Pages and profiles that you follow",
+                    "nl": "Pagina's en profielen die je volgt",
+                }),
+                description=props.Translatable({
+                    "en": "This table displays the Facebook Pages and profiles that you actively follow.",
+                    "nl": "Deze tabel toont de Facebookpagina's en -profielen die je actief volgt.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_pages_youve_liked",
+                data_frame=pages_youve_liked_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Pages that you have liked",
+                    "nl": "Pagina's die je leuk vindt",
+                }),
+                description=props.Translatable({
+                    "en": "This table contains a history of the Facebook Pages you have liked.",
+                    "nl": "Deze tabel bevat een overzicht van de Facebookpagina's die je leuk vindt.",
+                }),
+                headers={
+                    "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_your_posts_and_check_ins",
+                data_frame=your_posts_check_ins_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your posts and check-ins",
+                    "nl": "Je posts en check-ins",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows the posts and places you have checked into on Facebook.",
+                    "nl": "Deze tabel toont de berichten en plaatsen waar je op Facebook hebt ingecheckt.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_story_reactions",
+                data_frame=story_reactions_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your story reactions",
+                    "nl": "Je story-reacties",
+                }),
+                description=props.Translatable({
+                    "en": "This table contains your reactions to Facebook Stories.",
+                    "nl": "Deze tabel bevat je reacties op Facebook Stories.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_feed_controls",
+                data_frame=controls_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Feed controls (show more / show less)",
+                    "nl": "Feed-voorkeuren (meer zien / minder zien)",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows the actions you've taken to customise what content you see more or less of on Facebook.",
+                    "nl": "Deze tabel toont de acties die je hebt ondernomen om aan te passen welke content je meer of minder ziet op Facebook.",
+                }),
+                headers={
+                    "Action": props.Translatable({"en": "Action", "nl": "Actie"}),
+                    "Content": props.Translatable({"en": "Content", "nl": "Inhoud"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_content_sharing_links_you_created",
+                data_frame=content_sharing_you_have_created_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Links you shared",
+                    "nl": "Links die je hebt gedeeld",
+                }),
+                description=props.Translatable({
+                    "en": "This table displays the external links you have shared on Facebook.",
+                    "nl": "Deze tabel toont de externe links die je op Facebook hebt gedeeld.",
+                }),
+                headers={
+                    "Link": props.Translatable({"en": "Link", "nl": "Link"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en Tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_your_friends",
+                data_frame=your_friends_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your friends on Facebook",
+                    "nl": "Je vrienden op Facebook",
+                }),
+                description=props.Translatable({
+                    "en": "This table lists your current friends on Facebook.",
+                    "nl": "Deze tabel toont je huidige vrienden op Facebook.",
+                }),
+                headers={
+                    "Number of friends": props.Translatable({"en": "Number of friends", "nl": "Aantal vrienden op facebook"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_ads_interests",
+                data_frame=ads_interests_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your ad interests",
+                    "nl": "Je advertentie-interesses",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows the interests Facebook has identified for showing you personalized ads.",
+                    "nl": "Deze tabel toont de interesses die Facebook heeft geïdentificeerd om je gepersonaliseerde advertenties te tonen.",
+                }),
+                headers={
+                    "Ad": props.Translatable({"en": "Ad", "nl": "Advertentie"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_your_event_responses",
+                data_frame=your_event_responses_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your event responses",
+                    "nl": "Je reacties op evenementen",
+                }),
+                description=props.Translatable({
+                    "en": "This table contains your responses (going, interested, declined) to Facebook events.",
+                    "nl": "Deze tabel bevat je reacties (gaat, geïnteresseerd, afgewezen) op Facebook-evenementen.",
+                }),
+                headers={
+                    "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_group_posts_and_comments",
+                data_frame=group_posts_and_comments_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your posts and comments in groups",
+                    "nl": "Je berichten en commentaren in groepen",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows your posts and comments within Facebook groups.",
+                    "nl": "Deze tabel toont je berichten en commentaren in Facebook-groepen.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Post": props.Translatable({"en": "Post", "nl": "Bericht"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_your_answers_to_membership_questions",
+                data_frame=your_answers_to_membership_questions_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your answers to group membership questions",
+                    "nl": "Je antwoorden op vragen voor groepslidmaatschap",
+                }),
+                description=props.Translatable({
+                    "en": "This table contains the answers you provided when requesting to join Facebook groups.",
+                    "nl": "Deze tabel bevat de antwoorden die je hebt gegeven bij het aanvragen van lidmaatschap van Facebook-groepen.",
+                }),
+                headers={
+                    "Group name": props.Translatable({"en": "Group name", "nl": "Groepsnaam"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_your_comments_in_groups",
+                data_frame=your_comments_in_groups_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your comments in groups",
+                    "nl": "Je commentaren in groepen",
+                }),
+                description=props.Translatable({
+                    "en": "This table specifically lists the comments you have made in Facebook groups.",
+                    "nl": "Deze tabel toont specifiek de commentaren die je in Facebook-groepen hebt geplaatst.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Comment": props.Translatable({"en": "Comment", "nl": "Reactie"}),
+                    "Group": props.Translatable({"en": "Group", "nl": "Groep"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_your_saved_items",
+                data_frame=your_saved_items_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your saved items",
+                    "nl": "Je opgeslagen items",
+                }),
+                description=props.Translatable({
+                    "en": "This table contains the posts, videos, and other content you have saved on Facebook.",
+                    "nl": "Deze tabel bevat de berichten, video's en andere content die je op Facebook hebt opgeslagen.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_comments",
+                data_frame=comments_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your comments",
+                    "nl": "Je commentaren",
+                }),
+                description=props.Translatable({
+                    "en": "This table shows all the comments you have made on Facebook posts and other content.",
+                    "nl": "Deze tabel toont alle commentaren die je op Facebook-berichten en andere content hebt geplaatst.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "Comment": props.Translatable({"en": "Comment", "nl": "Reactie"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_your_comment_active_days",
+                data_frame=your_comment_active_days_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Days you actively commented",
+                    "nl": "Dagen waarop je actief commentaren hebt geplaatst",
+                }),
+                description=props.Translatable({
+                    "en": "This table indicates the days on which you made comments on Facebook.",
+                    "nl": "Deze tabel toont de dagen waarop je commentaren op Facebook hebt geplaatst.",
+                }),
+                headers={
+                    "Label": props.Translatable({"en": "Label", "nl": "Label"}),
+                    "Value": props.Translatable({"en": "Value", "nl": "Waarde"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="facebook_your_pages",
+                data_frame=your_pages_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Pages you manage",
+                    "nl": "Pagina's die je beheert",
+                }),
+                description=props.Translatable({
+                    "en": "This table lists the Facebook Pages that you administer.",
+                    "nl": "Deze tabel toont de Facebookpagina's die je beheert.",
+                }),
+                headers={
+                    "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                },
+            ),
+        ]
     return ExtractionResult(
         tables=[table for table in tables if not table.data_frame.empty],
         errors=errors,
@@ -1328,7 +1345,7 @@ class FacebookFlow(FlowBuilder):
         super().__init__(session_id, "Facebook")
 
     def validate_file(self, file):
-        return validate.validate_zip(DDP_CATEGORIES, file)
+        return validate.validate_zip(DDP_CATEGORIES, file, keep_open=True)
 
     def extract_data(self, file_value, validation):
         return extraction(file_value, validation)
@@ -139,6 +139,23 @@ def _extract_owner_details(label_values: list[dict[str, Any]]) -> tuple[str, str
 # Per-table extraction functions
 # ---------------------------------------------------------------------------
 
+# followers_1.json and following.json records keep href, value and
+# timestamp in "string_list_data", a list with one dict per entry. Some
+# exports use "string_map_data" instead (a list, or a dict keyed by
+# label), so it is tried as a fallback; "*" covers both shapes.
+FOLLOWER_COLUMNS = eh.PathExtractor({
+    "Account": ["string_list_data.*.value", "string_map_data.*.value", "title"],
+    "URL": ["string_list_data.*.href", "string_map_data.*.href"],
+    "Date": ["string_list_data.*.timestamp", "string_map_data.*.timestamp"],
+})
+
+FOLLOWING_COLUMNS = eh.PathExtractor({
+    "Account": ["title", "string_list_data.*.value", "string_map_data.*.value"],
+    "URL": ["string_list_data.*.href", "string_map_data.*.href"],
+    "Date": ["string_list_data.*.timestamp", "string_map_data.*.timestamp"],
+})
+
+
 def followers_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     """
     followers_1.json can be a bare top-level list (newer exports) or wrapped
@@ -150,7 +167,6 @@ def followers_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         if isinstance(data, dict):
@@ -158,14 +174,9 @@ def followers_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
         else:
             items = data  # pyright: ignore
 
-        for item in items:
-            d = eh.dict_denester(item)
-            datapoints.append((
-                eh.fix_latin1_string(eh.find_item(d, "value") or eh.find_item(d, "title")),
-                eh.find_item(d, "href"),
-                eh.epoch_to_iso(eh.find_item(d, "timestamp"), errors=errors),
-            ))
-        out = pd.DataFrame(datapoints, columns=["Account", "URL", "Date"])  # pyright: ignore
+        out = FOLLOWER_COLUMNS.frame(items)
+        out["Account"] = out["Account"].map(eh.fix_latin1_string)
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -183,18 +194,12 @@ def following_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         items = data["relationships_following"]  # pyright: ignore
-        for item in items:
-            d = eh.dict_denester(item)
-            datapoints.append((
-                eh.fix_latin1_string(eh.find_item(d, "title") or eh.find_item(d, "value")),
-                eh.find_item(d, "href"),
-                eh.epoch_to_iso(eh.find_item(d, "timestamp"), errors=errors),
-            ))
-        out = pd.DataFrame(datapoints, columns=["Account", "URL", "Date"])  # pyright: ignore
+        out = FOLLOWING_COLUMNS.frame(items)
+        out["Account"] = out["Account"].map(eh.fix_latin1_string)
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -212,7 +217,7 @@ def ads_viewed_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Account name", "Name", "URL", "Date"])
 
     try:
         if isinstance(data, list):
@@ -224,14 +229,15 @@ def ads_viewed_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
         for item in items:  # pyright: ignore
             owner_name, owner_username, url = _extract_owner_details(item.get("label_values", []))
-            datapoints.append((
+            table.append(
                 owner_username or owner_name,
                 owner_name,
                 url,
-                eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-            ))
+                item.get("timestamp", ""),
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Account name", "Name", "URL", "Date"])  # pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -243,37 +249,37 @@ def ads_viewed_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
 def posts_viewed_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
-    result = reader.json("posts_viewed.json")
+    # Newer exports wrap the list in {"impressions_history_posts_seen": [...]}
+    # with string_map_data items; older ones are a bare label_values list.
+    result = reader.iter_json("posts_viewed.json", path="impressions_history_posts_seen")
     if not result.found:
         return pd.DataFrame()
-    data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Author", "URL", "Date"])
 
     try:
-        if isinstance(data, dict):
-            items = data["impressions_history_posts_seen"]  # pyright: ignore
-            for item in items:
-                string_map_data = item.get("string_map_data", {})
+        for item in result.data:
+            if "string_map_data" in item:
+                string_map_data = item["string_map_data"]
                 author = _first_present(string_map_data, ["Author", "Auteur"])
                 time = _first_present(string_map_data, ["Time", "Tijd"])
                 url = _first_present(string_map_data, ["URL"])
-                datapoints.append((
+                table.append(
                     eh.fix_latin1_string(str(author.get("value", ""))),
                     url.get("href", ""),
-                    eh.epoch_to_iso(time.get("timestamp", ""), errors=errors),
-                ))
-        else:
-            for item in data:  # pyright: ignore
+                    time.get("timestamp", ""),
+                )
+            else:
                 owner_name, owner_username, url = _extract_owner_details(item.get("label_values", []))
-                datapoints.append((
+                table.append(
                     owner_username or owner_name,
                     url,
-                    eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-                ))
+                    item.get("timestamp", ""),
+                )
 
-        out = pd.DataFrame(datapoints, columns=["Author", "URL", "Date"])  # pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -291,7 +297,7 @@ def videos_watched_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFr
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Author", "URL", "Date"])
 
     try:
         if isinstance(data, dict):
@@ -301,21 +307,22 @@ def videos_watched_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFr
                 author = _first_present(string_map_data, ["Author", "Auteur"])
                 time = _first_present(string_map_data, ["Time", "Tijd"])
                 url = _first_present(string_map_data, ["URL"])
-                datapoints.append((
+                table.append(
                     eh.fix_latin1_string(str(author.get("value", ""))),
                     url.get("href", ""),
-                    eh.epoch_to_iso(time.get("timestamp", ""), errors=errors),
-                ))
+                    time.get("timestamp", ""),
+                )
         else:
             for item in data:  # pyright: ignore
                 owner_name, owner_username, url = _extract_owner_details(item.get("label_values", []))
-                datapoints.append((
+                table.append(
                     owner_username or owner_name,
                     url,
-                    eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-                ))
+                    item.get("timestamp", ""),
+                )
 
-        out = pd.DataFrame(datapoints, columns=["Author", "URL", "Date"])  # pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -328,7 +335,7 @@ def videos_watched_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFr
 def post_comments_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Comment", "Media owner", "Date"])
 
     try:
         results = reader.json_all(r"(^|/)post_comments(?:_\d+)?\.json$")
@@ -343,13 +350,14 @@ def post_comments_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFra
                 comment = _first_present(string_map_data, ["Comment", "Opmerking"])
                 owner = _first_present(string_map_data, ["Media Owner", "Media-eigenaar"])
                 time = _first_present(string_map_data, ["Time", "Tijd"])
-                datapoints.append((
+                table.append(
                     eh.fix_latin1_string(str(comment.get("value", ""))),
                     eh.fix_latin1_string(str(owner.get("value", ""))),
-                    eh.epoch_to_iso(time.get("timestamp", ""), errors=errors),
-                ))
+                    time.get("timestamp", ""),
+                )
 
-        out = pd.DataFrame(datapoints, columns=["Comment", "Media owner", "Date"])  # pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -367,28 +375,29 @@ def liked_comments_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFr
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Account name", "Value", "Date"])
 
     try:
         if isinstance(data, dict):
             items = data["likes_comment_likes"]  # pyright: ignore
             for item in items:
                 entry = item.get("string_list_data", [{}])[0]
-                datapoints.append((
+                table.append(
                     eh.fix_latin1_string(item.get("title", "")),
                     eh.fix_latin1_string(entry.get("value", "")),
-                    eh.epoch_to_iso(entry.get("timestamp", ""), errors=errors),
-                ))
+                    entry.get("timestamp", ""),
+                )
         else:
             for item in data:  # pyright: ignore
                 owner_name, owner_username, url = _extract_owner_details(item.get("label_values", []))
-                datapoints.append((
+                table.append(
                     owner_username or owner_name,
                     "",  # comment text not available in label_values format
-                    eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-                ))
+                    item.get("timestamp", ""),
+                )
 
-        out = pd.DataFrame(datapoints, columns=["Account name", "Value", "Date"])  # pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -398,6 +407,13 @@ def liked_comments_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFr
     return out
 
 
+LIKED_POST_COLUMNS = eh.PathExtractor({
+    "Account name": "title",
+    "Value": ["string_list_data.*.value", "string_map_data.*.value"],
+    "Date": ["string_list_data.*.timestamp", "string_map_data.*.timestamp"],
+})
+
+
 def liked_posts_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     result = reader.json("liked_posts.json")
@@ -406,28 +422,29 @@ def liked_posts_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Account name", "Value", "Date"])
 
     try:
         if isinstance(data, dict):
             items = data["likes_media_likes"]  # pyright: ignore
             for item in items:
-                d = eh.dict_denester(item)
-                datapoints.append((
-                    eh.fix_latin1_string(eh.find_item(d, "title")),
-                    eh.fix_latin1_string(eh.find_item(d, "value")),
-                    eh.epoch_to_iso(eh.find_item(d, "timestamp"), errors=errors),
-                ))
+                title, value, timestamp = LIKED_POST_COLUMNS.row(item)
+                table.append(
+                    eh.fix_latin1_string(title),
+                    eh.fix_latin1_string(value),
+                    timestamp,
+                )
         else:
             for item in data:  # pyright: ignore
                 owner_name, owner_username, url = _extract_owner_details(item.get("label_values", []))
-                datapoints.append((
+                table.append(
                     owner_username or owner_name,
                     owner_name,
-                    eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-                ))
+                    item.get("timestamp", ""),
+                )
 
-        out = pd.DataFrame(datapoints, columns=["Account name", "Value", "Date"])  # pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -437,6 +454,12 @@ def liked_posts_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame
     return out
 
 
+PROFILE_SEARCH_COLUMNS = eh.PathExtractor({
+    "Timestamp": ["string_list_data.*.timestamp", "string_map_data.*.timestamp"],
+    "Name": ["title", "string_list_data.*.value", "string_map_data.*.value"],
+})
+
+
 def profile_searches_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
     result = reader.json("profile_searches.json")
@@ -445,17 +468,12 @@ def profile_searches_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.Data
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
         items = data["searches_user"]  # pyright: ignore
-        for item in items:
-            d = eh.dict_denester(item)
-            datapoints.append((
-                eh.epoch_to_iso(eh.find_item(d, "timestamp"), errors=errors),
-                eh.fix_latin1_string(eh.find_item(d, "title") or eh.find_item(d, "value")),
-            ))
-        out = pd.DataFrame(datapoints, columns=["Timestamp", "Name"])  # pyright: ignore
+        out = PROFILE_SEARCH_COLUMNS.frame(items)
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
+        out["Name"] = out["Name"].map(eh.fix_latin1_string)
         out = _sort_by_date(out, "Timestamp")
 
     except Exception as e:
@@ -473,26 +491,27 @@ def story_likes_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Account name", "Date"])
 
     try:
         if isinstance(data, dict):
             items = data["story_activities_story_likes"]  # pyright: ignore
             for item in items:
                 entry = item.get("string_list_data", [{}])[0]
-                datapoints.append((
+                table.append(
                     eh.fix_latin1_string(item.get("title", "")),
-                    eh.epoch_to_iso(entry.get("timestamp", ""), errors=errors),
-                ))
+                    entry.get("timestamp", ""),
+                )
         else:
             for item in data:  # pyright: ignore
                 owner_name, owner_username, _ = _extract_owner_details(item.get("label_values", []))
-                datapoints.append((
+                table.append(
                     owner_username or owner_name,
-                    eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-                ))
+                    item.get("timestamp", ""),
+                )
 
-        out = pd.DataFrame(datapoints, columns=["Account name", "Date"])  # pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -510,7 +529,7 @@ def threads_viewed_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFr
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Author", "URL", "Date"])
 
     try:
         if isinstance(data, dict):
@@ -520,21 +539,22 @@ def threads_viewed_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFr
                 author = _first_present(string_map_data, ["Author", "Auteur"])
                 time = _first_present(string_map_data, ["Time", "Tijd"])
                 url = _first_present(string_map_data, ["URL"])
-                datapoints.append((
+                table.append(
                     eh.fix_latin1_string(str(author.get("value", ""))),
                     url.get("href", ""),
-                    eh.epoch_to_iso(time.get("timestamp", ""), errors=errors),
-                ))
+                    time.get("timestamp", ""),
+                )
         else:
             for item in data:  # pyright: ignore
                 owner_name, owner_username, url = _extract_owner_details(item.get("label_values", []))
-                datapoints.append((
+                table.append(
                     owner_username or owner_name,
                     url,
-                    eh.epoch_to_iso(item.get("timestamp", ""), errors=errors),
-                ))
+                    item.get("timestamp", ""),
+                )
 
-        out = pd.DataFrame(datapoints, columns=["Author", "URL", "Date"])  # pyright: ignore
+        out = table.frame()
+        out["Date"] = eh.epoch_to_datetime_column(out["Date"], errors=errors)
         out = _sort_by_date(out, "Date")
 
     except Exception as e:
@@ -552,7 +572,7 @@ def saved_posts_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame
     data = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Title", "URL", "Timestamp"])
 
     try:
         items = data["saved_saved_media"]  # pyright: ignore
@@ -563,12 +583,13 @@ def saved_posts_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame
                 entry = string_list[0] if string_list else {}
             else:
                 entry = _first_present(item.get("string_map_data", {}), ["Saved on", "Opgeslagen op"])
-            datapoints.append((
+            table.append(
                 title,
                 entry.get("href", ""),
-                eh.epoch_to_iso(entry.get("timestamp", ""), errors=errors),
-            ))
-        out = pd.DataFrame(datapoints, columns=["Title", "URL", "Timestamp"])  # pyright: ignore
+                entry.get("timestamp", ""),
+            )
+        out = table.frame()
+        out["Timestamp"] = eh.epoch_to_datetime_column(out["Timestamp"], errors=errors)
         out = _sort_by_date(out, "Timestamp")
 
     except Exception as e:
@@ -584,273 +605,273 @@ def saved_posts_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame
 
 def extraction(instagram_zip: str, validation) -> ExtractionResult:
     errors = Counter()
-    reader = ZipArchiveReader(instagram_zip, validation.archive_members, errors)
-
-    tables = [
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_followers",
-            data_frame=followers_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your Instagram followers",
-                "nl": "Je Instagram-volgers",
-            }),
-            description=props.Translatable({
-                "en": "List of accounts that follow you on Instagram.",
-                "nl": "Lijst van accounts die jou op Instagram volgen.",
-            }),
-            headers={
-                "Account": props.Translatable({"en": "Account", "nl": "Account"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_following",
-            data_frame=following_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Accounts that you follow on Instagram",
-                "nl": "Accounts die je volgt op Instagram",
-            }),
-            description=props.Translatable({
-                "en": "In this table, you find the accounts that you follow on Instagram.",
-                "nl": "In deze tabel zie je de accounts die je volgt op Instagram.",
-            }),
-            headers={
-                "Account": props.Translatable({"en": "Account", "nl": "Account"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_ads_viewed",
-            data_frame=ads_viewed_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Ads viewed on Instagram",
-                "nl": "Advertenties bekeken op Instagram",
-            }),
-            description=props.Translatable({
-                "en": "List of ads that you viewed on Instagram.",
-                "nl": "Lijst van advertenties die je op Instagram hebt bekeken.",
-            }),
-            headers={
-                "Account name": props.Translatable({"en": "Account name", "nl": "Accountnaam"}),
-                "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_posts_viewed",
-            data_frame=posts_viewed_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Posts viewed on Instagram",
-                "nl": "Berichten bekeken op Instagram",
-            }),
-            description=props.Translatable({
-                "en": "In this table you find the accounts of posts you viewed on Instagram sorted over time. Below, you find visualizations of different parts of this table. First, you find a timeline showing you the number of posts you viewed over time. Next, you find a histogram indicating how many posts you have viewed per hour of the day.",
-                "nl": "In deze tabel zie je de accounts van berichten die je op Instagram hebt bekeken, gesorteerd op tijd. Hieronder vind je visualisaties van verschillende onderdelen van deze tabel. Eerst zie je een tijdlijn met het aantal berichten dat je in de loop van de tijd hebt bekeken. Daarna zie je een histogram dat aangeeft hoeveel berichten je per uur van de dag hebt bekeken.",
-            }),
-            headers={
-                "Author": props.Translatable({"en": "Author", "nl": "Auteur"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "The total number of Instagram posts you viewed over time",
-                        "nl": "Het totale aantal Instagram-berichten dat je in de loop van de tijd hebt bekeken",
-                    },
-                    "type": "area",
-                    "group": {
-                        "column": "Date",
-                        "dateFormat": "auto",
-                    },
-                    "values": [{
-                        "label": "Count",
-                        "aggregate": "count",
-                    }],
+    with ZipArchiveReader(instagram_zip, validation.archive_members, errors, zip_file=validation.zip_file) as reader:
+
+        tables = [
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_followers",
+                data_frame=followers_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your Instagram followers",
+                    "nl": "Je Instagram-volgers",
+                }),
+                description=props.Translatable({
+                    "en": "List of accounts that follow you on Instagram.",
+                    "nl": "Lijst van accounts die jou op Instagram volgen.",
+                }),
+                headers={
+                    "Account": props.Translatable({"en": "Account", "nl": "Account"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_following",
+                data_frame=following_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Accounts that you follow on Instagram",
+                    "nl": "Accounts die je volgt op Instagram",
+                }),
+                description=props.Translatable({
+                    "en": "In this table, you find the accounts that you follow on Instagram.",
+                    "nl": "In deze tabel zie je de accounts die je volgt op Instagram.",
+                }),
+                headers={
+                    "Account": props.Translatable({"en": "Account", "nl": "Account"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_ads_viewed",
+                data_frame=ads_viewed_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Ads viewed on Instagram",
+                    "nl": "Advertenties bekeken op Instagram",
+                }),
+                description=props.Translatable({
+                    "en": "List of ads that you viewed on Instagram.",
+                    "nl": "Lijst van advertenties die je op Instagram hebt bekeken.",
+                }),
+                headers={
+                    "Account name": props.Translatable({"en": "Account name", "nl": "Accountnaam"}),
+                    "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_posts_viewed",
+                data_frame=posts_viewed_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Posts viewed on Instagram",
+                    "nl": "Berichten bekeken op Instagram",
+                }),
+                description=props.Translatable({
+                    "en": "In this table you find the accounts of posts you viewed on Instagram sorted over time. Below, you find visualizations of different parts of this table. First, you find a timeline showing you the number of posts you viewed over time. Next, you find a histogram indicating how many posts you have viewed per hour of the day.",
+                    "nl": "In deze tabel zie je de accounts van berichten die je op Instagram hebt bekeken, gesorteerd op tijd. Hieronder vind je visualisaties van verschillende onderdelen van deze tabel. Eerst zie je een tijdlijn met het aantal berichten dat je in de loop van de tijd hebt bekeken. Daarna zie je een histogram dat aangeeft hoeveel berichten je per uur van de dag hebt bekeken.",
+                }),
+                headers={
+                    "Author": props.Translatable({"en": "Author", "nl": "Auteur"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
                 },
-                {
-                    "title": {
-                        "en": "The total number of Instagram posts you have viewed per hour of the day",
-                        "nl": "Het totale aantal Instagram-berichten dat je per uur van de dag hebt bekeken",
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "The total number of Instagram posts you viewed over time",
+                            "nl": "Het totale aantal Instagram-berichten dat je in de loop van de tijd hebt bekeken",
+                        },
+                        "type": "area",
+                        "group": {
+                            "column": "Date",
+                            "dateFormat": "auto",
+                        },
+                        "values": [{
+                            "label": "Count",
+                            "aggregate": "count",
+                        }],
                     },
-                    "type": "bar",
-                    "group": {
-                        "column": "Date",
-                        "dateFormat": "hour_cycle",
-                        "label": "Hour of the day",
+                    {
+                        "title": {
+                            "en": "The total number of Instagram posts you have viewed per hour of the day",
+                            "nl": "Het totale aantal Instagram-berichten dat je per uur van de dag hebt bekeken",
+                        },
+                        "type": "bar",
+                        "group": {
+                            "column": "Date",
+                            "dateFormat": "hour_cycle",
+                            "label": "Hour of the day",
+                        },
+                        "values": [{
+                            "label": "Count",
+                        }],
                     },
-                    "values": [{
-                        "label": "Count",
-                    }],
+                ],
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_videos_watched",
+                data_frame=videos_watched_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Videos watched on Instagram",
+                    "nl": "Video's bekeken op Instagram",
+                }),
+                description=props.Translatable({
+                    "en": "In this table you find the accounts of videos you watched on Instagram sorted over time. Below, you find a timeline showing you the number of videos you watched over time.",
+                    "nl": "In deze tabel zie je de accounts van video's die je op Instagram hebt bekeken, gesorteerd op tijd. Hieronder zie je een tijdlijn met het aantal video's dat je in de loop van de tijd hebt bekeken.",
+                }),
+                headers={
+                    "Author": props.Translatable({"en": "Author", "nl": "Auteur"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
                 },
-            ],
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_videos_watched",
-            data_frame=videos_watched_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Videos watched on Instagram",
-                "nl": "Video's bekeken op Instagram",
-            }),
-            description=props.Translatable({
-                "en": "In this table you find the accounts of videos you watched on Instagram sorted over time. Below, you find a timeline showing you the number of videos you watched over time.",
-                "nl": "In deze tabel zie je de accounts van video's die je op Instagram hebt bekeken, gesorteerd op tijd. Hieronder zie je een tijdlijn met het aantal video's dat je in de loop van de tijd hebt bekeken.",
-            }),
-            headers={
-                "Author": props.Translatable({"en": "Author", "nl": "Auteur"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "The total number of videos watched on Instagram over time",
-                        "nl": "Het totale aantal video's dat je op Instagram hebt bekeken in de loop van de tijd",
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "The total number of videos watched on Instagram over time",
+                            "nl": "Het totale aantal video's dat je op Instagram hebt bekeken in de loop van de tijd",
+                        },
+                        "type": "area",
+                        "group": {
+                            "column": "Date",
+                            "dateFormat": "auto",
+                        },
+                        "values": [{
+                            "aggregate": "count",
+                            "label": "Count",
+                        }],
                     },
-                    "type": "area",
-                    "group": {
-                        "column": "Date",
-                        "dateFormat": "auto",
-                    },
-                    "values": [{
-                        "aggregate": "count",
-                        "label": "Count",
-                    }],
+                ],
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_post_comments",
+                data_frame=post_comments_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Comments posted on Instagram",
+                    "nl": "Reacties geplaatst op Instagram",
+                }),
+                description=props.Translatable({
+                    "en": "List of comments you posted on Instagram.",
+                    "nl": "Lijst van reacties die je op Instagram hebt geplaatst.",
+                }),
+                headers={
+                    "Comment": props.Translatable({"en": "Comment", "nl": "Reactie"}),
+                    "Media owner": props.Translatable({"en": "Media owner", "nl": "Media-eigenaar"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_liked_comments",
+                data_frame=liked_comments_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Instagram liked comments",
+                    "nl": "Instagram-reacties die je leuk vond",
+                }),
+                description=props.Translatable({
+                    "en": "List of comments that you liked on Instagram.",
+                    "nl": "Lijst van reacties die je leuk vond op Instagram.",
+                }),
+                headers={
+                    "Account name": props.Translatable({"en": "Account name", "nl": "Accountnaam"}),
+                    "Value": props.Translatable({"en": "Value", "nl": "Waarde"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_liked_posts",
+                data_frame=liked_posts_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Instagram liked posts",
+                    "nl": "Instagram-berichten die je leuk vond",
+                }),
+                description=props.Translatable({
+                    "en": "",
+                    "nl": "",
+                }),
+                headers={
+                    "Account name": props.Translatable({"en": "Account name", "nl": "Accountnaam"}),
+                    "Value": props.Translatable({"en": "Value", "nl": "Waarde"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
                 },
-            ],
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_post_comments",
-            data_frame=post_comments_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Comments posted on Instagram",
-                "nl": "Reacties geplaatst op Instagram",
-            }),
-            description=props.Translatable({
-                "en": "List of comments you posted on Instagram.",
-                "nl": "Lijst van reacties die je op Instagram hebt geplaatst.",
-            }),
-            headers={
-                "Comment": props.Translatable({"en": "Comment", "nl": "Reactie"}),
-                "Media owner": props.Translatable({"en": "Media owner", "nl": "Media-eigenaar"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_liked_comments",
-            data_frame=liked_comments_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Instagram liked comments",
-                "nl": "Instagram-reacties die je leuk vond",
-            }),
-            description=props.Translatable({
-                "en": "List of comments that you liked on Instagram.",
-                "nl": "Lijst van reacties die je leuk vond op Instagram.",
-            }),
-            headers={
-                "Account name": props.Translatable({"en": "Account name", "nl": "Accountnaam"}),
-                "Value": props.Translatable({"en": "Value", "nl": "Waarde"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_liked_posts",
-            data_frame=liked_posts_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Instagram liked posts",
-                "nl": "Instagram-berichten die je leuk vond",
-            }),
-            description=props.Translatable({
-                "en": "",
-                "nl": "",
-            }),
-            headers={
-                "Account name": props.Translatable({"en": "Account name", "nl": "Accountnaam"}),
-                "Value": props.Translatable({"en": "Value", "nl": "Waarde"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "Most liked accounts",
-                        "nl": "Meest gelikete accounts",
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "Most liked accounts",
+                            "nl": "Meest gelikete accounts",
+                        },
+                        "type": "wordcloud",
+                        "textColumn": "Account name",
+                        "tokenize": False,
                     },
-                    "type": "wordcloud",
-                    "textColumn": "Account name",
-                    "tokenize": False,
+                ],
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_profile_searches",
+                data_frame=profile_searches_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your Instagram profile searches",
+                    "nl": "Je Instagram-profielzoekopdrachten",
+                }),
+                description=props.Translatable({
+                    "en": "List of profiles you have searched for on Instagram.",
+                    "nl": "Lijst van profielen die je op Instagram hebt gezocht.",
+                }),
+                headers={
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                    "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_story_likes",
+                data_frame=story_likes_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Story likes on Instagram",
+                    "nl": "Story-likes op Instagram",
+                }),
+                description=props.Translatable({
+                    "en": "List of Instagram stories you liked.",
+                    "nl": "Lijst van Instagram-stories die je leuk vond.",
+                }),
+                headers={
+                    "Account name": props.Translatable({"en": "Account name", "nl": "Accountnaam"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_threads_viewed",
+                data_frame=threads_viewed_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Threads viewed",
+                    "nl": "Threads bekeken",
+                }),
+                description=props.Translatable({
+                    "en": "List of Threads posts you viewed.",
+                    "nl": "Lijst van Threads-berichten die je hebt bekeken.",
+                }),
+                headers={
+                    "Author": props.Translatable({"en": "Author", "nl": "Auteur"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="instagram_saved_posts",
+                data_frame=saved_posts_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your saved posts on Instagram",
+                    "nl": "Je opgeslagen berichten op Instagram",
+                }),
+                description=props.Translatable({
+                    "en": "List of posts you have saved on Instagram.",
+                    "nl": "Lijst van berichten die je hebt opgeslagen op Instagram.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
                 },
-            ],
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_profile_searches",
-            data_frame=profile_searches_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your Instagram profile searches",
-                "nl": "Je Instagram-profielzoekopdrachten",
-            }),
-            description=props.Translatable({
-                "en": "List of profiles you have searched for on Instagram.",
-                "nl": "Lijst van profielen die je op Instagram hebt gezocht.",
-            }),
-            headers={
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-                "Name": props.Translatable({"en": "Name", "nl": "Naam"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_story_likes",
-            data_frame=story_likes_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Story likes on Instagram",
-                "nl": "Story-likes op Instagram",
-            }),
-            description=props.Translatable({
-                "en": "List of Instagram stories you liked.",
-                "nl": "Lijst van Instagram-stories die je leuk vond.",
-            }),
-            headers={
-                "Account name": props.Translatable({"en": "Account name", "nl": "Accountnaam"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_threads_viewed",
-            data_frame=threads_viewed_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Threads viewed",
-                "nl": "Threads bekeken",
-            }),
-            description=props.Translatable({
-                "en": "List of Threads posts you viewed.",
-                "nl": "Lijst van Threads-berichten die je hebt bekeken.",
-            }),
-            headers={
-                "Author": props.Translatable({"en": "Author", "nl": "Auteur"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Date": props.Translatable({"en": "Date", "nl": "Datum en tijd"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="instagram_saved_posts",
-            data_frame=saved_posts_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your saved posts on Instagram",
-                "nl": "Je opgeslagen berichten op Instagram",
-            }),
-            description=props.Translatable({
-                "en": "List of posts you have saved on Instagram.",
-                "nl": "Lijst van berichten die je hebt opgeslagen op Instagram.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-        ),
-    ]
+            ),
+        ]
 
     return ExtractionResult(
         tables=[table for table in tables if not table.data_frame.empty],
@@ -863,7 +884,7 @@ class InstagramFlow(FlowBuilder):
         super().__init__(session_id, "Instagram")
 
     def validate_file(self, file):
-        return validate.validate_zip(DDP_CATEGORIES, file)
+        return validate.validate_zip(DDP_CATEGORIES, file, keep_open=True)
 
     def extract_data(self, file_value, validation):
         return extraction(file_value, validation)
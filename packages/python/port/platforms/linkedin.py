@@ -9,8 +9,7 @@ It handles DDPs in the english language with filetype CSV.
 
 import logging
 from collections import Counter
-import io
-import re
+from typing import IO
 
 import pandas as pd
 
@@ -63,18 +62,30 @@ DDP_CATEGORIES = [
     ),
 ]
 
-def strip_notes(b: io.BytesIO) -> io.BytesIO:
+def strip_notes(b: IO[bytes]) -> IO[bytes]:
     """
     Strip notes LinkedIn puts at the start of CSV files
+
+    Everything up to and including the first blank line is skipped. The
+    stream is scanned in chunks and repositioned past the notes, so the
+    CSV itself is never held in memory.
     """
 
     try:
-        pattern = re.compile(rb'^(.*?)\n\n', re.DOTALL)
-        out = io.BytesIO(pattern.sub(b'', b.read()))
-    except Exception:
-        out = b
-
-    return out
+        offset = 0
+        tail = b""
+        while chunk := b.read(eh.STREAM_CHUNK_SIZE):
+            found = (tail + chunk).find(b"\n\n")
+            if found >= 0:
+                b.seek(offset - len(tail) + found + 2)
+                return b
+            offset += len(chunk)
+            tail = chunk[-1:]
+        b.seek(0)
+    except Exception as e:
+        logger.debug("Could not strip notes: %s", type(e).__name__)
+
+    return b
 
 
 def company_follows_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
@@ -91,24 +102,20 @@ def member_follows_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFr
     """
     'Member_Follows.csv'
     """
-    result = reader.raw("Member_Follows.csv")
-    if not result.found:
-        return pd.DataFrame()
-    b = strip_notes(result.data)
-    df = eh.read_csv_from_bytes_to_df(b)
-    return df
+    with reader.open("Member_Follows.csv") as result:
+        if not result.found:
+            return pd.DataFrame()
+        return eh.read_csv_from_bytes_to_df(strip_notes(result.data))
 
 
 def connections_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     """
     'Connections.csv'
     """
-    result = reader.raw("Connections.csv")
-    if not result.found:
-        return pd.DataFrame()
-    b = strip_notes(result.data)
-    df = eh.read_csv_from_bytes_to_df(b)
-    return df
+    with reader.open("Connections.csv") as result:
+        if not result.found:
+            return pd.DataFrame()
+        return eh.read_csv_from_bytes_to_df(strip_notes(result.data))
 
 
 def reactions_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
@@ -163,162 +170,162 @@ def comments_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
 def extraction(linkedin_zip: str, validation: validate.ValidateInput) -> ExtractionResult:
     errors = Counter()
-    reader = ZipArchiveReader(linkedin_zip, validation.archive_members, errors)
-    tables = [
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="linkedin_ads_clicked",
-            data_frame=ads_clicked_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Ads you clicked on",
-                "nl": "Ads clicked"
-            }),
-            description=props.Translatable({
-                "en": "Record of advertisements you have clicked on while using LinkedIn. Note: LinkedIn only provides numeric ad IDs, not ad titles or descriptions.",
-                "nl": "Overzicht van advertenties waarop je hebt geklikt tijdens het gebruik van LinkedIn. Let op: LinkedIn geeft alleen numerieke advertentie-ID's, geen titels of beschrijvingen.",
-            }),
-            headers={
-                "Ad clicked Date": props.Translatable({"en": "Ad clicked Date", "nl": "Advertentiedatum"}),
-                "Ad Title/Id": props.Translatable({"en": "Ad Title/Id", "nl": "Advertentietitel/id"}),
-            }
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="linkedin_comments",
-            data_frame=comments_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your comments on LinkedIn",
-                "nl": "Comments"
-            }),
-            description=props.Translatable({
-                "en": "Comments you've posted on LinkedIn content",
-                "nl": "Reacties die je hebt geplaatst op LinkedIn-content"
-            }),
-            headers={
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-                "Message": props.Translatable({"en": "Message", "nl": "Bericht"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "Words in your comments",
-                        "nl": "Words in your comments"
-                    },
-                    "type": "wordcloud",
-                    "textColumn": "Message",
-                    "tokenize": True
+    with ZipArchiveReader(linkedin_zip, validation.archive_members, errors, zip_file=validation.zip_file) as reader:
+        tables = [
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="linkedin_ads_clicked",
+                data_frame=ads_clicked_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Ads you clicked on",
+                    "nl": "Ads clicked"
+                }),
+                description=props.Translatable({
+                    "en": "Record of advertisements you have clicked on while using LinkedIn. Note: LinkedIn only provides numeric ad IDs, not ad titles or descriptions.",
+                    "nl": "Overzicht van advertenties waarop je hebt geklikt tijdens het gebruik van LinkedIn. Let op: LinkedIn geeft alleen numerieke advertentie-ID's, geen titels of beschrijvingen.",
+                }),
+                headers={
+                    "Ad clicked Date": props.Translatable({"en": "Ad clicked Date", "nl": "Advertentiedatum"}),
+                    "Ad Title/Id": props.Translatable({"en": "Ad Title/Id", "nl": "Advertentietitel/id"}),
                 }
-            ]
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="linked_in_company_follows",
-            data_frame=company_follows_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Companies you follow",
-                "nl": "Company follows"
-            }),
-            description=props.Translatable({
-                "en": "List of companies you are following on LinkedIn",
-                "nl": "Lijst van bedrijven die je volgt op LinkedIn"
-            }),
-            headers={
-                "Organization": props.Translatable({"en": "Organization", "nl": "Organisatie"}),
-                "Followed On": props.Translatable({"en": "Followed On", "nl": "Gevolgd op"}),
-            }
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="linkedin_shares",
-            data_frame=shares_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Posts you shared on LinkedIn",
-                "nl": "Shares"
-            }),
-            description=props.Translatable({
-                "en": "Content you've shared with your network on LinkedIn",
-                "nl": "Content die je hebt gedeeld met je netwerk op LinkedIn"
-            }),
-            headers={
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-                "ShareLink": props.Translatable({"en": "ShareLink", "nl": "Gedeelde link"}),
-                "ShareCommentary": props.Translatable({"en": "ShareCommentary", "nl": "Gedeelde tekst"}),
-                "SharedUrl": props.Translatable({"en": "SharedUrl", "nl": "Gedeelde URL"}),
-                "MediaUrl": props.Translatable({"en": "MediaUrl", "nl": "Media-URL"}),
-                "Visibility": props.Translatable({"en": "Visibility", "nl": "Zichtbaarheid"}),
-            }
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="linkedin_reactions",
-            data_frame=reactions_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your reactions on LinkedIn",
-                "nl": "Reactions"
-            }),
-            description=props.Translatable({
-                "en": "Record of your reactions to posts and content on LinkedIn",
-                "nl": "Overzicht van je reacties op berichten en content op LinkedIn"
-            }),
-            headers={
-                "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
-                "Type": props.Translatable({"en": "Type", "nl": "Type"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "The type of reactions you put under posts on Linkedin",
-                        "nl": "The type of reactions you put under posts on Linkedin"
-                    },
-                    "type": "wordcloud",
-                    "textColumn": "Type",
-                    "tokenize": True
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="linkedin_comments",
+                data_frame=comments_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your comments on LinkedIn",
+                    "nl": "Comments"
+                }),
+                description=props.Translatable({
+                    "en": "Comments you've posted on LinkedIn content",
+                    "nl": "Reacties die je hebt geplaatst op LinkedIn-content"
+                }),
+                headers={
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                    "Message": props.Translatable({"en": "Message", "nl": "Bericht"}),
+                },
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "Words in your comments",
+                            "nl": "Words in your comments"
+                        },
+                        "type": "wordcloud",
+                        "textColumn": "Message",
+                        "tokenize": True
+                    }
+                ]
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="linked_in_company_follows",
+                data_frame=company_follows_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Companies you follow",
+                    "nl": "Company follows"
+                }),
+                description=props.Translatable({
+                    "en": "List of companies you are following on LinkedIn",
+                    "nl": "Lijst van bedrijven die je volgt op LinkedIn"
+                }),
+                headers={
+                    "Organization": props.Translatable({"en": "Organization", "nl": "Organisatie"}),
+                    "Followed On": props.Translatable({"en": "Followed On", "nl": "Gevolgd op"}),
                 }
-            ]
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="linkedin_connections",
-            data_frame=connections_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your LinkedIn connections",
-                "nl": "Je LinkedIn-connecties"
-            }),
-            description=props.Translatable({
-                "en": "List of people you are connected with on LinkedIn",
-                "nl": "Lijst van mensen met wie je verbonden bent op LinkedIn"
-            }),
-            headers={
-                "First Name": props.Translatable({"en": "First Name", "nl": "Voornaam"}),
-                "Last Name": props.Translatable({"en": "Last Name", "nl": "Achternaam"}),
-                "Email Address": props.Translatable({"en": "Email Address", "nl": "E-mailadres"}),
-                "Company": props.Translatable({"en": "Company", "nl": "Bedrijf"}),
-                "Position": props.Translatable({"en": "Position", "nl": "Functie"}),
-                "Connected On": props.Translatable({"en": "Connected On", "nl": "Verbonden op"}),
-            }
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="linkedin_search_queries",
-            data_frame=search_queries_to_df(reader, errors),
-            title=props.Translatable({
-                "en": "Your search queries on LinkedIn",
-                "nl": "Search queries"
-            }),
-            description=props.Translatable({
-                "en": "Terms and phrases you've searched for on LinkedIn",
-                "nl": "Termen en zinnen waarnaar je hebt gezocht op LinkedIn"
-            }),
-            headers={
-                "Time": props.Translatable({"en": "Time", "nl": "Tijd"}),
-                "Search Query": props.Translatable({"en": "Search Query", "nl": "Zoekterm"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "What you searched for on Linkedin",
-                        "nl": "What you searched for on Linkedin"
-                    },
-                    "type": "wordcloud",
-                    "textColumn": "Search Query",
-                    "tokenize": True
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="linkedin_shares",
+                data_frame=shares_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Posts you shared on LinkedIn",
+                    "nl": "Shares"
+                }),
+                description=props.Translatable({
+                    "en": "Content you've shared with your network on LinkedIn",
+                    "nl": "Content die je hebt gedeeld met je netwerk op LinkedIn"
+                }),
+                headers={
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                    "ShareLink": props.Translatable({"en": "ShareLink", "nl": "Gedeelde link"}),
+                    "ShareCommentary": props.Translatable({"en": "ShareCommentary", "nl": "Gedeelde tekst"}),
+                    "SharedUrl": props.Translatable({"en": "SharedUrl", "nl": "Gedeelde URL"}),
+                    "MediaUrl": props.Translatable({"en": "MediaUrl", "nl": "Media-URL"}),
+                    "Visibility": props.Translatable({"en": "Visibility", "nl": "Zichtbaarheid"}),
                 }
-            ]
-        )
-    ]
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="linkedin_reactions",
+                data_frame=reactions_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your reactions on LinkedIn",
+                    "nl": "Reactions"
+                }),
+                description=props.Translatable({
+                    "en": "Record of your reactions to posts and content on LinkedIn",
+                    "nl": "Overzicht van je reacties op berichten en content op LinkedIn"
+                }),
+                headers={
+                    "Date": props.Translatable({"en": "Date", "nl": "Datum"}),
+                    "Type": props.Translatable({"en": "Type", "nl": "Type"}),
+                },
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "The type of reactions you put under posts on Linkedin",
+                            "nl": "The type of reactions you put under posts on Linkedin"
+                        },
+                        "type": "wordcloud",
+                        "textColumn": "Type",
+                        "tokenize": True
+                    }
+                ]
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="linkedin_connections",
+                data_frame=connections_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your LinkedIn connections",
+                    "nl": "Je LinkedIn-connecties"
+                }),
+                description=props.Translatable({
+                    "en": "List of people you are connected with on LinkedIn",
+                    "nl": "Lijst van mensen met wie je verbonden bent op LinkedIn"
+                }),
+                headers={
+                    "First Name": props.Translatable({"en": "First Name", "nl": "Voornaam"}),
+                    "Last Name": props.Translatable({"en": "Last Name", "nl": "Achternaam"}),
+                    "Email Address": props.Translatable({"en": "Email Address", "nl": "E-mailadres"}),
+                    "Company": props.Translatable({"en": "Company", "nl": "Bedrijf"}),
+                    "Position": props.Translatable({"en": "Position", "nl": "Functie"}),
+                    "Connected On": props.Translatable({"en": "Connected On", "nl": "Verbonden op"}),
+                }
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="linkedin_search_queries",
+                data_frame=search_queries_to_df(reader, errors),
+                title=props.Translatable({
+                    "en": "Your search queries on LinkedIn",
+                    "nl": "Search queries"
+                }),
+                description=props.Translatable({
+                    "en": "Terms and phrases you've searched for on LinkedIn",
+                    "nl": "Termen en zinnen waarnaar je hebt gezocht op LinkedIn"
+                }),
+                headers={
+                    "Time": props.Translatable({"en": "Time", "nl": "Tijd"}),
+                    "Search Query": props.Translatable({"en": "Search Query", "nl": "Zoekterm"}),
+                },
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "What you searched for on Linkedin",
+                            "nl": "What you searched for on Linkedin"
+                        },
+                        "type": "wordcloud",
+                        "textColumn": "Search Query",
+                        "tokenize": True
+                    }
+                ]
+            )
+        ]
 
     return ExtractionResult(
         tables=[table for table in tables if not table.data_frame.empty],
@@ -331,7 +338,7 @@ class LinkedInFlow(FlowBuilder):
         super().__init__(session_id, "LinkedIn")
 
     def validate_file(self, file):
-        return validate.validate_zip(DDP_CATEGORIES, file)
+        return validate.validate_zip(DDP_CATEGORIES, file, keep_open=True)
 
     def extract_data(self, file_value, validation):
         return extraction(file_value, validation)
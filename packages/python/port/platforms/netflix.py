@@ -299,27 +299,27 @@ class NetflixFlow(FlowBuilder):
         super().__init__(session_id, "Netflix")
 
     def validate_file(self, file):
-        return validate.validate_zip(DDP_CATEGORIES, file)
+        return validate.validate_zip(DDP_CATEGORIES, file, keep_open=True)
 
     def extract_data(self, file, validation):
         errors = Counter()
-        reader = ZipArchiveReader(file, validation.archive_members, errors)
-        selected_user = ""
-        users = extract_users(reader)
-
-        if len(users) == 1:
-            selected_user = users[0]
-            return extraction(reader, selected_user)
-        elif len(users) > 1:
-            title = props.Translatable({
-                "en": "Select your Netflix profile name",
-                "nl": "Kies jouw Netflix profielnaam",
-            })
-            empty_text = props.Translatable({"en": "", "nl": ""})
-            radio_prompt = ph.generate_radio_prompt(title, empty_text, users)
-            selection = yield ph.render_page(empty_text, radio_prompt)
-            selected_user = selection.value
-            return extraction(reader, selected_user)
+        with ZipArchiveReader(file, validation.archive_members, errors, zip_file=validation.zip_file) as reader:
+            selected_user = ""
+            users = extract_users(reader)
+
+            if len(users) == 1:
+                selected_user = users[0]
+                return extraction(reader, selected_user)
+            elif len(users) > 1:
+                title = props.Translatable({
+                    "en": "Select your Netflix profile name",
+                    "nl": "Kies jouw Netflix profielnaam",
+                })
+                empty_text = props.Translatable({"en": "", "nl": ""})
+                radio_prompt = ph.generate_radio_prompt(title, empty_text, users)
+                selection = yield ph.render_page(empty_text, radio_prompt)
+                selected_user = selection.value
+                return extraction(reader, selected_user)
 
 
 def process(session_id):
@@ -124,13 +124,13 @@ def activity_summary_to_df(data: dict, errors: Counter) -> pd.DataFrame:
             ("Videos commented on since registration", ["videosCommentedOnSinceAccountRegistration", "commentVideoCount"]),
             ("Videos shared since registration", ["videosSharedSinceAccountRegistration", "sharedVideoCount"]),
         ]
-        rows = []
+        table = eh.TableBuilder(["Metric", "Count"])
         for label, keys in metric_priority:
             for key in keys:
                 if key in summary:
-                    rows.append((label, summary[key]))
+                    table.append(label, summary[key])
                     break
-        out = pd.DataFrame(rows, columns=["Metric", "Count"])  # pyright: ignore
+        out = table.frame()
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -153,19 +153,17 @@ def settings_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         if not isinstance(settings_map, dict):
             return out
 
-        rows = []
+        table = eh.TableBuilder(["Setting", "Keywords"])
         content_preferences = settings_map.get("Content Preferences", {})
         if isinstance(content_preferences, dict):
             field_map = {
                 "Keyword filters for videos in Following feed": "Keyword filter for videos in the following feed",
                 "Keyword filters for videos in For You feed": "Keyword filters for videos in For You feed",
             }
-            rows.extend(
-                (label, ", ".join(content_preferences.get(key, [])))
-                for key, label in field_map.items()
-                if key in content_preferences
-            )
-        out = pd.DataFrame(rows, columns=["Setting", "Keywords"])  # pyright: ignore
+            for key, label in field_map.items():
+                if key in content_preferences:
+                    table.append(label, ", ".join(content_preferences.get(key, [])))
+        out = table.frame()
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -187,8 +185,10 @@ def watch_history_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         )
         if not isinstance(items, list):
             return out
-        rows = [(_item_get(item, "Date"), _item_get(item, "Link")) for item in items]
-        out = pd.DataFrame(rows, columns=["Date", "Link"])  # pyright: ignore
+        table = eh.TableBuilder(["Date", "Link"])
+        for item in items:
+            table.append(_item_get(item, "Date"), _item_get(item, "Link"))
+        out = table.frame()
         out = out.sort_values("Date", ascending=False)
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -210,8 +210,10 @@ def favorite_videos_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         )
         if not isinstance(items, list):
             return out
-        rows = [(_item_get(item, "Date"), _item_get(item, "Link")) for item in items]
-        out = pd.DataFrame(rows, columns=["Date", "Link"])  # pyright: ignore
+        table = eh.TableBuilder(["Date", "Link"])
+        for item in items:
+            table.append(_item_get(item, "Date"), _item_get(item, "Link"))
+        out = table.frame()
         out = out.sort_values("Date", ascending=False)
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -233,8 +235,10 @@ def follower_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         )
         if not isinstance(items, list):
             return out
-        rows = [(_item_get(item, "Date"), _item_get(item, "UserName")) for item in items]
-        out = pd.DataFrame(rows, columns=["Date", "UserName"])  # pyright: ignore
+        table = eh.TableBuilder(["Date", "UserName"])
+        for item in items:
+            table.append(_item_get(item, "Date"), _item_get(item, "UserName"))
+        out = table.frame()
         out = out.sort_values("Date", ascending=False)
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -256,8 +260,10 @@ def following_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         )
         if not isinstance(items, list):
             return out
-        rows = [(_item_get(item, "Date"), _item_get(item, "UserName")) for item in items]
-        out = pd.DataFrame(rows, columns=["Date", "UserName"])  # pyright: ignore
+        table = eh.TableBuilder(["Date", "UserName"])
+        for item in items:
+            table.append(_item_get(item, "Date"), _item_get(item, "UserName"))
+        out = table.frame()
         out = out.sort_values("Date", ascending=False)
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -280,11 +286,10 @@ def hashtag_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         )
         if not isinstance(items, list):
             return out
-        rows = [
-            (_item_get(item, "HashtagName"), _item_get(item, "HashtagLink"))
-            for item in items
-        ]
-        out = pd.DataFrame(rows, columns=["HashtagName", "HashtagLink"])  # pyright: ignore
+        table = eh.TableBuilder(["HashtagName", "HashtagLink"])
+        for item in items:
+            table.append(_item_get(item, "HashtagName"), _item_get(item, "HashtagLink"))
+        out = table.frame()
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -305,8 +310,10 @@ def like_list_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         )
         if not isinstance(items, list):
             return out
-        rows = [(_item_get(item, "Date"), _item_get(item, "Link")) for item in items]
-        out = pd.DataFrame(rows, columns=["Date", "Link"])  # pyright: ignore
+        table = eh.TableBuilder(["Date", "Link"])
+        for item in items:
+            table.append(_item_get(item, "Date"), _item_get(item, "Link"))
+        out = table.frame()
         out = out.sort_values("Date", ascending=False)
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -329,8 +336,10 @@ def searches_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         )
         if not isinstance(items, list):
             return out
-        rows = [(_item_get(item, "Date"), _item_get(item, "SearchTerm")) for item in items]
-        out = pd.DataFrame(rows, columns=["Date", "SearchTerm"])  # pyright: ignore
+        table = eh.TableBuilder(["Date", "SearchTerm"])
+        for item in items:
+            table.append(_item_get(item, "Date"), _item_get(item, "SearchTerm"))
+        out = table.frame()
         out = out.sort_values("Date", ascending=False)
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -353,16 +362,15 @@ def share_history_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         )
         if not isinstance(items, list):
             return out
-        rows = [
-            (
+        table = eh.TableBuilder(["Date", "SharedContent", "Link", "Method"])
+        for item in items:
+            table.append(
                 _item_get(item, "Date"),
                 _item_get(item, "SharedContent"),
                 _item_get(item, "Link"),
                 _item_get(item, "Method"),
             )
-            for item in items
-        ]
-        out = pd.DataFrame(rows, columns=["Date", "SharedContent", "Link", "Method"])  # pyright: ignore
+        out = table.frame()
         out = out.sort_values("Date", ascending=False)
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -380,16 +388,15 @@ def comments_to_df(data: dict, errors: Counter) -> pd.DataFrame:
         items = _get(data, "Comment", "Comments", "CommentsList")
         if not isinstance(items, list):
             return out
-        rows = [
-            (
+        table = eh.TableBuilder(["Date", "Comment", "Photo", "Url"])
+        for item in items:
+            table.append(
                 _item_get(item, "Date"),
                 _item_get(item, "Comment"),
                 _item_get(item, "Photo"),
                 _item_get(item, "Url"),
             )
-            for item in items
-        ]
-        out = pd.DataFrame(rows, columns=["Date", "Comment", "Photo", "Url"])  # pyright: ignore
+        out = table.frame()
         out = out.sort_values("Date", ascending=False)
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -403,8 +410,8 @@ def comments_to_df(data: dict, errors: Counter) -> pd.DataFrame:
 
 def extraction(tiktok_zip: str, validation) -> ExtractionResult:
     errors = Counter()
-    reader = ZipArchiveReader(tiktok_zip, validation.archive_members, errors)
-    data = _load_user_data(reader)
+    with ZipArchiveReader(tiktok_zip, validation.archive_members, errors, zip_file=validation.zip_file) as reader:
+        data = _load_user_data(reader)
 
     tables = [
         d3i_props.PropsUIPromptConsentFormTableViz(
@@ -623,7 +630,7 @@ class TikTokFlow(FlowBuilder):
         return ph.generate_file_prompt("application/json, application/zip")
 
     def validate_file(self, file):
-        return validate.validate_zip(DDP_CATEGORIES, file)
+        return validate.validate_zip(DDP_CATEGORIES, file, keep_open=True)
 
     def extract_data(self, file_value, validation):
         return extraction(file_value, validation)
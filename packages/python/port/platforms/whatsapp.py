@@ -7,10 +7,11 @@ Assumptions:
 It handles DDPs containing a group chat. This extraction is not perfect because the text file containg the group chat does not follow a structure, however it performs well enough.
 """
 
-from typing import Tuple, TypedDict
+from typing import Iterable, Iterator, Tuple
 from collections import Counter
 from dateutil import parser
 import unicodedata
+import itertools
 import logging
 import zipfile
 import re
@@ -21,6 +22,7 @@ import port.api.props as props
 import port.api.d3i_props as d3i_props
 from port.api.d3i_props import ExtractionResult
 import port.helpers.validate as validate
+import port.helpers.extraction_helpers as eh
 from port.helpers.flow_builder import FlowBuilder
 from port.helpers.emoji_pattern import EMOJI_PATTERN
 
@@ -99,6 +101,7 @@ def generate_regexes(simplified_regexes):
 
 
 REGEXES =  generate_regexes(SIMPLIFIED_REGEXES)
+COMPILED_REGEXES = [re.compile(regex) for regex in REGEXES]
 
 
 def remove_unwanted_characters(s: str) -> str:
@@ -107,7 +110,10 @@ def remove_unwanted_characters(s: str) -> str:
 
     Keeps empjis intact
     """
-    s = "".join(ch for ch in s if unicodedata.category(ch)[0]!="C")
+    # Line endings are control characters; printable lines have no others
+    s = s.rstrip("\r\n")
+    if not s.isprintable():
+        s = "".join(ch for ch in s if unicodedata.category(ch)[0]!="C")
     s = unicodedata.normalize("NFKD", s)
     return s
 
@@ -120,32 +126,6 @@ def convert_to_iso8601(timestamp):
         return timestamp
 
 
-class Datapoint(TypedDict):
-    date: str
-    name: str
-    chat_message: str
-
-
-def create_data_point_from_chat(chat: str, regex) -> Datapoint:
-    """
-    Construct data point from chat messages
-    """
-    result = re.match(regex, chat)
-    if result:
-        result = result.groupdict()
-    else:
-        return Datapoint(date="", name="", chat_message="")
-
-    # Construct date
-    date = convert_to_iso8601(
-        f"{result.get('year', '')}-{result.get('month', '')}-{result.get('day', '')} {result.get('hour', '')}:{result.get('minutes', '')}"
-    )
-    name = result.get("name", "")
-    chat_message = result.get("chat_message", "")
-
-    return Datapoint(date=date, name=name, chat_message=chat_message)
-
-
 def remove_empty_chats(df: pd.DataFrame) -> pd.DataFrame:
     """
     Removes all rows from the chat dataframe where no regex matched
@@ -195,101 +175,124 @@ def keep_users(df: pd.DataFrame, usernames: [str]) -> pd.DataFrame: # pyright: i
     return df
 
 
-def determine_regex_from_chat(lines: list[str]) -> str:
+def determine_regex_from_chat(lines: Iterator[str]) -> Tuple[re.Pattern, list[str]]:
     """
-    Read lines of chat return the first regex that matches
-    That regex is used to process the chatfile
+    Read lines of chat until one matches a known format
+    Returns the first regex that matches that line, used to process the chatfile,
+    and the lines read so far
     """
-
-    length_lines = len(lines)
-    for index, line in enumerate(lines):
-        for regex in REGEXES:
-            if re.match(regex, line):
-                logger.info(f"Matched regex: {regex}")
-                return regex
-
-        if index > length_lines:
-            break
+    head = []
+    for line in lines:
+        head.append(line)
+        for regex in COMPILED_REGEXES:
+            if regex.match(line):
+                logger.info(f"Matched regex: {regex.pattern}")
+                return regex, head
 
     logger.error(f"No matching regex found:")
     raise Exception(f"No matching regex found")
 
 
-def construct_message(current_line: str, next_line: str, regex: str) -> Tuple[bool, str]:
+def iter_chat_lines(path_to_chat_file) -> Iterator[str]:
     """
-    Helper function: determines whether the next line in the chat matches the regex
-    in case of no match it means that the line belongs to the message on the current line
+    Yield the cleaned lines of a chat file, or of the first file in a zip, one at a time
     """
-
-    match_next_line = re.match(regex, next_line)
-    if match_next_line:
-        return True, current_line
+    if zipfile.is_zipfile(path_to_chat_file):
+        with zipfile.ZipFile(path_to_chat_file) as z:
+            with z.open(z.namelist()[0]) as f:
+                for line in f:
+                    yield remove_unwanted_characters(line.decode("utf-8"))
     else:
-        current_line = current_line + " " + next_line
-        current_line = current_line.replace("\n", " ")
-        return False, current_line
+        with open(path_to_chat_file, encoding="utf-8") as f:
+            for line in f:
+                yield remove_unwanted_characters(line)
 
 
 def read_chat_file(path_to_chat_file: str) -> list[str]:
+    return list(iter_chat_lines(path_to_chat_file))
 
-    out = []
-    if zipfile.is_zipfile(path_to_chat_file):
-      with zipfile.ZipFile(path_to_chat_file) as z:
-        file_list = z.namelist()
-        print(f"{file_list}")
-        with z.open(file_list[0]) as f:
-            lines = f.readlines()
-            lines = [line.decode("utf-8") for line in lines]
-
-    else:
-        with open(path_to_chat_file, encoding="utf-8") as f:
-            lines = f.readlines()
-
-    out = [remove_unwanted_characters(line) for line in lines]
 
-    return out
+def _chat_message(start: str, match: re.Match | None, continuation: list[str], regex: re.Pattern) -> Tuple[dict, str]:
+    """
+    Return the regex groups and text of a message starting with line start
+    """
+    if match is not None:
+        # Continuation lines only extend the message; the other groups stay the same
+        return match.groupdict(), " ".join([match["chat_message"], *continuation])
+    if continuation:
+        match = regex.match(" ".join([start, *continuation]))
+        if match is not None:
+            return match.groupdict(), match["chat_message"]
+    return {}, ""
 
 
-def parse_chat(path_to_chat: str) -> pd.DataFrame:
+def iter_chat_messages(lines: Iterable[str], regex: re.Pattern) -> Iterator[Tuple[dict, str]]:
     """
-    Read chat from file, parse, return df
+    Group chat lines into messages and yield the regex groups and text of each
 
-    In case of error returns empty df
+    A message starts at the first line and at every line that matches the regex;
+    other lines continue the message before them and are joined with spaces.
+    The last message only keeps its first line. Messages whose text
+    does not match the regex yield empty groups.
     """
-    out = []
+    lines = iter(lines)
+    start = next(lines, None)
+    if start is None:
+        return
+    match = regex.match(start)
+    continuation: list[str] = []
+    line_count = 1
 
-    try:
-        lines = read_chat_file(path_to_chat)
-        regex = determine_regex_from_chat(lines)
+    for line in lines:
+        line_count += 1
+        next_match = regex.match(line)
+        if next_match is None:
+            continuation.append(line)
+            continue
 
-        current_line = lines.pop(0)
-        next_line = lines.pop(0)
+        yield _chat_message(start, match, continuation, regex)
 
-        while True:
-            try:
-                match_next_line, chat = construct_message(current_line, next_line, regex)
+        start, match, continuation = line, next_match, []
 
-                while not match_next_line:
-                    next_line = lines.pop(0)
-                    match_next_line, chat = construct_message(chat, next_line, regex)
+    # A chat of a single line has no messages
+    if line_count > 1:
+        yield _chat_message(start, match, [], regex)
 
-                data_point = create_data_point_from_chat(chat, regex)
-                out.append(data_point)
 
-                current_line = next_line
-                next_line = lines.pop(0)
+def parse_chat(path_to_chat: str) -> pd.DataFrame:
+    """
+    Read chat from file, parse, return df
 
-            # IndexError occurs when pop fails
-            # Meaning we processed all chat messages
-            except IndexError:
-                data_point = create_data_point_from_chat(current_line, regex)
-                out.append(data_point)
-                break
+    In case of error returns empty df
+    """
+    table = eh.TableBuilder(["date", "name", "chat_message"])
+    dates: dict[str, str] = {}
+
+    try:
+        lines = iter_chat_lines(path_to_chat)
+        regex, head = determine_regex_from_chat(lines)
+
+        for result, chat_message in iter_chat_messages(itertools.chain(head, lines), regex):
+            if not result:
+                table.append("", "", "")
+                continue
+
+            # Construct date; most messages share their minute with another one
+            timestamp = f"{result.get('year', '')}-{result.get('month', '')}-{result.get('day', '')} {result.get('hour', '')}:{result.get('minutes', '')}"
+            date = dates.get(timestamp)
+            if date is None:
+                date = dates[timestamp] = convert_to_iso8601(timestamp)
+            table.append(date, result.get("name", ""), chat_message)
+
+    except UnicodeDecodeError as e:
+        # Undecodable files yield nothing, however far in the error is
+        logger.error(e)
+        return pd.DataFrame()
 
     except Exception as e:
         logger.error(e)
 
-    return pd.DataFrame(out)
+    return table.frame() if len(table) else pd.DataFrame()
 
 
 def find_emojis(df):
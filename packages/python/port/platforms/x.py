@@ -9,10 +9,9 @@ It handles DDPs in the english language with filetype js.
 
 import logging
 from collections import Counter
+import contextlib
 import json
-import io
-import re
-from typing import Any
+from typing import IO, Any
 
 import pandas as pd
 
@@ -44,54 +43,44 @@ DDP_CATEGORIES = [
 ]
 
 
-def bytesio_to_listdict(bytes_to_read: io.BytesIO) -> list[dict[Any, Any]]:
+def bytesio_to_listdict(bytes_to_read: IO[bytes]) -> list[dict[Any, Any]]:
     """
-    Converts a io.BytesIO buffer containing a twitter.js file, to a list of dicts
+    Converts a binary stream containing a twitter.js file, to a list of dicts
 
-    A list of dicts is the current structure of twitter.js files
+    A list of dicts is the current structure of twitter.js files.
+    The extractors below stream members with reader.js_assignment() instead.
     """
 
     out = []
-    lines = []
 
     try:
-        with io.TextIOWrapper(bytes_to_read, encoding="utf8") as f:
-            lines = f.readlines()
-
-        # change first line so its a valid json
-        lines[0] = re.sub("^.*? = ", "", lines[0])
-
-        # convert to a list of dicts
-        out = json.loads("".join(lines))
+        out = list(eh.iter_js_assignment(bytes_to_read))
 
     except json.decoder.JSONDecodeError as e:
         logger.error("The input buffer did not contain a valid JSON: %s", e)
-    except IndexError as e:
-        logger.error("No lines were read, could be empty input buffer: %s", e)
     except Exception as e:
         logger.error("Exception was caught: %s", e)
 
     return out
 
 
+AD_ENGAGEMENT_COLUMNS = eh.PathExtractor({
+    "Text": "**.tweetText",
+    "Impression time": "**.impressionTime",
+})
+
+
 def ad_engagement_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
-    result = reader.raw("ad-engagements.js")
+    result = reader.js_assignment("ad-engagements.js")
     if not result.found:
         return pd.DataFrame()
-    items = bytesio_to_listdict(result.data)
+    items = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
-        for item in items:
-            d = eh.dict_denester(item)
-            datapoints.append((
-                eh.find_item(d, "tweetText"),
-                eh.find_item(d, "impressionTime"),
-            ))
-        out = pd.DataFrame(datapoints, columns=["Text", "Impression time"]) # pyright: ignore
+        out = AD_ENGAGEMENT_COLUMNS.frame(items)
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -100,25 +89,28 @@ def ad_engagement_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFra
     return out
 
 
+INTEREST_COLUMNS = eh.PathExtractor({
+    "Interest": "**.name",
+    "is disabled": "**.isDisabled",
+})
+
+
 def personalization_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
 
-    result = reader.raw("personalization.js")
+    result = reader.js_assignment("personalization.js")
     if not result.found:
         return pd.DataFrame()
-    items = bytesio_to_listdict(result.data)
+    items = result.data
 
     out = pd.DataFrame()
-    datapoints = []
 
     try:
-        l = items[0]["p13nData"]["interests"]["interests"]
-        for item in l:
-            d = eh.dict_denester(item)
-            datapoints.append((
-                eh.find_item(d, "name"),
-                eh.find_item(d, "isDisabled"),
-            ))
-        out = pd.DataFrame(datapoints, columns=["Interest", "is disabled"]) # pyright: ignore
+        # Only the first element is needed; closing the generator releases
+        # the member stream instead of leaving it suspended mid-read.
+        with contextlib.closing(items):
+            item = next(items, None)
+        if item is not None:
+            out = INTEREST_COLUMNS.frame(item["p13nData"]["interests"]["interests"])
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -132,20 +124,20 @@ def follower_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     following.js
     """
 
-    datapoints = []
+    table = eh.TableBuilder(["Link to user"])
     out = pd.DataFrame()
 
-    result = reader.raw("follower.js")
+    result = reader.js_assignment("follower.js")
     if not result.found:
         return pd.DataFrame()
-    ld = bytesio_to_listdict(result.data)
+    ld = result.data
 
     try:
         for item in ld:
-            datapoints.append((
+            table.append(
                 item.get("follower", {}).get("userLink", None)
-            ))
-        out = pd.DataFrame(datapoints, columns=["Link to user"]) # pyright: ignore
+            )
+        out = table.frame()
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -158,20 +150,20 @@ def following_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     following.js
     """
 
-    datapoints = []
+    table = eh.TableBuilder(["Link to user"])
     out = pd.DataFrame()
 
-    result = reader.raw("following.js")
+    result = reader.js_assignment("following.js")
     if not result.found:
         return pd.DataFrame()
-    ld = bytesio_to_listdict(result.data)
+    ld = result.data
 
     try:
         for item in ld:
-            datapoints.append((
+            table.append(
                 item.get("following", {}).get("userLink", None)
-            ))
-        out = pd.DataFrame(datapoints, columns=["Link to user"]) # pyright: ignore
+            )
+        out = table.frame()
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -185,21 +177,21 @@ def like_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     like.js
     """
 
-    datapoints = []
+    table = eh.TableBuilder(["Tweet Id", "Tweet"])
     out = pd.DataFrame()
 
-    result = reader.raw("like.js")
+    result = reader.js_assignment("like.js")
     if not result.found:
         return pd.DataFrame()
-    ld = bytesio_to_listdict(result.data)
+    ld = result.data
 
     try:
         for item in ld:
-            datapoints.append((
+            table.append(
                 item.get("like", {}).get("tweetId", None),
                 item.get("like", {}).get("fullText", None)
-            ))
-        out = pd.DataFrame(datapoints, columns=["Tweet Id", "Tweet"]) #pyright: ignore
+            )
+        out = table.frame()
         out["Tweet Id"] = "https://twitter.com/a/status/" + out["Tweet Id"]
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -213,22 +205,22 @@ def tweets_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     tweets.js
     """
 
-    datapoints = []
+    table = eh.TableBuilder(["Date", "Tweet", "Retweeted"])
     out = pd.DataFrame()
 
-    result = reader.raw("tweets.js")
+    result = reader.js_assignment("tweets.js")
     if not result.found:
         return pd.DataFrame()
-    ld = bytesio_to_listdict(result.data)
+    ld = result.data
 
     try:
         for item in ld:
-            datapoints.append((
+            table.append(
                 item.get("tweet", {}).get("created_at", None),
                 item.get("tweet", {}).get("full_text", None),
                 str(item.get("tweet", {}).get("retweeted", ""))
-            ))
-        out = pd.DataFrame(datapoints, columns=["Date", "Tweet", "Retweeted"]) #pyright: ignore
+            )
+        out = table.frame()
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -241,20 +233,20 @@ def block_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     block.js
     """
 
-    result = reader.raw("block.js")
+    result = reader.js_assignment("block.js")
     if not result.found:
         return pd.DataFrame()
-    ld = bytesio_to_listdict(result.data)
+    ld = result.data
 
-    datapoints = []
+    table = eh.TableBuilder(["Blocked users"])
     out = pd.DataFrame()
 
     try:
         for item in ld:
-            datapoints.append((
+            table.append(
                 item.get("blocking", {}).get("userLink", "")
-            ))
-        out = pd.DataFrame(datapoints, columns=["Blocked users"]) # pyright: ignore
+            )
+        out = table.frame()
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -268,20 +260,20 @@ def mute_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     mute.js
     """
 
-    datapoints = []
+    table = eh.TableBuilder(["Muted users"])
     out = pd.DataFrame()
 
-    result = reader.raw("mute.js")
+    result = reader.js_assignment("mute.js")
     if not result.found:
         return pd.DataFrame()
-    ld = bytesio_to_listdict(result.data)
+    ld = result.data
 
     try:
         for item in ld:
-            datapoints.append((
+            table.append(
                 item.get("muting", {}).get("userLink", "")
-            ))
-        out = pd.DataFrame(datapoints, columns=["Muted users"]) # pyright: ignore
+            )
+        out = table.frame()
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -289,25 +281,23 @@ def mute_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
     return out
 
 
+TWEET_HEADER_COLUMNS = eh.PathExtractor({
+    "Tweet id": "**.tweet_id",
+    "User id": "**.user_id",
+    "Created at": "**.created_at",
+})
+
+
 def tweet_headers_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
-    datapoints = []
     out = pd.DataFrame()
 
-    result = reader.raw("tweet-headers.js")
+    result = reader.js_assignment("tweet-headers.js")
     if not result.found:
         return pd.DataFrame()
-    ld = bytesio_to_listdict(result.data)
+    ld = result.data
 
     try:
-        for item in ld:
-            d = eh.dict_denester(item)
-            datapoints.append((
-                eh.find_item(d, "tweet_id"),
-                eh.find_item(d, "user_id"),
-                eh.find_item(d, "created_at"),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Tweet id", "User id", "Created at"]) # pyright: ignore
+        out = TWEET_HEADER_COLUMNS.frame(ld)
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -315,25 +305,23 @@ def tweet_headers_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFra
     return out
 
 
+USER_LINK_CLICK_COLUMNS = eh.PathExtractor({
+    "Tweet id": "**.tweetId",
+    "Link": "**.finalUrl",
+    "Datum en tijd": "**.timeStampOfInteraction",
+})
+
+
 def user_link_clicks_to_df(reader: ZipArchiveReader, errors: Counter) -> pd.DataFrame:
-    datapoints = []
     out = pd.DataFrame()
 
-    result = reader.raw("user-link-clicks.js")
+    result = reader.js_assignment("user-link-clicks.js")
     if not result.found:
         return pd.DataFrame()
-    ld = bytesio_to_listdict(result.data)
+    ld = result.data
 
     try:
-        for item in ld:
-            d = eh.dict_denester(item)
-            datapoints.append((
-                eh.find_item(d, "tweetId"),
-                eh.find_item(d, "finalUrl"),
-                eh.find_item(d, "timeStampOfInteraction"),
-            ))
-
-        out = pd.DataFrame(datapoints, columns=["Tweet id", "Link", "Datum en tijd"]) # pyright: ignore
+        out = USER_LINK_CLICK_COLUMNS.frame(ld)
     except Exception as e:
         logger.error("Exception caught: %s", e)
         errors[type(e).__name__] += 1
@@ -502,12 +490,12 @@ class XFlow(FlowBuilder):
         super().__init__(session_id, "X")
         
     def validate_file(self, file):
-        return validate.validate_zip(DDP_CATEGORIES, file)
+        return validate.validate_zip(DDP_CATEGORIES, file, keep_open=True)
         
     def extract_data(self, file_value, validation):
         errors = Counter()
-        reader = ZipArchiveReader(file_value, validation.archive_members, errors)
-        return extraction(reader)
+        with ZipArchiveReader(file_value, validation.archive_members, errors, zip_file=validation.zip_file) as reader:
+            return extraction(reader)
 
 
 def process(session_id):
@@ -58,28 +58,27 @@ DDP_CATEGORIES = [
 def watch_history_to_df(reader: ZipArchiveReader, validation, errors: Counter) -> pd.DataFrame:
 
     if validation.current_ddp_category.language == Language.NL:
-        result = reader.json("kijkgeschiedenis.json")
+        result = reader.iter_json("kijkgeschiedenis.json")
     elif validation.current_ddp_category.language == Language.EN:
-        result = reader.json("watch-history.json")
+        result = reader.iter_json("watch-history.json")
     else:
         return pd.DataFrame()
 
     if not result.found:
         return pd.DataFrame()
-    d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder(["Title", "URL", "Timestamp"])
 
     try:
-        for item in d:
-            datapoints.append((
+        for item in result.data:
+            table.append(
                 item.get("title", ""),
                 item.get("titleUrl", ""),
                 item.get("time", ""),
-            ))
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Title", "URL", "Timestamp"])  # pyright: ignore
+        out = table.frame()
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -102,18 +101,18 @@ def search_history_to_df(reader: ZipArchiveReader, validation, errors: Counter)
     d = result.data
 
     out = pd.DataFrame()
-    datapoints = []
+    table = eh.TableBuilder({"Title": str, "URL": str, "Timestamp": str, "Ad": bool})
 
     try:
         for item in d:
-            datapoints.append((
+            table.append(
                 item.get("title", ""),
                 item.get("titleUrl", ""),
                 item.get("time", ""),
                 bool(item.get("details") or []),
-            ))
+            )
 
-        out = pd.DataFrame(datapoints, columns=["Title", "URL", "Timestamp", "Ad"])  # pyright: ignore
+        out = table.frame()
 
     except Exception as e:
         logger.error("Exception caught: %s", e)
@@ -141,7 +140,8 @@ def subscriptions_to_df(reader: ZipArchiveReader, validation, errors: Counter) -
     df = result.data
 
     if not df.empty:
-        df.columns = ["Channel Id", "Channel URL", "Channel Name"]  # pyright: ignore
+        # set_axis returns a new frame; the parsed result is shared by the reader's cache
+        df = df.set_axis(["Channel Id", "Channel URL", "Channel Name"], axis=1)  # pyright: ignore
 
     return df
 
@@ -186,144 +186,144 @@ def comments_to_df(reader: ZipArchiveReader, validation, errors: Counter) -> pd.
 
 def extraction(zip: str, validation: ValidateInput) -> ExtractionResult:
     errors = Counter()
-    reader = ZipArchiveReader(zip, validation.archive_members, errors)
-    tables = [
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="youtube_watch_history",
-            data_frame=watch_history_to_df(reader, validation, errors),
-            title=props.Translatable({
-                "en": "Your watch history",
-                "nl": "Je kijkgeschiedenis",
-            }),
-            description=props.Translatable({
-                "en": "Videos you have watched on YouTube, including timestamps.",
-                "nl": "Video's die je op YouTube hebt bekeken, inclusief tijdstippen.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "Videos watched over time",
-                        "nl": "Bekeken video's in de loop van de tijd",
-                    },
-                    "type": "area",
-                    "group": {
-                        "column": "Timestamp",
-                        "dateFormat": "auto",
-                    },
-                    "values": [{
-                        "aggregate": "count",
-                        "label": "Count",
-                    }],
+    with ZipArchiveReader(zip, validation.archive_members, errors, zip_file=validation.zip_file) as reader:
+        tables = [
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="youtube_watch_history",
+                data_frame=watch_history_to_df(reader, validation, errors),
+                title=props.Translatable({
+                    "en": "Your watch history",
+                    "nl": "Je kijkgeschiedenis",
+                }),
+                description=props.Translatable({
+                    "en": "Videos you have watched on YouTube, including timestamps.",
+                    "nl": "Video's die je op YouTube hebt bekeken, inclusief tijdstippen.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
                 },
-                {
-                    "title": {
-                        "en": "Videos watched by hour of the day",
-                        "nl": "Bekeken video's per uur van de dag",
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "Videos watched over time",
+                            "nl": "Bekeken video's in de loop van de tijd",
+                        },
+                        "type": "area",
+                        "group": {
+                            "column": "Timestamp",
+                            "dateFormat": "auto",
+                        },
+                        "values": [{
+                            "aggregate": "count",
+                            "label": "Count",
+                        }],
                     },
-                    "type": "bar",
-                    "group": {
-                        "column": "Timestamp",
-                        "dateFormat": "hour_cycle",
-                        "label": "Hour of the day",
+                    {
+                        "title": {
+                            "en": "Videos watched by hour of the day",
+                            "nl": "Bekeken video's per uur van de dag",
+                        },
+                        "type": "bar",
+                        "group": {
+                            "column": "Timestamp",
+                            "dateFormat": "hour_cycle",
+                            "label": "Hour of the day",
+                        },
+                        "values": [{
+                            "label": "Count",
+                        }],
                     },
-                    "values": [{
-                        "label": "Count",
-                    }],
-                },
-                {
-                    "title": {
-                        "en": "Words in video titles you watched",
-                        "nl": "Woorden in titels van bekeken video's",
+                    {
+                        "title": {
+                            "en": "Words in video titles you watched",
+                            "nl": "Woorden in titels van bekeken video's",
+                        },
+                        "type": "wordcloud",
+                        "textColumn": "Title",
+                        "tokenize": True,
                     },
-                    "type": "wordcloud",
-                    "textColumn": "Title",
-                    "tokenize": True,
+                ]
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="youtube_search_history",
+                data_frame=search_history_to_df(reader, validation, errors),
+                title=props.Translatable({
+                    "en": "Your search and watch history",
+                    "nl": "Je zoek- en kijkgeschiedenis",
+                }),
+                description=props.Translatable({
+                    "en": "Your search queries, videos watched, and ads seen on YouTube, with timestamps.",
+                    "nl": "Je zoekopdrachten, bekeken video's en geziene advertenties op YouTube, met tijdstippen.",
+                }),
+                headers={
+                    "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
+                    "URL": props.Translatable({"en": "URL", "nl": "URL"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                    "Ad": props.Translatable({"en": "Ad", "nl": "Advertentie"}),
                 },
-            ]
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="youtube_search_history",
-            data_frame=search_history_to_df(reader, validation, errors),
-            title=props.Translatable({
-                "en": "Your search and watch history",
-                "nl": "Je zoek- en kijkgeschiedenis",
-            }),
-            description=props.Translatable({
-                "en": "Your search queries, videos watched, and ads seen on YouTube, with timestamps.",
-                "nl": "Je zoekopdrachten, bekeken video's en geziene advertenties op YouTube, met tijdstippen.",
-            }),
-            headers={
-                "Title": props.Translatable({"en": "Title", "nl": "Titel"}),
-                "URL": props.Translatable({"en": "URL", "nl": "URL"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-                "Ad": props.Translatable({"en": "Ad", "nl": "Advertentie"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "Words in your search and watch history",
-                        "nl": "Woorden in je zoek- en kijkgeschiedenis",
-                    },
-                    "type": "wordcloud",
-                    "textColumn": "Title",
-                    "tokenize": True,
-                }
-            ]
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="youtube_subscriptions",
-            data_frame=subscriptions_to_df(reader, validation, errors),
-            title=props.Translatable({
-                "en": "Your subscriptions",
-                "nl": "Je abonnementen",
-            }),
-            description=props.Translatable({
-                "en": "YouTube channels you are subscribed to.",
-                "nl": "YouTube-kanalen waarop je bent geabonneerd.",
-            }),
-            headers={
-                "Channel Id": props.Translatable({"en": "Channel Id", "nl": "Kanaal-id"}),
-                "Channel URL": props.Translatable({"en": "Channel URL", "nl": "Kanaal-URL"}),
-                "Channel Name": props.Translatable({"en": "Channel Name", "nl": "Kanaalnaam"}),
-            },
-        ),
-        d3i_props.PropsUIPromptConsentFormTableViz(
-            id="youtube_comments",
-            data_frame=comments_to_df(reader, validation, errors),
-            title=props.Translatable({
-                "en": "Your comments",
-                "nl": "Je reacties",
-            }),
-            description=props.Translatable({
-                "en": "Comments you posted on YouTube videos and posts.",
-                "nl": "Reacties die je op YouTube-video's en -posts hebt geplaatst.",
-            }),
-            headers={
-                "Comment ID": props.Translatable({"en": "Comment ID", "nl": "Reactie-ID"}),
-                "Channel ID": props.Translatable({"en": "Channel ID", "nl": "Kanaal-ID"}),
-                "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
-                "Price": props.Translatable({"en": "Price", "nl": "Prijs"}),
-                "Video ID": props.Translatable({"en": "Video ID", "nl": "Video-ID"}),
-                "Comment text": props.Translatable({"en": "Comment text", "nl": "Reactietekst"}),
-            },
-            visualizations=[
-                {
-                    "title": {
-                        "en": "Most common words in your comments",
-                        "nl": "Meest voorkomende woorden in je reacties",
-                    },
-                    "type": "wordcloud",
-                    "textColumn": "Comment text",
-                    "tokenize": True,
-                }
-            ],
-        ),
-    ]
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "Words in your search and watch history",
+                            "nl": "Woorden in je zoek- en kijkgeschiedenis",
+                        },
+                        "type": "wordcloud",
+                        "textColumn": "Title",
+                        "tokenize": True,
+                    }
+                ]
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="youtube_subscriptions",
+                data_frame=subscriptions_to_df(reader, validation, errors),
+                title=props.Translatable({
+                    "en": "Your subscriptions",
+                    "nl": "Je abonnementen",
+                }),
+                description=props.Translatable({
+                    "en": "YouTube channels you are subscribed to.",
+                    "nl": "YouTube-kanalen waarop je bent geabonneerd.",
+                }),
+                headers={
+                    "Channel Id": props.Translatable({"en": "Channel Id", "nl": "Kanaal-id"}),
+                    "Channel URL": props.Translatable({"en": "Channel URL", "nl": "Kanaal-URL"}),
+                    "Channel Name": props.Translatable({"en": "Channel Name", "nl": "Kanaalnaam"}),
+                },
+            ),
+            d3i_props.PropsUIPromptConsentFormTableViz(
+                id="youtube_comments",
+                data_frame=comments_to_df(reader, validation, errors),
+                title=props.Translatable({
+                    "en": "Your comments",
+                    "nl": "Je reacties",
+                }),
+                description=props.Translatable({
+                    "en": "Comments you posted on YouTube videos and posts.",
+                    "nl": "Reacties die je op YouTube-video's en -posts hebt geplaatst.",
+                }),
+                headers={
+                    "Comment ID": props.Translatable({"en": "Comment ID", "nl": "Reactie-ID"}),
+                    "Channel ID": props.Translatable({"en": "Channel ID", "nl": "Kanaal-ID"}),
+                    "Timestamp": props.Translatable({"en": "Timestamp", "nl": "Datum en tijd"}),
+                    "Price": props.Translatable({"en": "Price", "nl": "Prijs"}),
+                    "Video ID": props.Translatable({"en": "Video ID", "nl": "Video-ID"}),
+                    "Comment text": props.Translatable({"en": "Comment text", "nl": "Reactietekst"}),
+                },
+                visualizations=[
+                    {
+                        "title": {
+                            "en": "Most common words in your comments",
+                            "nl": "Meest voorkomende woorden in je reacties",
+                        },
+                        "type": "wordcloud",
+                        "textColumn": "Comment text",
+                        "tokenize": True,
+                    }
+                ],
+            ),
+        ]
 
     return ExtractionResult(
         tables=[table for table in tables if not table.data_frame.empty],
@@ -336,7 +336,7 @@ class YouTubeFlow(FlowBuilder):
         super().__init__(session_id, "YouTube")
 
     def validate_file(self, file):
-        return validate.validate_zip(DDP_CATEGORIES, file)
+        return validate.validate_zip(DDP_CATEGORIES, file, keep_open=True)
 
     def extract_data(self, file, validation):
         return extraction(file, validation)
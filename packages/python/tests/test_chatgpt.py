@@ -0,0 +1,37 @@
+"""Tests for the ChatGPT extractor."""
+import json
+import sys
+import zipfile
+from collections import Counter
+from unittest.mock import MagicMock
+
+sys.modules["js"] = MagicMock()
+
+import port.platforms.chatgpt as chatgpt
+from port.helpers.extraction_helpers import ZipArchiveReader
+
+CONVERSATIONS = [{
+    "title": "Trip",
+    "mapping": {
+        "root": {"message": None},
+        "a": {"message": {"author": {"role": "user"}, "create_time": 1700000000.5, "content": {"parts": ["hi"]}}},
+        "b": {"message": {
+            "author": {"role": "assistant"}, "create_time": None,
+            "content": {"parts": ["hello"]}, "metadata": {"model_slug": "m"},
+        }},
+    },
+}]
+
+
+def test_conversation_times_are_utc_datetimes(tmp_path):
+    path = tmp_path / "chatgpt.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("conversations.json", json.dumps(CONVERSATIONS))
+    errors = Counter()
+    with ZipArchiveReader(str(path), ["conversations.json"], errors) as reader:
+        df = chatgpt.conversations_to_df(reader, errors)
+    assert str(df["time"].dtype) == "datetime64[ns, UTC]"
+    assert df["time"].iloc[0].isoformat() == "2023-11-14T22:13:20+00:00"
+    assert df["time"].isna().tolist() == [False, True]
+    assert df[["role", "message", "model"]].values.tolist() == [["user", "hi", ""], ["assistant", "hello", "m"]]
+    assert not errors
@@ -0,0 +1,70 @@
+"""Tests for PropsUIPromptConsentFormTableViz serialization."""
+import json
+import sys
+from unittest.mock import MagicMock
+
+sys.modules["js"] = MagicMock()
+
+import pandas as pd
+import port.api.props as props
+from port.api.d3i_props import PropsUIPromptConsentFormTableViz
+
+
+def serialize(df: pd.DataFrame) -> dict:
+    table = PropsUIPromptConsentFormTableViz(
+        id="test", title=props.Translatable({"en": "Test", "nl": "Test"}), data_frame=df
+    )
+    return json.loads(table.translate_data_frame())
+
+
+class TestTranslateDataFrame:
+    def test_utc_timestamps_as_iso_strings(self):
+        df = pd.DataFrame({
+            "Title": ["a", "b"],
+            "Date": pd.to_datetime([1632139200, None], unit="s", utc=True),
+        })
+        assert serialize(df) == {
+            "Title": {"0": "a", "1": "b"},
+            "Date": {"0": "2021-09-20T12:00:00+00:00", "1": ""},
+        }
+
+    def test_matches_isoformat(self):
+        dates = pd.Series(pd.to_datetime(["2021-09-20 12:00:00.250", "1970-01-01 00:00:00.000"]))
+        for column in (dates, dates.dt.tz_localize("UTC"), dates.dt.tz_localize("Europe/Amsterdam")):
+            out = serialize(pd.DataFrame({"Date": column}))
+            assert list(out["Date"].values()) == [t.isoformat() for t in column]
+
+    def test_data_frame_left_unchanged(self):
+        df = pd.DataFrame({"Date": pd.to_datetime([0], unit="s", utc=True)})
+        serialize(df)
+        assert pd.api.types.is_datetime64_any_dtype(df["Date"])
+
+    def test_unconvertible_epochs_serialized_as_before(self):
+        import port.helpers.extraction_helpers as eh
+
+        values = [1632139200, "", "abc"]
+        df = pd.DataFrame({"Date": eh.epoch_to_datetime_column(values)})
+        assert serialize(df)["Date"] == {"0": "2021-09-20T12:00:00+00:00", "1": "", "2": "abc"}
+        assert serialize(df)["Date"] == {str(i): eh.epoch_to_iso(v) for i, v in enumerate(values)}
+
+
+class TestTruncatedTable:
+    def test_timestamps_formatted_for_kept_rows(self, monkeypatch):
+        formatted = []
+        iso_timestamps = props._iso_timestamps
+
+        def recording(column):
+            formatted.append(len(column))
+            return iso_timestamps(column)
+
+        monkeypatch.setattr(props, "_iso_timestamps", recording)
+        table = props.PropsUIPromptConsentFormTable(
+            id="test", number=1,
+            title=props.Translatable({"en": "Test", "nl": "Test"}),
+            description=props.Translatable({"en": "Test", "nl": "Test"}),
+            data_frame=pd.DataFrame({"Date": pd.to_datetime(range(5), unit="s", utc=True)}),
+            data_frame_max_size=2,
+        )
+        out = json.loads(table.toDict()["data_frame"])
+        assert out == {"Date": {"0": "1970-01-01T00:00:00+00:00", "1": "1970-01-01T00:00:01+00:00"}}
+        assert formatted == [2]
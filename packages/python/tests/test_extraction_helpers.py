@@ -0,0 +1,296 @@
+"""Tests for the record and value helpers in extraction_helpers."""
+import json
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+sys.modules["js"] = MagicMock()
+
+import pandas as pd
+import pytest
+from port.api import props
+from port.helpers import extraction_helpers as eh
+from port.helpers.extraction_helpers import DenestedRecord, PathExtractor, TableBuilder
+
+
+def _random_record(rng: random.Random, depth: int = 0):
+    keys = ["title", "value", "timestamp", "href", "name", "label-x", "a\nb", "text", "data"]
+    if depth > 3 or rng.random() < 0.3:
+        return rng.choice([1, 2.5, None, True, "x", "é"])
+    if rng.random() < 0.3:
+        return [_random_record(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return {rng.choice(keys) + rng.choice(["", "_1", "-2"]): _random_record(rng, depth + 1) for _ in range(rng.randint(0, 4))}
+
+
+class TestDenestedRecord:
+    NEEDLES = ["title", "value", "-value", "timestamp", "a", "b", "label-x", "x", "0", "missing", "t.t", "ti(t)?le", ""]
+
+    def test_matches_find_item_and_find_items(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            inp = _random_record(rng)
+            if not isinstance(inp, (dict, list)):
+                continue
+            flat = eh.dict_denester(inp)
+            record = DenestedRecord(inp)
+            assert dict(record) == flat
+            for needle in self.NEEDLES:
+                assert record.find(needle) == eh.find_item(flat, needle), (inp, needle)
+                assert eh.find_item(record, needle) == eh.find_item(flat, needle)
+                assert eh.find_items(record, needle) == eh.find_items(flat, needle)
+
+    def test_least_nested_first_inserted_wins(self):
+        record = DenestedRecord({"a": {"title": "deep"}, "title": "top", "title_2": "also top"})
+        assert record.find("title") == "top"
+
+    def test_lookups_cached_per_record(self, monkeypatch):
+        record = DenestedRecord({"x": {"timestamp": 1}, "timestamp": 2})
+        assert record.find("timestamp") == "2"
+        monkeypatch.setattr(eh, "_key_matcher", None)
+        assert record.find("timestamp") == "2"
+
+    def test_invalid_pattern_logged_not_raised(self):
+        assert DenestedRecord({"a(": 1}).find("a(") == ""
+
+
+class TestPathExtractor:
+    RECORD = {
+        "title": "",
+        "timestamp": 1612345678,
+        "string_map_data": [{"href": "https://a"}, {"value": "abc", "n": None}],
+        "data": [{"comment": {"comment": "deep", "timestamp": 1}}],
+        "nested": {"empty": {}, "list": [10, 20]},
+    }
+
+    def test_steps(self):
+        extractor = PathExtractor({
+            "key": "timestamp",
+            "star": "string_map_data.*.value",
+            "index": "nested.list.1",
+            "deep": "**.comment.comment",
+            "least_nested": "**.timestamp",
+            "none": "string_map_data.*.n",
+            "container": "nested.empty",
+            "missing": "nope.*.x",
+        })
+        assert extractor.row(self.RECORD) == (
+            "1612345678", "abc", "20", "deep", "1612345678", "None", "", "",
+        )
+
+    def test_fallbacks_skip_empty(self):
+        extractor = PathExtractor({"Account": ["title", "string_map_data.*.value"]}, default="?")
+        assert extractor.row(self.RECORD) == ("abc",)
+        assert extractor.row({"title": ""}) == ("?",)
+        assert extractor.row("not a record") == ("?",)
+
+    def test_least_nested_like_find_item(self):
+        record = {"a": [{"b": {"timestamp": 3}}, {"timestamp": 2}], "c": {"timestamp": 1}}
+        flat = eh.dict_denester(record)
+        assert PathExtractor({"t": "**.timestamp"}).row(record) == (eh.find_item(flat, "timestamp"),)
+
+    def test_key_glob_matches_key_names_like_find_item(self):
+        records = [
+            {"data": [{"group_name": "g"}], "attachments": [{"creation_timestamp": 2}]},
+            {"attachments": [{"creation_timestamp": 2}], "data": {"timestamp": 1, "name": "n"}},
+        ]
+        extractor = PathExtractor({"name": "**.*name*", "timestamp": "**.*timestamp*"})
+        for record in records:
+            flat = eh.dict_denester(record)
+            assert extractor.row(record) == (eh.find_item(flat, "name"), eh.find_item(flat, "timestamp"))
+        assert PathExtractor({"exact": "**.name"}).row(records[0]) == ("",)
+        # find_item also matched enclosing key names: "value" found "label_values-0-label"
+        record = {"label_values": [{"label": "Time", "timestamp_value": 5}]}
+        assert PathExtractor({"value": "**.*value*"}).row(record) == ("5",)
+
+    def test_frame(self):
+        extractor = PathExtractor({"Title": "title", "Reaction": "data.*.reaction.reaction"})
+        records = ({"title": f"t{i}", "data": [{"reaction": {"reaction": "LIKE"}}]} for i in range(3))
+        df = extractor.frame(records)
+        assert list(df.columns) == ["Title", "Reaction"]
+        assert df.values.tolist() == [["t0", "LIKE"], ["t1", "LIKE"], ["t2", "LIKE"]]
+        assert list(extractor.frame([]).columns) == ["Title", "Reaction"]
+
+
+class TestTableBuilder:
+    def test_column_dtypes(self):
+        table = TableBuilder({"Title": str, "Visits": int, "Ad": bool})
+        table.append("a", 3, False)
+        table.append("b", 4, "yes")
+        df = table.frame()
+        assert list(df.columns) == ["Title", "Visits", "Ad"]
+        assert [str(t) for t in df.dtypes] == ["object", "int64", "bool"]
+        assert df.values.tolist() == [["a", 3, False], ["b", 4, True]]
+
+    def test_missing_int_is_nullable(self):
+        table = TableBuilder({"Visits": int})
+        table.append(1)
+        table.append(None)
+        column = table.frame()["Visits"]
+        assert str(column.dtype) == "Int64"
+        assert column.isna().tolist() == [False, True]
+
+    def test_list_of_names_is_all_str(self):
+        table = TableBuilder(["a", "b"])
+        table.append("x", 1)
+        assert table.frame().values.tolist() == [["x", 1]]
+
+    def test_max_rows_counts_dropped(self):
+        table = TableBuilder(["a"], max_rows=2)
+        for i in range(5):
+            table.append(i)
+        assert len(table) == 2
+        assert table.dropped == 3
+        assert table.frame()["a"].tolist() == [0, 1]
+
+    def test_wrong_value_count(self):
+        with pytest.raises(ValueError):
+            TableBuilder(["a", "b"]).append("x")
+
+    def test_empty_frame_keeps_columns(self):
+        df = TableBuilder({"a": str, "n": int}).frame()
+        assert df.empty
+        assert list(df.columns) == ["a", "n"]
+
+
+def serialized(column: pd.Series) -> list:
+    """A converted column as the consent form shows it."""
+    values = json.loads(props.data_frame_to_json(pd.DataFrame({"c": column})))["c"]
+    return [values[str(i)] for i in column.index]
+
+
+class TestEpochColumnSerialization:
+    VALUES = [1612345678, "1612345678.9", "", None, {}, 0, -5, "abc", 2**70, 253402300799, float("nan"), True]
+
+    def test_matches_epoch_to_iso(self):
+        expected_errors, errors = Counter(), Counter()
+        expected = [eh.epoch_to_iso(v, errors=expected_errors) for v in self.VALUES]
+        assert serialized(eh.epoch_to_datetime_column(self.VALUES, errors=errors)) == expected
+        assert errors == expected_errors
+        assert errors["TimestampParseError"] == 3
+
+    def test_random_values_match(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            values = [
+                rng.choice([rng.randint(-2**40, 2**40), str(rng.randint(0, 2**34)), rng.uniform(-1e10, 1e10), "", "x", 1e300])
+                for _ in range(rng.randint(0, 15))
+            ]
+            column = eh.epoch_to_datetime_column(values)
+            assert serialized(column) == [eh.epoch_to_iso(v) for v in values]
+
+    def test_units(self):
+        usec = [1612345678123456, 0]
+        expected = [eh.epoch_to_iso(v / 1_000_000) for v in usec]
+        assert serialized(eh.epoch_to_datetime_column(usec, unit="us")) == expected
+        assert serialized(eh.epoch_to_datetime_column([1612345678123, ""], unit="ms")) == [expected[0], ""]
+        assert serialized(eh.epoch_to_datetime_column([1612345678123456, ""], unit=None)) == [expected[0], ""]
+        with pytest.raises(ValueError):
+            eh.epoch_to_datetime_column([1], unit="ns")
+
+    def test_keeps_series_index(self):
+        table = TableBuilder({"Date": int})
+        table.append(1612345678)
+        table.append(None)
+        column = table.frame()["Date"].iloc[::-1]
+        out = eh.epoch_to_datetime_column(column)
+        assert out.index.tolist() == [1, 0]
+        assert serialized(out) == ["", "2021-02-03T09:47:58+00:00"]
+
+
+class TestEpochToDatetimeColumn:
+    def test_converts(self):
+        errors = Counter()
+        out = eh.epoch_to_datetime_column([1612345678, "1612345678.9", "", None, pd.NA], errors=errors)
+        assert str(out.dtype) == "datetime64[ns, UTC]"
+        assert [t.isoformat() for t in out[:2]] == ["2021-02-03T09:47:58+00:00"] * 2
+        assert out[2:].isna().all()
+        assert not errors
+
+    def test_unconvertible_values_keep_epoch_to_iso_strings(self):
+        # Raw values the participant could see before must not turn into ""
+        values = [1612345678, "", None, {}, "abc", 2**70, 253402300799]
+        expected_errors, errors = Counter(), Counter()
+        expected = [eh.epoch_to_iso(v, errors=expected_errors) for v in values]
+        out = eh.epoch_to_datetime_column(values, errors=errors)
+        assert out.tolist() == expected
+        assert "abc" in expected and "9999-12-31T23:59:59+00:00" in expected
+        assert errors == expected_errors
+
+    def test_units_and_index(self):
+        column = pd.Series([1612345678123456, 0], index=[4, 2])
+        out = eh.epoch_to_datetime_column(column, unit="us")
+        assert out.index.tolist() == [4, 2]
+        assert out.tolist() == pd.to_datetime([1612345678, 0], unit="s", utc=True).tolist()
+
+
+class TestSortIsoTimestamp:
+    ODD = [
+        "", None, 5, float("nan"), "abc", "2021", "2021-W05-3", "2021-02-29", "2021-13-01T00:00:00Z",
+        "2021-02-03T24:00:00", "0001-01-01T00:00:00+00:00", "9999-12-31T23:59:59", "0000-01-01T00:00:00",
+        "2021-02-03T10:00:00.1234567", "2021-02-03T10:00:00+05:30:15", "2021-02-03T10:00:00+24:00",
+        "2021-02-03T10:00:00+0000", "2021-02-03T10:00:00+00:00 ", "１９７０-01-01T00:00:00",
+    ]
+
+    @pytest.fixture(autouse=True)
+    def utc(self, monkeypatch):
+        # Timestamps without an offset are local time for datetime.timestamp()
+        monkeypatch.setenv("TZ", "UTC")
+        time.tzset()
+        yield
+        monkeypatch.undo()
+        time.tzset()
+
+    @staticmethod
+    def _reference_key(series: pd.Series) -> pd.Series:
+        def convert_timestamp(timestamp):
+            try:
+                if isinstance(timestamp, str) and timestamp:
+                    return -datetime.fromisoformat(timestamp).timestamp()
+            except Exception:
+                pass
+            return float("inf")
+
+        return series.apply(convert_timestamp)
+
+    def _random_timestamp(self, rng: random.Random):
+        if rng.random() < 0.15:
+            return rng.choice(self.ODD)
+        seconds = rng.randint(-2**33, 2**33) if rng.random() < 0.2 else rng.randint(0, 2**31)
+        dt = datetime(1970, 1, 1) + timedelta(seconds=seconds, microseconds=rng.choice([0, 0, 0, rng.randint(0, 999999)]))
+        return rng.choice([
+            dt.isoformat(),
+            dt.isoformat() + "+00:00",
+            dt.isoformat() + "Z",
+            dt.isoformat() + rng.choice(["+05:30", "-11:00", "-00:30"]),
+            dt.isoformat(sep=" "),
+            dt.isoformat(timespec="minutes"),
+            dt.date().isoformat(),
+        ])
+
+    def test_matches_fromisoformat_ordering(self):
+        rng = random.Random(11)
+        for _ in range(300):
+            series = pd.Series([self._random_timestamp(rng) for _ in range(rng.randint(0, 40))], dtype=object)
+            expected = self._reference_key(series)
+            assert eh.sort_isotimestamp_empty_timestamp_last(series).tolist() == expected.tolist()
+            assert (
+                series.sort_values(key=eh.sort_isotimestamp_empty_timestamp_last).index.tolist()
+                == series.sort_values(key=self._reference_key).index.tolist()
+            )
+
+    def test_datetime_column_matches_iso_strings(self):
+        dates = eh.epoch_to_datetime_column([1612345678, "", 1512345678, 1712345678])
+        strings = pd.Series([t.isoformat() if pd.notna(t) else "" for t in dates], dtype=object)
+        assert (
+            eh.sort_isotimestamp_empty_timestamp_last(dates).tolist()
+            == eh.sort_isotimestamp_empty_timestamp_last(strings).tolist()
+        )
+
+    def test_empty_and_invalid_last(self):
+        df = pd.DataFrame({"Date": ["", "2021-02-03T09:47:58+00:00", None, "abc", "2022-02-03T09:47:58+00:00"]})
+        out = df.sort_values(by="Date", key=eh.sort_isotimestamp_empty_timestamp_last)
+        assert out["Date"].tolist()[:2] == ["2022-02-03T09:47:58+00:00", "2021-02-03T09:47:58+00:00"]
+        assert eh.sort_isotimestamp_empty_timestamp_last(pd.Series([], dtype=object)).empty
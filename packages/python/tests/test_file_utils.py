@@ -0,0 +1,562 @@
+"""Tests for AsyncFileAdapter — block cache, read-ahead, read correctness."""
+import io
+import json
+import random
+import sys
+import zipfile
+import zlib
+from unittest.mock import MagicMock
+
+sys.modules["js"] = MagicMock()
+
+import pytest
+
+from port.api.file_utils import AsyncFileAdapter
+
+
+class FakeJsArray:
+    """Stands in for the ArrayBuffer proxy returned by readSlice."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def to_py(self) -> bytes:
+        return self._data
+
+
+class CountingJsReader:
+    """Fake JS reader that records every readSlice call."""
+
+    def __init__(self, content: bytes, name: str = "fake.zip"):
+        self._content = content
+        self.size = len(content)
+        self.name = name
+        self.calls: list[tuple[int, int]] = []
+
+    def readSlice(self, start: int, end: int):
+        self.calls.append((start, end))
+        return FakeJsArray(self._content[start:end])
+
+
+def _content(n: int) -> bytes:
+    return random.Random(0).randbytes(n)
+
+
+class TestBlockCache:
+    def test_small_sequential_reads_coalesce(self):
+        """Many tiny forward reads cost far fewer readSlice calls than reads."""
+        content = _content(256 * 1024)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096, max_readahead=64 * 1024)
+
+        out = bytearray()
+        while chunk := adapter.read(30):
+            out += chunk
+
+        assert bytes(out) == content
+        n_reads = len(content) // 30 + 1
+        assert len(js_reader.calls) < n_reads // 50
+
+    def test_repeated_reads_served_from_cache(self):
+        content = _content(16 * 1024)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096)
+
+        for _ in range(10):
+            adapter.seek(100)
+            assert adapter.read(30) == content[100:130]
+        assert len(js_reader.calls) == 1
+
+    def test_fetches_are_block_aligned(self):
+        content = _content(64 * 1024)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096)
+
+        adapter.seek(5000)
+        adapter.read(10)
+        start, end = js_reader.calls[0]
+        assert start % 4096 == 0
+        assert end % 4096 == 0 or end == len(content)
+
+    def test_random_access_matches_content(self):
+        content = _content(200 * 1024)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096, cache_bytes=32 * 1024)
+        rng = random.Random(1)
+
+        for _ in range(500):
+            pos = rng.randrange(len(content))
+            n = rng.randrange(1, 10_000)
+            adapter.seek(pos)
+            assert adapter.read(n) == content[pos:pos + n]
+            assert adapter.tell() == min(pos + n, len(content))
+
+    def test_lru_eviction_respects_budget(self):
+        content = _content(256 * 1024)
+        adapter = AsyncFileAdapter(CountingJsReader(content), block_size=4096, cache_bytes=16 * 1024)
+
+        for pos in range(0, len(content), 4096):
+            adapter.seek(pos)
+            adapter.read(1)
+            assert adapter._cached_bytes <= 16 * 1024
+
+    def test_random_access_does_not_read_ahead(self):
+        content = _content(256 * 1024)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096)
+
+        adapter.seek(100_000)
+        adapter.read(10)
+        start, end = js_reader.calls[0]
+        assert end - start == 4096
+
+    def test_large_read_bypasses_cache(self):
+        content = _content(64 * 1024)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096, cache_bytes=16 * 1024)
+
+        assert adapter.read(20_000) == content[:20_000]
+        assert js_reader.calls == [(0, 20_000)]
+        assert adapter._cached_bytes == 0
+
+    def test_cache_disabled(self):
+        content = _content(8 * 1024)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, cache_bytes=0)
+
+        adapter.read(10)
+        adapter.read(10)
+        assert js_reader.calls == [(0, 10), (10, 20)]
+
+    def test_zipfile_roundtrip_uses_few_calls(self):
+        """Reading every member of a many-member zip stays cheap."""
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            for i in range(500):
+                zf.writestr(f"messages/inbox/thread_{i}/message_1.json", json.dumps({"i": i}))
+        js_reader = CountingJsReader(buf.getvalue())
+        adapter = AsyncFileAdapter(js_reader)
+
+        with zipfile.ZipFile(adapter) as zf:
+            for i, name in enumerate(zf.namelist()):
+                assert json.loads(zf.read(name)) == {"i": i}
+
+        assert len(js_reader.calls) < 20
+
+    def test_read_after_close_raises(self):
+        adapter = AsyncFileAdapter(CountingJsReader(b"abc"))
+        adapter.close()
+        with pytest.raises(ValueError):
+            adapter.read(1)
+
+
+class AssignableJsArray(FakeJsArray):
+    """ArrayBuffer proxy that also offers Pyodide's assign_to()/to_bytes()."""
+
+    def __init__(self, data: bytes, log: list[str]):
+        super().__init__(data)
+        self._log = log
+
+    def to_py(self):
+        self._log.append("to_py")
+        return self._data
+
+    def assign_to(self, dest):
+        self._log.append("assign_to")
+        assert len(dest) == len(self._data)
+        dest[:] = self._data
+
+    def to_bytes(self):
+        self._log.append("to_bytes")
+        return bytes(self._data)
+
+
+class AssignableJsReader(CountingJsReader):
+    def __init__(self, content: bytes):
+        super().__init__(content)
+        self.log: list[str] = []
+
+    def readSlice(self, start: int, end: int):
+        self.calls.append((start, end))
+        return AssignableJsArray(self._content[start:end], self.log)
+
+
+class TestRawIOBase:
+    def test_is_raw_io(self):
+        adapter = AsyncFileAdapter(CountingJsReader(b"abc"))
+        assert isinstance(adapter, io.RawIOBase)
+
+    def test_readinto_fills_caller_buffer(self):
+        content = _content(10_000)
+        adapter = AsyncFileAdapter(CountingJsReader(content), block_size=4096)
+        buf = bytearray(3000)
+        adapter.seek(1000)
+        assert adapter.readinto(buf) == 3000
+        assert bytes(buf) == content[1000:4000]
+        assert adapter.tell() == 4000
+
+    def test_readinto_memoryview_slice(self):
+        content = _content(100)
+        adapter = AsyncFileAdapter(CountingJsReader(content))
+        buf = bytearray(50)
+        assert adapter.readinto(memoryview(buf)[10:20]) == 10
+        assert bytes(buf[10:20]) == content[:10]
+
+    def test_readinto_at_eof_returns_zero(self):
+        adapter = AsyncFileAdapter(CountingJsReader(b"abc"))
+        adapter.seek(0, 2)
+        assert adapter.readinto(bytearray(4)) == 0
+
+    def test_readinto_bypass_uses_assign_to(self):
+        content = _content(64 * 1024)
+        js_reader = AssignableJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, cache_bytes=16 * 1024)
+        buf = bytearray(20_000)
+        assert adapter.readinto(buf) == 20_000
+        assert bytes(buf) == content[:20_000]
+        assert js_reader.log == ["assign_to"]
+
+    def test_cached_fetch_uses_assign_to(self):
+        js_reader = AssignableJsReader(_content(10_000))
+        adapter = AsyncFileAdapter(js_reader, block_size=4096)
+        adapter.read(10)
+        assert js_reader.log == ["assign_to"]
+
+    def test_buffered_reader_wraps_adapter(self):
+        content = _content(50_000)
+        adapter = AsyncFileAdapter(CountingJsReader(content), block_size=4096)
+        with io.BufferedReader(adapter, buffer_size=8192) as f:
+            f.seek(123)
+            assert f.read(10_000) == content[123:10_123]
+            assert f.read() == content[10_123:]
+
+    def test_context_manager_closes(self):
+        with AsyncFileAdapter(CountingJsReader(b"abc")) as adapter:
+            assert adapter.read(3) == b"abc"
+        assert adapter.closed
+        with pytest.raises(ValueError):
+            adapter.seek(0)
+
+
+class VectoredJsReader(CountingJsReader):
+    """Fake JS reader with readSlices(start0, end0, start1, end1, ...)."""
+
+    def __init__(self, content: bytes):
+        super().__init__(content)
+        self.vectored_calls: list[list[tuple[int, int]]] = []
+
+    def readSlices(self, *bounds):
+        spans = list(zip(bounds[::2], bounds[1::2]))
+        self.vectored_calls.append(spans)
+        return FakeJsArray(b"".join(self._content[s:e] for s, e in spans))
+
+
+class TestReadRanges:
+    def test_returns_each_range_in_order(self):
+        content = _content(100_000)
+        adapter = AsyncFileAdapter(VectoredJsReader(content), block_size=4096)
+        ranges = [(90_000, 30), (10, 5), (50_000, 4096), (99_990, 100)]
+        assert adapter.read_ranges(ranges) == [
+            content[90_000:90_030], content[10:15], content[50_000:54_096], content[99_990:],
+        ]
+
+    def test_single_vectored_call(self):
+        content = _content(100_000)
+        js_reader = VectoredJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096)
+        adapter.read_ranges([(off, 30) for off in range(0, 100_000, 10_000)])
+        assert len(js_reader.vectored_calls) == 1
+        assert js_reader.calls == []
+
+    def test_fallback_one_call_per_span(self):
+        content = _content(100_000)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096)
+        result = adapter.read_ranges([(0, 10), (50_000, 10)])
+        assert result == [content[:10], content[50_000:50_010]]
+        assert len(js_reader.calls) == 2
+
+    def test_ranges_warm_cache_and_keep_position(self):
+        content = _content(100_000)
+        js_reader = VectoredJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096)
+        adapter.seek(7)
+        adapter.read_ranges([(20_000, 30), (60_000, 30)])
+        assert adapter.tell() == 7
+
+        adapter.seek(60_000)
+        assert adapter.read(30) == content[60_000:60_030]
+        assert js_reader.calls == []
+
+    def test_cached_ranges_need_no_fetch(self):
+        content = _content(100_000)
+        js_reader = VectoredJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096)
+        adapter.read_ranges([(0, 10), (50_000, 10)])
+        adapter.read_ranges([(0, 10), (50_000, 10)])
+        assert len(js_reader.vectored_calls) == 1
+
+    def test_large_range_bypasses_cache(self):
+        content = _content(100_000)
+        js_reader = VectoredJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, block_size=4096, cache_bytes=16 * 1024)
+        result = adapter.read_ranges([(0, 10), (30_000, 40_000)])
+        assert result == [content[:10], content[30_000:70_000]]
+        assert js_reader.vectored_calls == [[(0, 4096), (30_000, 70_000)]]
+
+    def test_empty_and_out_of_range(self):
+        content = _content(1000)
+        adapter = AsyncFileAdapter(VectoredJsReader(content))
+        assert adapter.read_ranges([]) == []
+        assert adapter.read_ranges([(5000, 10), (10, 0)]) == [b"", b""]
+
+
+def _zip_bytes(n_members: int, payload: bytes = b"{}", force_zip64: bool = False) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i in range(n_members):
+            with zf.open(f"dir_{i}/member_{i}.json", "w", force_zip64=force_zip64) as f:
+                f.write(payload)
+    return buf.getvalue()
+
+
+class TestTailPrefetch:
+    def test_default_pins_nothing(self):
+        js_reader = CountingJsReader(_zip_bytes(3))
+        AsyncFileAdapter(js_reader)
+        assert js_reader.calls == []
+
+    def test_small_zip_pinned_in_one_slice(self):
+        content = _zip_bytes(10)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, tail_prefetch=64 * 1024)
+        assert js_reader.calls == [(0, len(content))]
+
+        for _ in range(3):
+            with zipfile.ZipFile(adapter) as zf:
+                assert len(zf.namelist()) == 10
+        assert len(js_reader.calls) == 1
+
+    def test_pin_extends_to_central_directory(self):
+        """A directory larger than the tail is pinned with one more slice."""
+        content = _zip_bytes(2000, payload=random.Random(2).randbytes(500))
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, tail_prefetch=4096)
+
+        assert len(js_reader.calls) == 2
+        with zipfile.ZipFile(adapter) as zf:
+            infos = zf.infolist()
+        assert len(infos) == 2000
+        assert len(js_reader.calls) == 2
+        cd_start = js_reader.calls[1][0]
+        assert cd_start > infos[-1].header_offset
+
+    def test_pin_respects_max_pinned(self):
+        content = _zip_bytes(2000)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, tail_prefetch=4096, max_pinned=8192)
+        assert len(js_reader.calls) == 1
+        assert adapter._pinned_start == len(content) - 4096
+
+    def test_zip64_directory_located(self, monkeypatch):
+        """ZIP64 end records between directory and EOCD are accounted for."""
+        from port.api.file_utils import _zip_directory_start
+
+        monkeypatch.setattr(zipfile, "ZIP_FILECOUNT_LIMIT", 1)
+        content = _zip_bytes(20)
+        assert b"PK\x06\x06" in content
+
+        with zipfile.ZipFile(io.BytesIO(content)) as zf:
+            last_member = max(i.header_offset for i in zf.infolist())
+        cd_start = _zip_directory_start(memoryview(content), 0)
+        assert content[cd_start:cd_start + 4] == b"PK\x01\x02"
+        assert cd_start > last_member
+
+    def test_non_zip_tail_is_pinned_without_extension(self):
+        content = _content(100_000)
+        js_reader = CountingJsReader(content)
+        adapter = AsyncFileAdapter(js_reader, tail_prefetch=4096)
+        assert js_reader.calls == [(100_000 - 4096, 100_000)]
+        adapter.seek(-100, 2)
+        assert adapter.read(100) == content[-100:]
+        assert len(js_reader.calls) == 1
+
+    def test_failed_prefetch_leaves_adapter_usable(self):
+        class FailingOnceReader(CountingJsReader):
+            failed = False
+
+            def readSlice(self, start, end):
+                if not self.failed:
+                    self.failed = True
+                    raise OSError("NotReadableError")
+                return super().readSlice(start, end)
+
+        content = _zip_bytes(3)
+        adapter = AsyncFileAdapter(FailingOnceReader(content), tail_prefetch=4096)
+        with zipfile.ZipFile(adapter) as zf:
+            assert len(zf.namelist()) == 3
+
+    def test_script_wrapper_pins_upload_tail(self):
+        """ScriptWrapper wraps uploads with the tail already pinned."""
+        from port.main import ScriptWrapper
+        from port.api.commands import CommandSystemLog
+
+        content = _zip_bytes(5)
+        js_reader = CountingJsReader(content)
+        received = []
+
+        class Payload:
+            __type__ = "PayloadFile"
+            value = js_reader
+
+        def upload_script():
+            payload = yield CommandSystemLog(level="info", message="upload")
+            received.append(payload.value)
+            yield CommandSystemLog(level="info", message="done")
+
+        wrapper = ScriptWrapper(upload_script())
+        wrapper.send(None)
+        wrapper.send(Payload())
+
+        assert isinstance(received[0], AsyncFileAdapter)
+        assert js_reader.calls == [(0, len(content))]
+
+
+class TestLocalFileReader:
+    @pytest.fixture
+    def local_zip(self, tmp_path):
+        path = tmp_path / "export.zip"
+        path.write_bytes(_zip_bytes(200, payload=random.Random(3).randbytes(300)))
+        return path
+
+    def test_reader_contract(self, tmp_path):
+        from port.api.file_utils import LocalFileReader
+
+        path = tmp_path / "blob.bin"
+        content = _content(10_000)
+        path.write_bytes(content)
+        with LocalFileReader(str(path)) as js_reader:
+            assert js_reader.size == 10_000
+            assert js_reader.name == "blob.bin"
+            assert bytes(js_reader.readSlice(10, 20).to_py()) == content[10:20]
+            assert js_reader.readSlices(0, 2, 100, 103).to_bytes() == content[:2] + content[100:103]
+            assert js_reader.calls == 2
+            assert js_reader.bytes_read == 15
+            assert js_reader.seeks == 3
+
+    def test_empty_file(self, tmp_path):
+        from port.api.file_utils import LocalFileReader
+
+        path = tmp_path / "empty.zip"
+        path.write_bytes(b"")
+        with LocalFileReader(str(path)) as js_reader:
+            adapter = AsyncFileAdapter(js_reader, tail_prefetch=4096)
+            assert adapter.read(10) == b""
+
+    def test_drives_adapter_through_zipfile(self, local_zip):
+        from port.api.file_utils import LocalFileReader
+
+        with LocalFileReader(str(local_zip)) as js_reader:
+            adapter = AsyncFileAdapter(js_reader, tail_prefetch=64 * 1024)
+            with zipfile.ZipFile(adapter) as zf:
+                names = zf.namelist()
+                for name in names:
+                    zf.read(name)
+            assert len(names) == 200
+            assert 0 < js_reader.calls < 50
+            assert js_reader.bytes_read >= local_zip.stat().st_size
+
+    def test_non_vectored_reader_falls_back(self, local_zip):
+        from port.api.file_utils import LocalFileReader
+
+        with LocalFileReader(str(local_zip), vectored=False) as js_reader:
+            assert not hasattr(js_reader, "readSlices")
+            adapter = AsyncFileAdapter(js_reader, block_size=4096)
+            assert len(adapter.read_ranges([(0, 10), (20_000, 10)])) == 2
+            assert js_reader.calls == 2
+
+    def test_simulated_latency(self, tmp_path, monkeypatch):
+        from port.api import file_utils
+
+        path = tmp_path / "blob.bin"
+        path.write_bytes(_content(1000))
+        slept = []
+        monkeypatch.setattr(file_utils.time, "sleep", slept.append)
+        with file_utils.LocalFileReader(str(path), latency=0.01, per_byte=1e-6) as js_reader:
+            js_reader.readSlice(0, 500)
+        assert slept == [pytest.approx(0.01 + 500e-6)]
+
+
+class TestIOStats:
+    def test_counts_calls_bytes_and_time(self):
+        content = _content(100_000)
+        adapter = AsyncFileAdapter(CountingJsReader(content), block_size=4096)
+        adapter.read(10)
+        adapter.seek(50_000)
+        adapter.read(10)
+        stats = adapter.io_stats
+        assert stats.calls == 2
+        assert stats.bytes_read == 2 * 4096
+        assert stats.bytes_reread == 0
+        assert stats.js_seconds >= 0
+
+    def test_counts_rereads_after_eviction(self):
+        content = _content(100_000)
+        adapter = AsyncFileAdapter(CountingJsReader(content), block_size=4096, cache_bytes=8192)
+        for pos in (0, 40_000, 80_000, 0):
+            adapter.seek(pos)
+            adapter.read(10)
+        assert adapter.io_stats.bytes_reread == 4096
+
+    def test_counts_backward_seeks(self):
+        adapter = AsyncFileAdapter(CountingJsReader(_content(1000)))
+        adapter.seek(500)
+        adapter.seek(100)
+        adapter.seek(-10, 1)
+        adapter.seek(900)
+        assert adapter.io_stats.backward_seeks == 2
+
+    def test_delta_and_summary(self):
+        from port.api.file_utils import IOStats
+
+        before = IOStats(calls=10, bytes_read=1_000_000, js_seconds=1.0)
+        after = IOStats(calls=30, bytes_read=4_000_000, bytes_reread=500_000, backward_seeks=7, js_seconds=3.5)
+        delta = after - before
+        assert delta == IOStats(calls=20, bytes_read=3_000_000, bytes_reread=500_000, backward_seeks=7, js_seconds=2.5)
+        assert delta.summary(1_000_000) == (
+            "20 calls, 3.0 MB read, 3.0x amplification, 0.5 MB re-read, 7 backward seeks, 2.5s in JS"
+        )
+
+
+class TestLocalRawInflater:
+    def test_inflates_incrementally_and_counts(self):
+        from port.api.file_utils import LocalRawInflater
+
+        payload = _content(200_000)
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        compressed = compressor.compress(payload) + compressor.flush()
+
+        inflater = LocalRawInflater()
+        out = b"".join(
+            inflater.push(compressed[i:i + 4096]).to_bytes()
+            for i in range(0, len(compressed), 4096)
+        )
+        out += inflater.finish().to_bytes()
+
+        assert out == payload
+        assert inflater.bytes_in == len(compressed)
+        assert inflater.bytes_out == len(payload)
+        assert inflater.calls == -(-len(compressed) // 4096) + 1
+
+
+class TestLocalJsonHost:
+    def test_parse_counts_and_converts(self):
+        from port.api.file_utils import LocalJsonHost
+
+        host = LocalJsonHost()
+        value = host.parse('{"a": [1, 2]}')
+        assert value.to_py() == {"a": [1, 2]}
+        assert host.calls == 1
+        assert host.chars_in == 13
+        with pytest.raises(ValueError):
+            host.parse("{")
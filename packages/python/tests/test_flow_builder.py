@@ -113,6 +113,51 @@ class TestHappyPath:
             advance_past_logs(gen, make_payload("PayloadVoid"))
 
 
+class TestValidationZipFileReleased:
+    """A ZipFile kept open by validation is closed once extraction ends."""
+
+    @pytest.fixture
+    def flow(self, tmp_path):
+        import zipfile
+        from port.helpers.validate import DDPCategory, DDPFiletype, Language, validate_zip
+
+        zip_path = tmp_path / "export.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("data.json", "{}")
+        categories = [DDPCategory(id="json_en", ddp_filetype=DDPFiletype.JSON, language=Language.EN, known_files=["data.json"])]
+
+        flow = StubFlow()
+        flow.validations = []
+
+        def validate_file(file):
+            validation = validate_zip(categories, str(zip_path), keep_open=True)
+            flow.validations.append(validation)
+            return validation
+
+        flow.validate_file = validate_file
+        return flow
+
+    def test_closed_when_no_reader_takes_it_over(self, flow):
+        gen = flow.start_flow()
+        start_and_skip_logs(gen)
+        assert isinstance(advance_past_logs(gen, make_payload_file()), CommandUIRender)
+        assert flow.validations[0].zip_file is None
+
+    def test_closed_when_extraction_fails(self, flow):
+        zip_files = []
+
+        def failing_extract(file, validation):
+            zip_files.append(validation.zip_file)
+            raise RuntimeError("extraction failed")
+
+        flow.extract_data = failing_extract
+        gen = flow.start_flow()
+        start_and_skip_logs(gen)
+        with pytest.raises(RuntimeError):
+            advance_past_logs(gen, make_payload_file())
+        assert zip_files[0].fp is None
+
+
 class TestRetryPath:
     """User uploads invalid file → retries → uploads valid file → succeeds."""
 
@@ -311,3 +356,53 @@ class TestUploadAdapterPassthrough:
         advance_past_logs(gen, make_payload("PayloadFile", value=adapter))
 
         assert observed == [adapter]
+
+
+class TestIOStatsMilestones:
+    """AsyncFileAdapter uploads report PII-free I/O counters after
+    validation and after extraction.
+    """
+
+    def _run_to_consent(self, flow, adapter):
+        messages = []
+        gen = flow.start_flow()
+        start_and_skip_logs(gen)
+        cmd = gen.send(make_payload("PayloadFile", value=adapter))
+        while isinstance(cmd, CommandSystemLog):
+            messages.append(cmd.message)
+            cmd = gen.send(make_payload("PayloadVoid"))
+        return messages
+
+    def test_adapter_upload_emits_io_summaries(self):
+        from port.api.file_utils import AsyncFileAdapter
+
+        class FakeJsReader:
+            size = 4096
+            name = "upload.zip"
+
+            def readSlice(self, start, end):
+                return MagicMock(to_py=lambda: bytes(end - start), spec=["to_py"])
+
+        class ReadingFlow(StubFlow):
+            def validate_file(self, file):
+                file.read(100)
+                return super().validate_file(file)
+
+            def extract_data(self, file, validation):
+                file.seek(0)
+                file.read(100)  # served from the block cache
+                return super().extract_data(file, validation)
+
+        messages = self._run_to_consent(ReadingFlow(), AsyncFileAdapter(FakeJsReader()))
+        io_messages = [m for m in messages if " IO after " in m]
+
+        assert io_messages[0].startswith("[TestPlatform] IO after validation: 1 calls, ")
+        assert io_messages[1].startswith("[TestPlatform] IO after extraction: 0 calls, ")
+        assert "amplification" in io_messages[0]
+        assert "upload.zip" not in " ".join(io_messages)
+
+    def test_non_adapter_upload_emits_nothing(self):
+        adapter = MagicMock()
+        adapter.size = 1024
+        messages = self._run_to_consent(StubFlow(), adapter)
+        assert not [m for m in messages if " IO after " in m]
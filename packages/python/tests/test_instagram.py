@@ -0,0 +1,82 @@
+"""Tests for Instagram extractors on records shaped like real exports."""
+import json
+import sys
+import zipfile
+from collections import Counter
+from unittest.mock import MagicMock
+
+sys.modules["js"] = MagicMock()
+
+import pandas as pd
+import pytest
+import port.platforms.instagram as instagram
+from port.helpers.extraction_helpers import ZipArchiveReader
+
+T = 1612345678
+DATE = pd.Timestamp(T, unit="s", tz="UTC")
+
+FILES = {
+    "followers_1.json": [
+        {
+            "title": "",
+            "media_list_data": [],
+            "string_list_data": [{"href": "https://www.instagram.com/alice", "value": "alice", "timestamp": T}],
+        },
+    ],
+    "following.json": {
+        "relationships_following": [
+            {"title": "bob", "string_list_data": [{"href": "https://www.instagram.com/_u/bob", "timestamp": T}]},
+        ],
+    },
+    "liked_posts.json": {
+        "likes_media_likes": [
+            {"title": "carol", "string_list_data": [{"href": "https://www.instagram.com/p/x/", "value": "â\u009d¤", "timestamp": T}]},
+        ],
+    },
+    "profile_searches.json": {
+        "searches_user": [
+            {
+                "title": "",
+                "media_list_data": [],
+                "string_list_data": [{"href": "https://www.instagram.com/erin", "value": "erin", "timestamp": T}],
+            },
+            {"string_map_data": {"Search": {"value": "frank"}, "Time": {"timestamp": T - 60}}},
+        ],
+    },
+}
+
+
+@pytest.fixture
+def reader(tmp_path):
+    path = tmp_path / "instagram.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in FILES.items():
+            zf.writestr(name, json.dumps(data))
+    with ZipArchiveReader(str(path), list(FILES), Counter()) as reader:
+        yield reader
+
+
+class TestStringListDataRecords:
+    def test_followers(self, reader):
+        errors = Counter()
+        df = instagram.followers_to_df(reader, errors)
+        assert df.values.tolist() == [["alice", "https://www.instagram.com/alice", DATE]]
+        assert not errors
+
+    def test_following(self, reader):
+        df = instagram.following_to_df(reader, Counter())
+        assert df.values.tolist() == [["bob", "https://www.instagram.com/_u/bob", DATE]]
+
+    def test_liked_posts(self, reader):
+        df = instagram.liked_posts_to_df(reader, Counter())
+        assert df.values.tolist() == [["carol", "❤", DATE]]
+
+    def test_profile_searches(self, reader):
+        errors = Counter()
+        df = instagram.profile_searches_to_df(reader, errors)
+        assert df.values.tolist() == [[DATE, "erin"], [DATE - pd.Timedelta(minutes=1), "frank"]]
+        assert not errors
+
+    def test_string_map_data_fallback(self):
+        record = {"title": "", "string_map_data": [{"href": "https://a", "value": "dave", "timestamp": T}]}
+        assert instagram.FOLLOWER_COLUMNS.row(record) == ("dave", "https://a", str(T))
@@ -0,0 +1,37 @@
+"""Tests for the TikTok extractors."""
+import sys
+from collections import Counter
+from unittest.mock import MagicMock
+
+sys.modules["js"] = MagicMock()
+
+import port.platforms.tiktok as tiktok
+
+DATA = {
+    "Your Activity": {
+        "Activity Summary": {"ActivitySummaryMap": {"videoCount": 12, "commentVideoCount": 3}},
+        "Watch History": {"VideoList": [
+            {"Date": "2023-01-01 10:00:00", "Link": "https://t/1"},
+            {"date": "2023-02-01 10:00:00", "link": "https://t/2"},
+        ]},
+        "Share History": {"ShareHistoryList": [{"Date": "2023-01-01 10:00:00", "Method": "copy"}]},
+    },
+}
+
+
+class TestExtractors:
+    def test_rows_and_columns(self):
+        errors = Counter()
+        df = tiktok.watch_history_to_df(DATA, errors)
+        assert df.values.tolist() == [["2023-02-01 10:00:00", "https://t/2"], ["2023-01-01 10:00:00", "https://t/1"]]
+        df = tiktok.share_history_to_df(DATA, errors)
+        assert df.values.tolist() == [["2023-01-01 10:00:00", "", "", "copy"]]
+        df = tiktok.activity_summary_to_df(DATA, errors)
+        assert df.values.tolist() == [["Videos watched since registration", 12], ["Videos commented on since registration", 3]]
+        assert not errors
+
+    def test_missing_section_is_empty_with_columns(self):
+        df = tiktok.comments_to_df({"Comment": {"Comments": {"CommentsList": []}}}, Counter())
+        assert df.empty
+        assert list(df.columns) == ["Date", "Comment", "Photo", "Url"]
+        assert tiktok.hashtag_to_df({}, Counter()).empty
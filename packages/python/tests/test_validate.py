@@ -2,11 +2,13 @@
 import io
 import sys
 import zipfile
+from collections import Counter
 from unittest.mock import MagicMock
 
 sys.modules["js"] = MagicMock()
 
 from port.helpers.validate import ValidateInput, validate_zip, DDPCategory, DDPFiletype, Language, StatusCode
+from port.helpers.extraction_helpers import ZipArchiveReader
 
 
 class TestArchiveMembers:
@@ -87,3 +89,95 @@ class TestFileLikeAcceptance:
         # Detected as the test category, not unknown.
         assert result.current_ddp_category is not None
         assert result.current_ddp_category.id == "test"
+
+
+class TestZipFileHandoff:
+    """validate_zip(keep_open=True) keeps its ZipFile open on success for ZipArchiveReader."""
+
+    @staticmethod
+    def _archive(tmp_path):
+        zip_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("data/following.json", '{"a": 1}')
+            zf.writestr("data/posts.json", '[]')
+        return str(zip_path)
+
+    @staticmethod
+    def _categories(known_files):
+        return [DDPCategory(
+            id="test", ddp_filetype=DDPFiletype.JSON,
+            language=Language.EN, known_files=known_files,
+        )]
+
+    def test_zip_file_kept_on_success(self, tmp_path):
+        result = validate_zip(self._categories(["following.json", "posts.json"]), self._archive(tmp_path), keep_open=True)
+        assert result.get_status_code_id() == 0
+        assert isinstance(result.zip_file, zipfile.ZipFile)
+        assert result.zip_file.fp is not None
+        result.zip_file.close()
+
+    def test_zip_file_not_kept_on_undetected_archive(self, tmp_path):
+        result = validate_zip(self._categories(["other.json"]), self._archive(tmp_path), keep_open=True)
+        assert result.get_status_code_id() == 1
+        assert result.zip_file is None
+
+    def test_zip_file_closed_by_default(self, tmp_path, monkeypatch):
+        opened = []
+        real = zipfile.ZipFile
+
+        def recording(*args, **kwargs):
+            zf = real(*args, **kwargs)
+            opened.append(zf)
+            return zf
+
+        monkeypatch.setattr(zipfile, "ZipFile", recording)
+        result = validate_zip(self._categories(["following.json", "posts.json"]), self._archive(tmp_path))
+        assert result.get_status_code_id() == 0
+        assert result.zip_file is None
+        assert opened[0].fp is None
+
+    def test_close_zip_file_is_idempotent(self, tmp_path):
+        result = validate_zip(self._categories(["following.json", "posts.json"]), self._archive(tmp_path), keep_open=True)
+        zf = result.zip_file
+        result.close_zip_file()
+        result.close_zip_file()
+        assert zf.fp is None
+        assert result.zip_file is None
+
+    def test_zip_file_excluded_from_repr(self, tmp_path):
+        result = validate_zip(self._categories(["following.json", "posts.json"]), self._archive(tmp_path), keep_open=True)
+        assert "ZipFile" not in repr(result)
+        result.zip_file.close()
+
+    def test_central_directory_parsed_once_per_flow(self, tmp_path, monkeypatch):
+        zip_path = self._archive(tmp_path)
+        opened = []
+        real = zipfile.ZipFile
+
+        def counting(*args, **kwargs):
+            zf = real(*args, **kwargs)
+            opened.append(zf)
+            return zf
+
+        monkeypatch.setattr(zipfile, "ZipFile", counting)
+        validation = validate_zip(self._categories(["following.json", "posts.json"]), zip_path, keep_open=True)
+        with ZipArchiveReader(
+            zip_path, validation.archive_members, Counter(),
+            zip_file=validation.zip_file,
+        ) as reader:
+            assert reader.json("following.json").data == {"a": 1}
+            assert reader.json("posts.json").found
+        assert len(opened) == 1
+        assert validation.zip_file.fp is None
+
+    def test_closed_handoff_reopens(self, tmp_path):
+        zip_path = self._archive(tmp_path)
+        validation = validate_zip(self._categories(["following.json", "posts.json"]), zip_path, keep_open=True)
+        validation.zip_file.close()
+        errors = Counter()
+        with ZipArchiveReader(
+            zip_path, validation.archive_members, errors,
+            zip_file=validation.zip_file,
+        ) as reader:
+            assert reader.json("following.json").found
+        assert not errors
@@ -0,0 +1,68 @@
+"""Tests for the WhatsApp chat parser."""
+import sys
+import zipfile
+from unittest.mock import MagicMock
+
+sys.modules["js"] = MagicMock()
+
+import port.platforms.whatsapp as whatsapp
+
+HEAD = "[03/02/2021, 09:47:58] "
+
+
+def write_chat(tmp_path, text: str, zipped: bool = True) -> str:
+    if not zipped:
+        path = tmp_path / "chat.txt"
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+    path = tmp_path / "chat.zip"
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("_chat.txt", text)
+    return str(path)
+
+
+class TestParseChat:
+    def test_messages_and_continuation_lines(self, tmp_path):
+        chat = "\r\n".join([
+            HEAD + "Ann: hello",
+            "second line",
+            "third‎ line",
+            HEAD + "Bob: hi 😀",
+            HEAD + "Ann: bye",
+            "dropped",
+        ])
+        df = whatsapp.parse_chat(write_chat(tmp_path, chat))
+        assert list(df.columns) == ["date", "name", "chat_message"]
+        assert df["name"].tolist() == ["Ann", "Bob", "Ann"]
+        # The last message keeps its first line only, as it always has
+        assert df["chat_message"].tolist() == ["hello second line third line", "hi 😀", "bye"]
+        assert df["date"].nunique() == 1
+
+    def test_leading_lines_before_first_match(self, tmp_path):
+        chat = "\n".join(["header", "notice", HEAD + "Ann: hello", HEAD + "Bob: hi"])
+        df = whatsapp.parse_chat(write_chat(tmp_path, chat, zipped=False))
+        assert df.values.tolist()[0] == ["", "", ""]
+        assert df["chat_message"].tolist()[1:] == ["hello", "hi"]
+
+    def test_single_line_and_unknown_format_are_empty(self, tmp_path):
+        assert whatsapp.parse_chat(write_chat(tmp_path, HEAD + "Ann: hello")).empty
+        assert whatsapp.parse_chat(write_chat(tmp_path, "no\nchat\nhere")).empty
+
+    def test_undecodable_file_is_empty(self, tmp_path):
+        path = tmp_path / "chat.zip"
+        with zipfile.ZipFile(path, "w") as z:
+            z.writestr("_chat.txt", (HEAD + "Ann: hello\n").encode() * 3 + b"\xff\n")
+        assert whatsapp.parse_chat(str(path)).empty
+
+    def test_iter_chat_messages_reads_one_message_ahead(self):
+        regex = whatsapp.COMPILED_REGEXES[1]
+
+        def lines():
+            yield HEAD + "Ann: a"
+            yield "more"
+            yield HEAD + "Bob: b"
+            raise AssertionError("read past the next message")
+
+        messages = whatsapp.iter_chat_messages(lines(), regex)
+        groups, text = next(messages)
+        assert (groups["name"], text) == ("Ann", "a more")
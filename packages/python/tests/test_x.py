@@ -0,0 +1,54 @@
+"""Tests for the X extractors."""
+import json
+import sys
+import zipfile
+from collections import Counter
+from unittest.mock import MagicMock
+
+sys.modules["js"] = MagicMock()
+
+import port.platforms.x as x
+from port.helpers.extraction_helpers import ZipArchiveReader
+
+PERSONALIZATION = [
+    {"p13nData": {"interests": {"interests": [{"name": "cats", "isDisabled": False}]}}},
+    {"p13nData": {"interests": {"interests": [{"name": "never read", "isDisabled": False}]}}},
+]
+
+
+def make_reader(tmp_path, items):
+    path = tmp_path / "x.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("data/personalization.js", "window.YTD.personalization.part0 = " + json.dumps(items))
+    errors = Counter()
+    return ZipArchiveReader(str(path), ["data/personalization.js"], errors), errors
+
+
+class TestPersonalization:
+    def test_first_element_and_stream_closed(self, tmp_path):
+        reader, errors = make_reader(tmp_path, PERSONALIZATION)
+        streams, results = [], []
+        open_member, js_assignment = reader._open_member, reader.js_assignment
+
+        def recording_open(*args, **kwargs):
+            streams.append(open_member(*args, **kwargs))
+            return streams[-1]
+
+        def recording_js_assignment(filename):
+            # Holding the generator keeps garbage collection from closing it
+            results.append(js_assignment(filename))
+            return results[-1]
+
+        reader._open_member = recording_open
+        reader.js_assignment = recording_js_assignment
+        df = x.personalization_to_df(reader, errors)
+        assert df.values.tolist()[0][0] == "cats"
+        assert len(df) == 1
+        assert results[0].data.gi_frame is None
+        assert streams and all(stream.closed for stream in streams)
+        assert not errors
+
+    def test_empty_file_is_not_an_error(self, tmp_path):
+        reader, errors = make_reader(tmp_path, [])
+        assert x.personalization_to_df(reader, errors).empty
+        assert not errors
@@ -1,4 +1,6 @@
 """Tests for ZipArchiveReader — member resolution, extraction, result types."""
+import os
+import re
 import sys
 import io
 import json
@@ -11,7 +13,9 @@ sys.modules["js"] = MagicMock()
 import pytest
 import pandas as pd
 from port.helpers.extraction_helpers import (
+    MemberLimits,
     ZipArchiveReader,
+    ZlibInflater,
     JsonExtractionResult,
     CsvExtractionResult,
     RawExtractionResult,
@@ -110,7 +114,26 @@ class TestJsonExtraction:
         result = reader.json("bad.json")
         assert result.found is True
         assert result.data == {}
-        assert errors["JSONDecodeError"] > 0
+        assert errors["JSONDecodeError"] == 1
+
+    @pytest.mark.parametrize("encoding, expected_metric", [
+        ("utf-8", None),
+        ("utf-8-sig", "JsonEncoding:utf-8-sig"),
+        ("utf-16", "JsonEncoding:utf-16"),
+        ("utf-16-le", "JsonEncoding:utf-16-le"),
+        ("utf-16-be", "JsonEncoding:utf-16-be"),
+        ("utf-32", "JsonEncoding:utf-32"),
+        ("latin-1", "JsonEncoding:latin-1"),
+    ])
+    def test_encoding_sniffed(self, tmp_path, encoding, expected_metric):
+        doc = {"naam": "Zoë", "plaats": "Café"}
+        zip_path = tmp_path / "enc.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("data.json", json.dumps(doc, ensure_ascii=False).encode(encoding))
+        errors = Counter()
+        reader = ZipArchiveReader(str(zip_path), ["data.json"], errors)
+        assert reader.json("data.json").data == doc
+        assert errors == (Counter({expected_metric: 1}) if expected_metric else Counter())
 
 
 class TestCsvExtraction:
@@ -208,3 +231,784 @@ class TestFileLikeAcceptance:
         r1 = reader.json("data/following.json")
         r2 = reader.csv("ratings.csv")
         assert r1.found and r2.found
+
+
+class TestMemberPrefetch:
+    """json_all batches small members into one vectored adapter read."""
+
+    def test_json_all_prefetches_with_read_ranges(self):
+        from port.api.file_utils import AsyncFileAdapter
+
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            for i in range(1, 51):
+                zf.writestr(f"likes/likes_and_reactions_{i}.json", json.dumps([{"n": i}]))
+                zf.writestr(f"media/photo_{i}.jpg", os.urandom(20_000))
+        content = buf.getvalue()
+
+        class FakeJsArray:
+            def __init__(self, data):
+                self._data = data
+
+            def to_py(self):
+                return self._data
+
+        class FakeJsReader:
+            size = len(content)
+            name = "fake.zip"
+            slice_calls = 0
+            vectored_calls = 0
+
+            def readSlice(self, start, end):
+                self.slice_calls += 1
+                return FakeJsArray(content[start:end])
+
+            def readSlices(self, *bounds):
+                self.vectored_calls += 1
+                return FakeJsArray(b"".join(
+                    content[s:e] for s, e in zip(bounds[::2], bounds[1::2])
+                ))
+
+        js_reader = FakeJsReader()
+        adapter = AsyncFileAdapter(js_reader, block_size=4096, max_readahead=0)
+        with zipfile.ZipFile(adapter) as zf:
+            members = zf.namelist()
+        reader = ZipArchiveReader(adapter, members, Counter())
+
+        calls_before = js_reader.slice_calls + js_reader.vectored_calls
+        results = reader.json_all(r"likes_and_reactions_\d+\.json$")
+        calls_after = js_reader.slice_calls + js_reader.vectored_calls
+
+        assert len(results) == 50
+        assert sorted(r.data[0]["n"] for r in results) == list(range(1, 51))
+        assert js_reader.vectored_calls >= 1
+        assert calls_after - calls_before < 10
+
+
+class TestSharedZipFile:
+    def test_archive_opened_once_across_reads(self, sample_zip, monkeypatch):
+        zip_path, members = sample_zip
+        opened = []
+        real = zipfile.ZipFile
+
+        def counting(*args, **kwargs):
+            zf = real(*args, **kwargs)
+            opened.append(zf)
+            return zf
+
+        monkeypatch.setattr(zipfile, "ZipFile", counting)
+        reader = ZipArchiveReader(zip_path, members, Counter())
+        reader.json("data/following.json")
+        reader.csv("ratings.csv")
+        reader.raw("Bookmarks.html")
+        assert len(opened) == 1
+
+    def test_context_manager_closes_and_reopens_lazily(self, sample_zip):
+        zip_path, members = sample_zip
+        with ZipArchiveReader(zip_path, members, Counter()) as reader:
+            assert reader.json("data/following.json").found
+            zf = reader._zip_file
+        assert zf.fp is None
+        assert reader._zip_file is None
+        assert reader.csv("ratings.csv").found
+        reader.close()
+
+    def test_file_like_archive_left_open(self, sample_zip):
+        zip_path, members = sample_zip
+        with open(zip_path, "rb") as f:
+            buf = io.BytesIO(f.read())
+        with ZipArchiveReader(buf, members, Counter()) as reader:
+            assert reader.json("data/following.json").found
+            assert reader.json("post_comments_2.json").data == [{"comment": "two"}]
+        assert not buf.closed
+
+
+class TestMemberIndex:
+    """Indexed lookups must agree with the linear scans they replace."""
+
+    MEMBERS = [
+        "following.json",
+        "data/following.json",
+        "data/nested/following.json",
+        "data/foo_following.json",
+        "your_activity/likes_and_reactions_1.json",
+        "your_activity/likes_and_reactions_2.json",
+        "your_activity/likes_and_reactions_10.JSON",
+        "comments/post_comments.json",
+        "comments/post_comments_1.json",
+        "media/photos/IMG_0001.jpg",
+        "media/photos/IMG_0002.jpg",
+        "media/videos/",
+        "readme",
+        "a/.json",
+        "a/b.tar.gz",
+    ]
+
+    PATTERNS = [
+        r"(^|/)likes_and_reactions_\d+\.json$",
+        r"(^|/)post_comments(?:_\d+)?\.json$",
+        r"(?i)likes_and_reactions_\d+\.json$",
+        r"following\.json$|\.jpg$",
+        r"[|]\.json$",
+        r"\\.json$",
+        r".json$",
+        r"\.gz$",
+        r"photos/",
+        r"^readme$",
+    ]
+
+    @staticmethod
+    def _scan_resolve(members, filename):
+        if filename in members:
+            return [filename]
+        return [m for m in members if m.endswith("/" + filename)]
+
+    def test_resolve_matches_linear_scan(self):
+        names = [
+            "following.json", "nested/following.json", "foo_following.json",
+            "post_comments.json", "IMG_0001.jpg", "photos/IMG_0002.jpg",
+            "videos/", "missing.json", "likes_and_reactions_10.JSON", ".json",
+        ]
+        for name in names:
+            errors = Counter()
+            reader = ZipArchiveReader("unused.zip", self.MEMBERS, errors)
+            expected = self._scan_resolve(self.MEMBERS, name)
+            resolved = reader.resolve_member(name)
+            if len(expected) == 1:
+                assert resolved == expected[0], name
+            else:
+                assert resolved is None, name
+            assert errors["AmbiguousMemberMatch"] == (1 if len(expected) > 1 else 0), name
+
+    def test_search_matches_linear_scan(self):
+        reader = ZipArchiveReader("unused.zip", self.MEMBERS, Counter())
+        for pattern in self.PATTERNS:
+            expected = sorted(m for m in self.MEMBERS if re.search(pattern, m))
+            assert reader._members().search(pattern) == expected, pattern
+
+    def test_search_result_is_a_copy(self):
+        reader = ZipArchiveReader("unused.zip", self.MEMBERS, Counter())
+        first = reader._members().search(r"\.jpg$")
+        first.clear()
+        assert len(reader._members().search(r"\.jpg$")) == 2
+
+    def test_extension_pattern_visits_only_its_bucket(self):
+        members = [f"media/{i}.jpg" for i in range(1000)] + ["data/posts_1.json"]
+        reader = ZipArchiveReader("unused.zip", members, Counter())
+        index = reader._members()
+        index.members = []  # a full scan would now find nothing
+        assert index.search(r"(^|/)posts_\d+\.json$") == ["data/posts_1.json"]
+
+
+class TestOpen:
+    def test_found_streams_member(self, sample_zip):
+        zip_path, members = sample_zip
+        with ZipArchiveReader(zip_path, members, Counter()) as reader:
+            with reader.open("ratings.csv") as result:
+                assert result.found
+                assert result.member_path == "ratings.csv"
+                assert isinstance(result.data, zipfile.ZipExtFile)
+                assert result.data.read(5) == b"Title"
+                assert result.data.read() == b",Rating\nMovie A,5\nMovie B,3\n"
+            assert result.data.closed
+
+    def test_not_found(self, sample_zip):
+        zip_path, members = sample_zip
+        reader = ZipArchiveReader(zip_path, members, Counter())
+        with reader.open("nope.html") as result:
+            assert not result.found
+            assert result.data.read() == b""
+
+    def test_open_error_counted(self, sample_zip):
+        zip_path, members = sample_zip
+        errors = Counter()
+        reader = ZipArchiveReader(zip_path, members + ["ghost.txt"], errors)
+        with reader.open("ghost.txt") as result:
+            assert result.found
+            assert result.data.read() == b""
+        assert errors["KeyError"] == 1
+
+    def test_csv_empty_member(self, tmp_path):
+        zip_path = tmp_path / "empty.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("empty.csv", "")
+        reader = ZipArchiveReader(str(zip_path), ["empty.csv"], Counter())
+        result = reader.csv("empty.csv")
+        assert result.found
+        assert result.data.empty
+
+
+class TestStreamingConsumers:
+    def test_strip_notes_across_chunk_boundary(self, monkeypatch):
+        from port.helpers import extraction_helpers as eh
+        from port.platforms.linkedin import strip_notes
+
+        monkeypatch.setattr(eh, "STREAM_CHUNK_SIZE", 4)
+        for notes in (b"", b"Notes:\n", b"Notes: x\nmore\n", b"abc\n"):
+            data = notes + b"\nName,URL\na,b\n" if notes else b"Name,URL\na,b\n"
+            stripped = strip_notes(io.BytesIO(data)).read()
+            assert stripped == b"Name,URL\na,b\n", notes
+
+    def test_bookmarks_parsed_in_chunks(self, tmp_path, monkeypatch):
+        from port.helpers import extraction_helpers as eh
+        from port.platforms.chrome import bookmarks_to_df
+
+        html = (
+            "<DL><DT><A HREF='https://a.example'>First bookmark title</A>"
+            "<DT><A HREF='https://b.example'>Café &amp; more</A></DL>"
+        )
+        zip_path = tmp_path / "chrome.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("Takeout/Chrome/Bookmarks.html", html)
+        monkeypatch.setattr(eh, "STREAM_CHUNK_SIZE", 7)
+        errors = Counter()
+        reader = ZipArchiveReader(str(zip_path), ["Takeout/Chrome/Bookmarks.html"], errors)
+        df = bookmarks_to_df(reader, errors)
+        assert df.values.tolist() == [
+            ["First bookmark title", "https://a.example"],
+            ["Café & more", "https://b.example"],
+        ]
+        assert not errors
+
+
+class TestIterJson:
+    DOCS = [
+        [],
+        [1, 22, 333, -4.5e10, 1.5e-07, True, False, None],
+        [{"title": "a", "time": "2024-01-01T00:00:00Z"}, {"title": "b\u00e9\\\"", "nested": [[], {}]}],
+        ["x" * 100, "\u2603 snowman", "esc \\u00e9 \n \t"],
+    ]
+
+    @staticmethod
+    def _items(text, path=(), chunk_size=3):
+        from port.helpers.extraction_helpers import _JsonArrayReader
+        stream = io.BytesIO(text.encode("utf-8"))
+        return list(_JsonArrayReader(stream, chunk_size=chunk_size).items(path))
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+    def test_matches_json_loads(self, chunk_size):
+        for doc in self.DOCS:
+            for text in (json.dumps(doc), json.dumps(doc, indent=2)):
+                assert self._items(text, chunk_size=chunk_size) == doc
+
+    def test_number_split_across_chunks(self):
+        assert self._items("[123456789, 9876]", chunk_size=2) == [123456789, 9876]
+
+    def test_key_path(self):
+        text = json.dumps({
+            "meta": {"skip": [1, 2, {"deep": "x"}]},
+            "Browser History": [{"url": "a"}, {"url": "b"}],
+            "after": 1,
+        })
+        assert self._items(text, ("Browser History",)) == [{"url": "a"}, {"url": "b"}]
+        nested = json.dumps({"a": {"b": [1, 2]}})
+        assert self._items(nested, ("a", "b")) == [1, 2]
+
+    def test_missing_key_or_non_array_yields_nothing(self):
+        assert self._items('{"a": [1]}', ("b",)) == []
+        assert self._items('{"a": {"x": 1}}', ("a",)) == []
+        assert self._items('{}', ("a",)) == []
+
+    def test_array_reached_before_path_is_iterated(self):
+        assert self._items('[{"a": 1}]', ("wrapper",)) == [{"a": 1}]
+
+    def test_bom_accepted(self):
+        from port.helpers.extraction_helpers import _JsonArrayReader
+        stream = io.BytesIO(b"\xef\xbb\xbf[1, 2]")
+        assert list(_JsonArrayReader(stream, chunk_size=2).items(())) == [1, 2]
+
+    def test_reader_iter_json(self, tmp_path):
+        zip_path = tmp_path / "yt.zip"
+        history = [{"title": f"video {i}", "time": "2024-01-01T00:00:00Z"} for i in range(500)]
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("Takeout/YouTube/history/watch-history.json", json.dumps(history))
+            zf.writestr("Takeout/Chrome/History.json", json.dumps({"Browser History": history[:3]}))
+        members = ["Takeout/YouTube/history/watch-history.json", "Takeout/Chrome/History.json"]
+        errors = Counter()
+        reader = ZipArchiveReader(str(zip_path), members, errors)
+
+        result = reader.iter_json("watch-history.json")
+        assert result.found
+        assert result.member_path == members[0]
+        assert list(result.data) == history
+
+        assert list(reader.iter_json("History.json", path="Browser History").data) == history[:3]
+        missing = reader.iter_json("nope.json")
+        assert not missing.found and list(missing.data) == []
+        assert not errors
+
+    def test_malformed_counts_error_and_keeps_prefix(self, tmp_path):
+        zip_path = tmp_path / "bad.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("bad.json", '[{"a": 1}, {"a": 2}, {"a": oops}]')
+        errors = Counter()
+        reader = ZipArchiveReader(str(zip_path), ["bad.json"], errors)
+        assert list(reader.iter_json("bad.json").data) == [{"a": 1}, {"a": 2}]
+        assert errors["JSONDecodeError"] == 1
+
+
+class TestJsAssignment:
+    """X exports: `window.YTD.<name>.part0 = [...]` members."""
+
+    @pytest.fixture
+    def x_zip(self, tmp_path):
+        tweets = [{"tweet": {"created_at": f"day {i}", "full_text": f"tweet {i} = é", "retweeted": False}} for i in range(500)]
+        zip_path = tmp_path / "x.zip"
+        members = {
+            "data/tweets.js": "window.YTD.tweets.part0 = " + json.dumps(tweets, indent=2),
+            "data/block.js": "\ufeffwindow.YTD.block.part0 = []",
+            "data/mute.js": "",
+            "data/like.js": "window.YTD.like.part0 = [{\"like\": {\"tweetId\": \"1\"}}, {oops}]",
+            "data/plain.js": json.dumps([{"a": 1}]),
+            "data/nothing.js": "no assignment here",
+        }
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, text in members.items():
+                zf.writestr(name, text.encode("utf-8"))
+        return str(zip_path), list(members), tweets
+
+    def test_streams_array_elements(self, x_zip, monkeypatch):
+        from port.helpers import extraction_helpers as eh
+        monkeypatch.setattr(eh, "STREAM_CHUNK_SIZE", 64)
+        zip_path, members, tweets = x_zip
+        errors = Counter()
+        reader = ZipArchiveReader(zip_path, members, errors)
+        assert list(reader.js_assignment("tweets.js").data) == tweets
+        assert list(reader.js_assignment("block.js").data) == []
+        assert list(reader.js_assignment("mute.js").data) == []
+        assert list(reader.js_assignment("plain.js").data) == [{"a": 1}]
+        missing = reader.js_assignment("account.js")
+        assert not missing.found and list(missing.data) == []
+        assert not errors
+
+    def test_malformed_counts_error_and_keeps_prefix(self, x_zip):
+        zip_path, members, _ = x_zip
+        errors = Counter()
+        reader = ZipArchiveReader(zip_path, members, errors)
+        assert list(reader.js_assignment("like.js").data) == [{"like": {"tweetId": "1"}}]
+        assert list(reader.js_assignment("nothing.js").data) == []
+        assert errors == Counter({"JSONDecodeError": 2})
+
+    def test_x_extractors(self, x_zip):
+        from port.platforms.x import bytesio_to_listdict, tweets_to_df
+        zip_path, members, tweets = x_zip
+        errors = Counter()
+        reader = ZipArchiveReader(zip_path, members, errors)
+        df = tweets_to_df(reader, errors)
+        assert len(df) == 500
+        assert df.iloc[3].tolist() == ["day 3", "tweet 3 = é", "False"]
+        with reader.open("tweets.js") as result:
+            assert bytesio_to_listdict(result.data) == tweets
+
+
+class TestParsedCache:
+    def test_repeated_json_parsed_once(self, sample_zip, monkeypatch):
+        import port.helpers.extraction_helpers as eh
+
+        zip_path, members = sample_zip
+        parses = []
+        real = eh._read_json
+        monkeypatch.setattr(eh, "_read_json", lambda *a, **k: parses.append(1) or real(*a, **k))
+        reader = ZipArchiveReader(zip_path, members, Counter())
+        first = reader.json("data/following.json")
+        second = reader.json("data/following.json")
+        assert first.data is second.data
+        assert len(parses) == 1
+        assert (reader.parsed_cache.hits, reader.parsed_cache.misses) == (1, 1)
+
+    def test_json_all_shares_entries_with_json(self, sample_zip):
+        zip_path, members = sample_zip
+        reader = ZipArchiveReader(zip_path, members, Counter())
+        one = reader.json("post_comments_1.json")
+        pages = reader.json_all(r"post_comments_\d+\.json$")
+        assert pages[0].data is one.data
+        assert reader.parsed_cache.hits == 1
+
+    def test_csv_cached_by_kind(self, sample_zip):
+        zip_path, members = sample_zip
+        reader = ZipArchiveReader(zip_path, members, Counter())
+        df = reader.csv("ratings.csv").data
+        assert reader.csv("ratings.csv").data.equals(df)
+        raw = reader.json("ratings.csv")  # same member, different parser
+        assert raw.data is not df
+        assert reader.parsed_cache.hits == 1
+
+    def test_csv_hands_out_copies(self, sample_zip):
+        zip_path, members = sample_zip
+        reader = ZipArchiveReader(zip_path, members, Counter())
+        df = reader.csv("ratings.csv").data
+        df.loc[0, "Title"] = "changed"
+        df.drop(columns="Rating", inplace=True)
+        again = reader.csv("ratings.csv").data
+        assert reader.parsed_cache.hits == 1
+        assert again.values.tolist() == [["Movie A", "5"], ["Movie B", "3"]]
+
+    def test_lru_eviction_within_budget(self, tmp_path):
+        zip_path = tmp_path / "pages.zip"
+        names = [f"page_{i}.json" for i in range(3)]
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for name in names:
+                zf.writestr(name, json.dumps(["x" * 90]))  # 94 bytes each
+        reader = ZipArchiveReader(str(zip_path), names, Counter(), cache_bytes=250)
+        a = reader.json("page_0.json").data
+        reader.json("page_1.json")
+        reader.json("page_0.json")          # page_0 most recent
+        reader.json("page_2.json")          # evicts page_1
+        assert reader.json("page_0.json").data is a
+        hits = reader.parsed_cache.hits
+        reader.json("page_1.json")
+        assert reader.parsed_cache.hits == hits
+
+    def test_oversized_and_disabled(self, sample_zip):
+        zip_path, members = sample_zip
+        reader = ZipArchiveReader(zip_path, members, Counter(), cache_bytes=0)
+        assert reader.json("data/following.json").data is not reader.json("data/following.json").data
+        assert reader.parsed_cache.hits == 0
+
+    def test_errors_counted_once_and_close_clears(self, tmp_path):
+        zip_path = tmp_path / "bad.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("bad.json", "{not json")
+        errors = Counter()
+        with ZipArchiveReader(str(zip_path), ["bad.json"], errors) as reader:
+            reader.json("bad.json")
+            counted = sum(errors.values())
+            reader.json("bad.json")
+            assert sum(errors.values()) == counted
+        assert reader.parsed_cache.get(("bad.json", "json")) is None
+
+
+class TestBatchReads:
+    @staticmethod
+    def _reader(tmp_path, errors=None):
+        zip_path = tmp_path / "batch.zip"
+        names = [f"dir/file_{i}.json" for i in range(5)]
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for i, name in enumerate(names):
+                zf.writestr(name, json.dumps({"i": i}))
+        return ZipArchiveReader(str(zip_path), names, errors if errors is not None else Counter()), names
+
+    def test_json_many_reads_in_offset_order(self, tmp_path):
+        reader, names = self._reader(tmp_path)
+        order = []
+        real = reader._read_member_bytes
+        reader._read_member_bytes = lambda m: order.append(m) or real(m)
+
+        requested = ["file_4.json", "file_1.json", "missing.json", "file_3.json"]
+        results = reader.json_many(requested)
+
+        assert order == ["dir/file_1.json", "dir/file_3.json", "dir/file_4.json"]
+        assert list(results) == requested
+        assert results["file_4.json"].data == {"i": 4}
+        assert results["file_4.json"].member_path == "dir/file_4.json"
+        assert not results["missing.json"].found
+        assert results["missing.json"].data == {}
+
+    def test_json_all_reads_in_offset_order_returns_sorted(self, tmp_path):
+        zip_path = tmp_path / "pages.zip"
+        names = ["p_2.json", "p_10.json", "p_1.json"]
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for name in names:
+                zf.writestr(name, json.dumps([name]))
+        reader = ZipArchiveReader(str(zip_path), names, Counter())
+        order = []
+        real = reader._read_member_bytes
+        reader._read_member_bytes = lambda m: order.append(m) or real(m)
+
+        results = reader.json_all(r"p_\d+\.json$")
+        assert order == names
+        assert [r.member_path for r in results] == sorted(names)
+
+    def test_read_many_independent_buffers(self, tmp_path):
+        reader, names = self._reader(tmp_path)
+        results = reader.read_many(["file_2.json", "dir/file_2.json", "nope.json"])
+        assert results["file_2.json"].data.read() == b'{"i": 2}'
+        assert results["dir/file_2.json"].data.read() == b'{"i": 2}'
+        assert not results["nope.json"].found
+
+    def test_ambiguous_names_counted(self, sample_zip):
+        zip_path, members = sample_zip
+        errors = Counter()
+        reader = ZipArchiveReader(zip_path, members, errors)
+        results = reader.json_many(["following.json", "nested/following.json"])
+        assert results["following.json"].found is False
+        assert results["nested/following.json"].found
+        assert errors["AmbiguousMemberMatch"] == 1
+
+
+class TestMemberAdmission:
+    @pytest.fixture
+    def archive(self, tmp_path):
+        zip_path = tmp_path / "sizes.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("secret_contact/big.json", json.dumps(["y" * 5000]))
+            zf.writestr("bomb.json", b"[" + b"0," * (1024 * 1024) + b"0]")
+            zf.writestr("small_zeros.json", b"[" + b"0," * 1000 + b"0]")
+            zf.writestr("rows.csv", "a,b\n" + "1,2\n" * 2000)
+        members = ["secret_contact/big.json", "bomb.json", "small_zeros.json", "rows.csv"]
+        return str(zip_path), members
+
+    def test_over_materialize_limit_is_streamed(self, archive):
+        zip_path, members = archive
+        errors = Counter()
+        reader = ZipArchiveReader(zip_path, members, errors, limits=MemberLimits(max_materialize_bytes=1000))
+        assert reader.json("big.json", backend="stdlib").data == ["y" * 5000]
+        assert reader.json_stats["stream"].calls == 1
+        assert reader.raw("big.json").data.getvalue() == json.dumps(["y" * 5000]).encode()
+        assert len(reader.csv("rows.csv").data) == 2000
+        assert list(reader.iter_json("big.json").data) == ["y" * 5000]
+        assert not errors
+
+    def test_member_just_over_materialize_limit_produces_rows(self, archive):
+        zip_path, members = archive
+        errors = Counter()
+        size = len(json.dumps(["y" * 5000]))
+        reader = ZipArchiveReader(zip_path, members, errors, limits=MemberLimits(max_materialize_bytes=size - 1))
+        assert reader.json("big.json").data == ["y" * 5000]
+        assert not errors
+
+    def test_stream_limit_refuses_streams(self, archive):
+        zip_path, members = archive
+        errors = Counter()
+        limits = MemberLimits(max_materialize_bytes=1000, max_stream_bytes=1000)
+        reader = ZipArchiveReader(zip_path, members, errors, limits=limits)
+        with reader.open("big.json") as result:
+            assert result.found
+            assert result.data.read() == b""
+        assert reader.json("big.json").data == {}
+        assert errors["MemberTooLarge"] == 2
+
+    def test_compression_ratio_refused_above_floor(self, archive):
+        zip_path, members = archive
+        errors = Counter()
+        limits = MemberLimits(max_compression_ratio=200.0, min_ratio_check_bytes=1024 * 1024)
+        reader = ZipArchiveReader(zip_path, members, errors, limits=limits)
+        assert reader.json("bomb.json").data == {}
+        assert list(reader.iter_json("bomb.json").data) == []
+        assert errors["CompressionRatioExceeded"] == 2
+        # Below min_ratio_check_bytes the same ratio is fine.
+        assert len(reader.json("small_zeros.json").data) == 1001
+        assert errors["CompressionRatioExceeded"] == 2
+
+    def test_default_limits_admit_ordinary_members(self, archive):
+        zip_path, members = archive
+        errors = Counter()
+        reader = ZipArchiveReader(zip_path, members, errors)
+        assert reader.json("big.json").data == ["y" * 5000]
+        assert len(reader.csv("rows.csv").data) == 2000
+        # Highly repetitive, but far from bomb-level
+        assert len(reader.json("bomb.json").data) == 1024 * 1024 + 1
+        assert not errors
+
+    def test_refusal_log_omits_member_path(self, archive, caplog):
+        zip_path, members = archive
+        reader = ZipArchiveReader(zip_path, members, Counter(), limits=MemberLimits(max_stream_bytes=10))
+        with caplog.at_level("WARNING"):
+            reader.json("big.json")
+        assert "Refused zip member" in caplog.text
+        assert "secret_contact" not in caplog.text
+
+
+def _js_local_inflater():
+    from port.api.file_utils import LocalRawInflater
+    from port.helpers.extraction_helpers import JsInflater
+    return JsInflater(LocalRawInflater())
+
+
+class TestDecompressionBackends:
+    """Every deflate backend must produce what zipfile's zlib produces."""
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        zip_path = tmp_path / "mixed.zip"
+        rows = "Title,Rating\n" + "".join(f"Movie {i},{i % 5}\n" for i in range(20_000))
+        history = [{"title": f"video {i}", "n": i} for i in range(5_000)]
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("ratings.csv", rows)
+            zf.writestr("history.json", json.dumps(history))
+            zf.writestr("noise.bin", os.urandom(300_000))
+            zf.writestr("empty.json", "")
+            zf.writestr("stored.json", json.dumps({"stored": True}), compress_type=zipfile.ZIP_STORED)
+        members = ["ratings.csv", "history.json", "noise.bin", "empty.json", "stored.json"]
+        return str(zip_path), members
+
+    @pytest.mark.parametrize("backend", [ZlibInflater, _js_local_inflater], ids=["zlib", "js-local"])
+    def test_conformance(self, archive, backend):
+        zip_path, members = archive
+        reference = ZipArchiveReader(zip_path, members, Counter(), cache_bytes=0)
+        errors = Counter()
+        reader = ZipArchiveReader(zip_path, members, errors, cache_bytes=0, decompressor=backend)
+
+        for name in members:
+            assert reader.raw(name).data.getvalue() == reference.raw(name).data.getvalue(), name
+            with reader.open(name) as a, reference.open(name) as b:
+                assert a.data.read() == b.data.read(), name
+        assert reader.json("history.json").data == reference.json("history.json").data
+        assert list(reader.iter_json("history.json").data) == reference.json("history.json").data
+        assert reader.csv("ratings.csv").data.equals(reference.csv("ratings.csv").data)
+        assert reader.json("empty.json").data == {}
+        assert not errors
+
+    def test_stream_seek(self, archive):
+        zip_path, members = archive
+        reader = ZipArchiveReader(zip_path, members, Counter(), decompressor=ZlibInflater)
+        expected = ZipArchiveReader(zip_path, members, Counter()).raw("noise.bin").data.getvalue()
+        with reader.open("noise.bin") as result:
+            f = result.data
+            assert f.seek(200_000) == 200_000
+            assert f.read(10) == expected[200_000:200_010]
+            f.seek(5)
+            assert f.read(10) == expected[5:15]
+            f.seek(-3, io.SEEK_END)
+            assert f.read() == expected[-3:]
+
+    def test_strip_notes_on_backend_stream(self, tmp_path):
+        from port.platforms.linkedin import strip_notes
+        zip_path = tmp_path / "li.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("Connections.csv", "Notes:\nabout the export\n\nFirst Name,Last Name\nA,B\n")
+        reader = ZipArchiveReader(str(zip_path), ["Connections.csv"], Counter(), decompressor=_js_local_inflater)
+        with reader.open("Connections.csv") as result:
+            assert strip_notes(result.data).read() == b"First Name,Last Name\nA,B\n"
+
+    def test_corrupt_crc_counted(self, tmp_path):
+        zip_path = tmp_path / "crc.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("a.json", json.dumps({"a": "x" * 1000}))
+        data = bytearray(zip_path.read_bytes())
+        info = zipfile.ZipFile(zip_path).getinfo("a.json")
+        # Flip the CRC in the central directory entry.
+        cd_crc = data.rfind(b"PK\x01\x02") + 16
+        data[cd_crc] ^= 0xFF
+        buf = io.BytesIO(bytes(data))
+        errors = Counter()
+        reader = ZipArchiveReader(buf, ["a.json"], errors, decompressor=ZlibInflater)
+        assert reader.raw("a.json").data.getvalue() == b""
+        assert errors["BadZipFile"] == 1
+        assert info.CRC != zipfile.ZipFile(buf).getinfo("a.json").CRC
+
+    def test_backend_over_async_file_adapter(self, archive):
+        from port.api.file_utils import AsyncFileAdapter, LocalFileReader
+        zip_path, members = archive
+        expected = ZipArchiveReader(zip_path, members, Counter()).json("history.json").data
+        with LocalFileReader(zip_path) as js_reader:
+            adapter = AsyncFileAdapter(js_reader)
+            reader = ZipArchiveReader(adapter, members, Counter(), decompressor=_js_local_inflater)
+            assert reader.json("history.json").data == expected
+
+    def test_inflater_is_abstract(self):
+        from port.helpers.extraction_helpers import Inflater, JsInflater
+
+        class Partial(Inflater):
+            def decompress(self, data: bytes) -> bytes:
+                return data
+
+        with pytest.raises(TypeError):
+            Inflater()
+        with pytest.raises(TypeError):
+            Partial()
+        # No worker-provided default: the JS-side object must be passed in
+        with pytest.raises(TypeError):
+            JsInflater()
+
+
+class TestJsonBackends:
+    """Every JSON backend must produce what the stdlib backend produces."""
+
+    DOCUMENTS = {
+        "object.json": json.dumps({"a": [1, 2.5, -3e2], "b": {"c": None, "d": True}, "é": "ü"}),
+        "array.json": json.dumps([{"title": f"video {i}", "n": i} for i in range(3_000)]),
+        "empty_array.json": "[]",
+        "empty_object.json": " { } ",
+        "bom.json": "﻿" + json.dumps({"bom": [1]}),
+        "empty.json": "",
+    }
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        zip_path = tmp_path / "json.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, text in self.DOCUMENTS.items():
+                zf.writestr(name, text.encode("utf-8"))
+            zf.writestr("broken.json", '{"a": [1, 2}')
+            zf.writestr("trailing.json", '{"a": 1} {"b": 2}')
+        return str(zip_path), [*self.DOCUMENTS, "broken.json", "trailing.json"]
+
+    @staticmethod
+    def _reader(archive, errors, **kwargs):
+        from port.api.file_utils import LocalJsonHost
+        zip_path, members = archive
+        return ZipArchiveReader(zip_path, members, errors, cache_bytes=0, json_host=LocalJsonHost(), **kwargs)
+
+    @pytest.mark.parametrize("backend", ["stdlib", "host", "stream"])
+    def test_conformance(self, archive, backend):
+        reference_errors = Counter()
+        reference = self._reader(archive, reference_errors)
+        errors = Counter()
+        reader = self._reader(archive, errors, json_backend=backend)
+        for name in self.DOCUMENTS:
+            assert reader.json(name).data == reference.json(name).data, name
+        # The BOM member is recorded as a detected encoding, on every backend.
+        assert errors == reference_errors == Counter({"JsonEncoding:utf-8-sig": 1})
+
+    @pytest.mark.parametrize("backend", ["stdlib", "host", "stream"])
+    def test_malformed_counted_like_stdlib(self, archive, backend):
+        reference_errors = Counter()
+        reference = self._reader(archive, reference_errors)
+        errors = Counter()
+        reader = self._reader(archive, errors, json_backend=backend)
+        for name in ("broken.json", "trailing.json"):
+            assert reader.json(name).data == reference.json(name).data == {}
+        assert errors == reference_errors
+
+    def test_per_call_override_and_stats(self, archive):
+        errors = Counter()
+        reader = self._reader(archive, errors)
+        reader.json("object.json")
+        reader.json("array.json", backend="stream")
+        reader.json_many(["bom.json", "empty_array.json"], backend="host")
+
+        assert set(reader.json_stats) == {"stdlib", "stream", "host"}
+        assert reader.json_stats["host"].calls == 2
+        assert reader.json_stats["stream"].bytes == len(self.DOCUMENTS["array.json"])
+        assert all(stats.seconds >= 0 for stats in reader.json_stats.values())
+        assert reader.json_host.calls == 2
+
+    def test_size_policy(self, archive):
+        from port.helpers.extraction_helpers import JsonBackendBySize
+        policy = JsonBackendBySize(host_min_bytes=50, stream_min_bytes=10_000)
+        assert [policy(0), policy(50), policy(10_000)] == ["stdlib", "host", "stream"]
+        capped = JsonBackendBySize(host_min_bytes=50, host_max_bytes=100)
+        assert [capped(50), capped(99), capped(100)] == ["host", "host", "stream"]
+
+        reader = self._reader(archive, Counter(), json_backend=policy)
+        reader.json("empty_array.json")
+        reader.json("object.json")
+        reader.json("array.json")
+        assert {name: stats.calls for name, stats in reader.json_stats.items()} == {
+            "stdlib": 1, "host": 1, "stream": 1,
+        }
+
+    def test_unknown_backend_rejected(self, archive):
+        reader = self._reader(archive, Counter())
+        with pytest.raises(ValueError):
+            reader.json("object.json", backend="simdjson")
+
+    def test_stream_backend_refuses_member_over_stream_limit(self, archive):
+        errors = Counter()
+        reader = self._reader(
+            archive, errors, json_backend="stream",
+            limits=MemberLimits(max_stream_bytes=100),
+        )
+        assert reader.json("array.json").data == {}
+        assert errors == Counter({"MemberTooLarge": 1})
+
+    def test_stream_backend_small_chunks(self):
+        from port.helpers.extraction_helpers import _json_reader_stream, _JsonArrayReader
+        doc = {"numbers": [-45000000000.5, 1e-7, 12345678901234567890], "text": "a\\u00e9b" * 5, "k": {}}
+        data = json.dumps(doc).encode()
+        stream = io.BytesIO(data)
+        reader = _JsonArrayReader(stream, chunk_size=7, encoding="utf8")
+        assert reader.document() == doc
+        assert not stream.closed
+        assert _json_reader_stream(stream, "utf8") == doc